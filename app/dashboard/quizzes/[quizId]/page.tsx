@@ -64,6 +64,7 @@ export default function QuizPage() {
         }
 
         const response = await fetch(`http://localhost:8000/api/quizzes/${quizId}`, {
+          credentials: "include", // Sends the write watermark cookie, so reads after a write skip a lagging replica
           headers: {
             Authorization: `Bearer ${token}`,
           },
@@ -121,6 +122,7 @@ export default function QuizPage() {
           // Start a new attempt if not completed
           if (data.status !== "in-progress") {
             await fetch(`http://localhost:8000/api/quizzes/${quizId}/attempt`, {
+              credentials: "include",
               method: "POST",
               headers: {
                 "Authorization": `Bearer ${token}`,
@@ -212,6 +214,7 @@ export default function QuizPage() {
         ?.split("=")[1];
 
       await fetch(`http://localhost:8000/api/quizzes/${quizId}/attempt`, {
+        credentials: "include",
         method: "POST",
         headers: {
           "Authorization": `Bearer ${token}`,
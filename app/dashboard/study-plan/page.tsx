@@ -71,6 +71,7 @@ export default function StudyPlanPage() {
 
       try {
         const response = await fetch('http://localhost:8000/api/study-plan/topics', {
+          credentials: 'include', // Sends the write watermark cookie, so reads after a write skip a lagging replica
           headers: {
             'Authorization': `Bearer ${token}`,
           },
@@ -96,6 +97,7 @@ export default function StudyPlanPage() {
 
     try {
       const response = await fetch('http://localhost:8000/api/study-plan/topics', {
+        credentials: 'include',
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
@@ -134,6 +136,7 @@ export default function StudyPlanPage() {
 
     try {
       const response = await fetch(`http://localhost:8000/api/study-plan/sessions?topic_id=${selectedTopic.id}`, {
+        credentials: 'include',
         method: "POST",
         headers: {
           "Content-Type": "application/json",
@@ -0,0 +1,47 @@
+"""per-user access pattern indexes
+
+Composite indexes for the filters the routes actually issue. users.email needs no
+new index: its UNIQUE constraint is already backed by one.
+
+On Postgres the indexes are built CONCURRENTLY so large tables stay writable
+while the migration runs.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 12:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, Sequence[str], None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ('ix_quiz_attempts_user_id_quiz_id', 'quiz_attempts', ['user_id', 'quiz_id']),
+    ('ix_quizzes_user_id_title', 'quizzes', ['user_id', 'title']),
+    ('ix_study_sessions_user_id_date_start_time', 'study_sessions', ['user_id', 'date', 'start_time']),
+    ('ix_study_sessions_topic_id', 'study_sessions', ['topic_id']),
+    ('ix_study_topics_user_id', 'study_topics', ['user_id']),
+    ('ix_ai_interactions_user_id_created_at', 'ai_interactions', ['user_id', 'created_at']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, if_not_exists=True, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=True)
@@ -0,0 +1,38 @@
+"""spaced repetition state
+
+Per-topic memory state (ease factor, last interval, successful review streak) and
+a per-user revision interval modifier, used by app.ml.scheduler. Server defaults
+fill existing rows, so the columns are added without a table rewrite on Postgres 11+.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 14:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, Sequence[str], None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('study_topics', sa.Column('ease_factor', sa.Float(), server_default='2.5', nullable=False))
+    op.add_column('study_topics', sa.Column('review_interval_days', sa.Float(), server_default='0', nullable=False))
+    op.add_column('study_topics', sa.Column('review_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('users', sa.Column('revision_interval_modifier', sa.Float(), server_default='1.0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'revision_interval_modifier')
+    op.drop_column('study_topics', 'review_count')
+    op.drop_column('study_topics', 'review_interval_days')
+    op.drop_column('study_topics', 'ease_factor')
@@ -0,0 +1,40 @@
+"""due revisions index
+
+Index study_topics on (user_id, next_revision) for the due-for-revision queue and
+the nightly reminder scan. It also serves every lookup by user_id alone, so the
+single-column ix_study_topics_user_id is dropped once the new index exists.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 15:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, Sequence[str], None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index('ix_study_topics_user_id_next_revision', 'study_topics', ['user_id', 'next_revision'],
+                        if_not_exists=True, postgresql_concurrently=True)
+        op.drop_index('ix_study_topics_user_id', table_name='study_topics', if_exists=True,
+                      postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index('ix_study_topics_user_id', 'study_topics', ['user_id'],
+                        if_not_exists=True, postgresql_concurrently=True)
+        op.drop_index('ix_study_topics_user_id_next_revision', table_name='study_topics', if_exists=True,
+                      postgresql_concurrently=True)
@@ -0,0 +1,43 @@
+"""listing pagination indexes
+
+Indexes for keyset pagination and the server-side filters of the topic and session
+listings. Topics page by (created_at, id) within a user; sessions filtered by
+subject page by (date, start_time, id). Unfiltered, date-range and completed
+session queries use ix_study_sessions_user_id_date_start_time, and topic_id
+filters use ix_study_sessions_topic_id.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 16:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, Sequence[str], None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ('ix_study_topics_user_id_created_at', 'study_topics', ['user_id', 'created_at']),
+    ('ix_study_sessions_user_id_subject_date_start_time', 'study_sessions', ['user_id', 'subject', 'date', 'start_time']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, if_not_exists=True, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=True)
@@ -0,0 +1,65 @@
+"""study session overlap constraint
+
+Rejects overlapping sessions of one user in the database: a GiST exclusion
+constraint over (user_id, session time range). The range is computed from
+date/start_time/end_time, so no column is added; sessions that end before they
+start run past midnight, and sessions without a date or times are not checked.
+btree_gist supplies the equality operator class for user_id.
+
+The application checks for overlaps before writing; this constraint catches the
+concurrent writes that pass that check together. Building it locks study_sessions
+against writes (exclusion constraints cannot be built CONCURRENTLY), and it fails
+if existing sessions already overlap, so the upgrade counts them first.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 18:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, Sequence[str], None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CONSTRAINT = 'ex_study_sessions_user_id_time_range'
+
+
+def time_range(alias: str = "") -> str:
+    """The session's [start, end) as a tsrange; NULL when the date or a time is missing."""
+    date, start, end = (f"{alias}{column}" for column in ("date", "start_time", "end_time"))
+    return (
+        f"tsrange({date} + {start}, "
+        f"CASE WHEN {end} >= {start} THEN {date} + {end} ELSE {date} + 1 + {end} END)"
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if not context.is_offline_mode():
+        overlapping = op.get_bind().execute(sa.text(f"""
+            SELECT count(*) FROM study_sessions a JOIN study_sessions b
+              ON a.user_id = b.user_id AND a.id < b.id
+             AND {time_range("a.")} && {time_range("b.")}
+        """)).scalar()
+        if overlapping:
+            raise RuntimeError(
+                f"{overlapping} pairs of study sessions overlap; move or delete one session "
+                "of each pair before adding the overlap constraint"
+            )
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    op.execute(
+        f"ALTER TABLE study_sessions ADD CONSTRAINT {CONSTRAINT} "
+        f"EXCLUDE USING gist (user_id WITH =, ({time_range()}) WITH &&)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(f"ALTER TABLE study_sessions DROP CONSTRAINT IF EXISTS {CONSTRAINT}")
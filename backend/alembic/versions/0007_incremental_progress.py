@@ -0,0 +1,50 @@
+"""incremental progress
+
+Additive totals on progress (study hours done and estimated, completed quiz
+attempts and their score sum) from which progress_percentage is derived, and a
+unique index on (user_id, subject, topic) that delta upserts target. topic becomes
+NOT NULL with '' for rows that are not tied to a topic, so the index also covers them.
+
+Nothing wrote to progress before this revision. Fill it afterwards with
+`python -m app.utils.progress`.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 20:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0007'
+down_revision: Union[str, Sequence[str], None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TOTALS = [
+    ('studied_hours', sa.Float()),
+    ('target_hours', sa.Float()),
+    ('quiz_attempts', sa.Integer()),
+    ('quiz_score_total', sa.Integer()),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, type_ in TOTALS:
+        op.add_column('progress', sa.Column(name, type_, server_default='0', nullable=False))
+    op.execute("UPDATE progress SET topic = '' WHERE topic IS NULL")
+    op.alter_column('progress', 'topic', existing_type=sa.String(), server_default='', nullable=False)
+    op.create_index('ix_progress_user_id_subject_topic', 'progress', ['user_id', 'subject', 'topic'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_progress_user_id_subject_topic', table_name='progress')
+    op.alter_column('progress', 'topic', existing_type=sa.String(), server_default=None, nullable=True)
+    for name, _ in reversed(TOTALS):
+        op.drop_column('progress', name)
@@ -0,0 +1,61 @@
+"""quiz catalog version
+
+cache_versions holds one version number per cached dataset. The shared quiz
+catalog (quizzes owned by the default user) is cached in every API process and
+reloaded when its 'quiz_catalog' version moves. The API bumps the version when it
+creates a catalog quiz; the trigger also bumps it for writes made outside the API
+(seed scripts, manual SQL), so no catalog write goes unnoticed.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18 21:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0008'
+down_revision: Union[str, Sequence[str], None] = '0007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+DEFAULT_USER_ID = '026bbd66-baec-4d36-b9cf-a98695a672b9'
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'cache_versions',
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('version', sa.BigInteger(), server_default='1', nullable=False),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('name'),
+    )
+    op.execute("INSERT INTO cache_versions (name, version) VALUES ('quiz_catalog', 1)")
+    op.execute(f"""
+        CREATE FUNCTION bump_quiz_catalog_version() RETURNS trigger AS $$
+        BEGIN
+            IF (TG_OP <> 'DELETE' AND NEW.user_id = '{DEFAULT_USER_ID}')
+               OR (TG_OP <> 'INSERT' AND OLD.user_id = '{DEFAULT_USER_ID}') THEN
+                UPDATE cache_versions SET version = version + 1, updated_at = now()
+                 WHERE name = 'quiz_catalog';
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute(
+        "CREATE TRIGGER quizzes_bump_catalog_version AFTER INSERT OR UPDATE OR DELETE ON quizzes "
+        "FOR EACH ROW EXECUTE FUNCTION bump_quiz_catalog_version()"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS quizzes_bump_catalog_version ON quizzes")
+    op.execute("DROP FUNCTION IF EXISTS bump_quiz_catalog_version()")
+    op.drop_table('cache_versions')
@@ -0,0 +1,40 @@
+"""quiz summary columns
+
+question_count and total_marks on quizzes, so quiz listings can leave out the
+questions column. The ORM fills both from questions on INSERT; this revision
+backfills existing rows.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18 22:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0009'
+down_revision: Union[str, Sequence[str], None] = '0008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('quizzes', sa.Column('question_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('quizzes', sa.Column('total_marks', sa.Float(), server_default='0', nullable=False))
+    op.execute("""
+        UPDATE quizzes SET
+            question_count = json_array_length(questions),
+            total_marks = (SELECT COALESCE(sum((q->>'marks')::float), 0) FROM json_array_elements(questions) q)
+         WHERE json_typeof(questions) = 'array'
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('quizzes', 'total_marks')
+    op.drop_column('quizzes', 'question_count')
@@ -1,6 +1,16 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from app.utils.config import (
+    DB_MAX_OVERFLOW,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE_SECONDS,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT_SECONDS,
+)
+from app.utils.db_metrics import InstrumentedAsyncQueuePool, InstrumentedQueuePool, PoolMetrics
 import os
 from dotenv import load_dotenv
 
@@ -8,8 +18,69 @@ load_dotenv()  # Load environment variables from .env
 
 SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL")
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Async drivers for the same database, used by routers declared `async def`
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+def to_async_url(url: str) -> str:
+    """Swap the sync driver in a database URL for its asyncio counterpart."""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for database backend '{backend}'")
+    return parsed.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+ASYNC_SQLALCHEMY_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or to_async_url(SQLALCHEMY_DATABASE_URL)
+
+def pool_options(url: str, poolclass) -> dict:
+    """Pool settings from the environment; SQLite keeps SQLAlchemy's own pool choice."""
+    if make_url(url).get_backend_name() == "sqlite":
+        return {}
+    return {
+        "poolclass": poolclass,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": DB_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+
+engine = create_engine(SQLALCHEMY_DATABASE_URL, **pool_options(SQLALCHEMY_DATABASE_URL, InstrumentedQueuePool))
+engine.pool.metrics = PoolMetrics("primary")
+# Committed objects keep their loaded values, so handlers can return them without a
+# refresh SELECT; server-generated columns come back through RETURNING (eager_defaults)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+async_engine = create_async_engine(
+    ASYNC_SQLALCHEMY_DATABASE_URL, **pool_options(ASYNC_SQLALCHEMY_DATABASE_URL, InstrumentedAsyncQueuePool)
+)
+async_engine.sync_engine.pool.metrics = PoolMetrics("primary_async")
+
+# Optional read replica for GET-heavy endpoints; see app/utils/read_routing.py
+SQLALCHEMY_REPLICA_DATABASE_URL = os.getenv("DATABASE_REPLICA_URL")
+replica_engine = None
+async_replica_engine = None
+ReplicaSessionLocal = None
+AsyncReplicaSessionLocal = None
+if SQLALCHEMY_REPLICA_DATABASE_URL:
+    replica_engine = create_engine(
+        SQLALCHEMY_REPLICA_DATABASE_URL, **pool_options(SQLALCHEMY_REPLICA_DATABASE_URL, InstrumentedQueuePool)
+    )
+    replica_engine.pool.metrics = PoolMetrics("replica")
+    ReplicaSessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=replica_engine)
+
+    async_replica_url = to_async_url(SQLALCHEMY_REPLICA_DATABASE_URL)
+    async_replica_engine = create_async_engine(
+        async_replica_url, **pool_options(async_replica_url, InstrumentedAsyncQueuePool)
+    )
+    async_replica_engine.sync_engine.pool.metrics = PoolMetrics("replica_async")
+    AsyncReplicaSessionLocal = async_sessionmaker(
+        async_replica_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+    )
+# Objects stay usable after commit: expired attributes cannot lazy-load under asyncio
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
 
 Base = declarative_base()
 
@@ -18,4 +89,8 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
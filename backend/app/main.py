@@ -1,51 +1,92 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from .database import Base, engine, SessionLocal
+from fastapi.responses import JSONResponse
+from .database import SessionLocal, async_engine, async_replica_engine, engine, replica_engine
 from app.routes.auth import router as auth_router
 from app.routes.study_plan import router as study_plan_router
 from app.routes.quizzes import router as quizzes_router
 from app.routes.ai_tutor import router as ai_tutor_router
+from app.routes.internal import router as internal_router
+from app.routes.export import router as export_router
+from app.routes.progress import router as progress_router
+from .utils.auth import password_pool
+from .utils.config import QUERY_STATS_ENABLED
 from .utils.logging import setup_logging
-from app.models.user import User
-from app.models.quiz import Quiz
-from app.models.quiz_attempt import QuizAttempt
-from app.models.ai_interaction import AIInteraction
+from .utils.pagination import NEXT_CURSOR_HEADER
+from .utils.query_stats import QueryStatsMiddleware
+from .utils.read_routing import WRITE_WATERMARK_HEADER, ReadYourWritesMiddleware
+from . import models  # noqa: F401  Registers every model before the first query
 from sqlalchemy.sql import text
 
 # Set up logging
 logger = setup_logging()
 
-app = FastAPI()
-
-# Add CORS middleware to allow frontend requests
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["http://localhost:3000"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Test database connection
-try:
-    db = SessionLocal()
-    db.execute(text("SELECT 1"))
-    logger.info("Database connection successful!")
-    db.close()
-except Exception as e:
-    logger.error(f"Failed to connect to database: {str(e)}")
-    raise e
-
-# Create all tables
-Base.metadata.create_all(bind=engine)
-
-# Include routers
-app.include_router(auth_router)
-app.include_router(study_plan_router)
-app.include_router(quizzes_router)
-app.include_router(ai_tutor_router)
-
-@app.get("/")
-def read_root():
-    logger.info("Root endpoint accessed")
-    return {"message": "Hello from Smart Study Backend!"}
\ No newline at end of file
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Startup does no I/O: the database is checked by /api/ready, and the AI client
+    # and revision model are built on first use. Schema changes go through
+    # `alembic upgrade head`, not application startup.
+    logger.info("Smart Study Backend started")
+    yield
+    password_pool.shutdown()
+    await async_engine.dispose()
+    engine.dispose()
+    if replica_engine is not None:
+        await async_replica_engine.dispose()
+        replica_engine.dispose()
+    logger.info("Smart Study Backend stopped")
+
+def create_app() -> FastAPI:
+    app = FastAPI(lifespan=lifespan)
+
+    # Add CORS middleware to allow frontend requests
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["http://localhost:3000"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+        expose_headers=[NEXT_CURSOR_HEADER, "ETag", WRITE_WATERMARK_HEADER],
+    )
+
+    # Pin users to the primary database for a few seconds after they write
+    app.add_middleware(ReadYourWritesMiddleware)
+
+    # Query count and DB time per request (Server-Timing header, logs, N+1 warnings)
+    if QUERY_STATS_ENABLED:
+        app.add_middleware(QueryStatsMiddleware)
+
+    # Include routers
+    app.include_router(auth_router)
+    app.include_router(study_plan_router)
+    app.include_router(quizzes_router)
+    app.include_router(ai_tutor_router)
+    app.include_router(export_router)
+    app.include_router(progress_router)
+    app.include_router(internal_router)
+
+    @app.get("/")
+    def read_root():
+        logger.info("Root endpoint accessed")
+        return {"message": "Hello from Smart Study Backend!"}
+
+    @app.get("/api/health")
+    def health():
+        """Liveness probe: the process is up and serving requests."""
+        return {"status": "ok"}
+
+    @app.get("/api/ready")
+    def ready():
+        """Readiness probe: the primary database accepts queries."""
+        try:
+            with SessionLocal() as db:
+                db.execute(text("SELECT 1"))
+        except Exception as e:
+            logger.error(f"Readiness check failed: {str(e)}")
+            return JSONResponse(status_code=503, content={"status": "unavailable", "database": "unreachable"})
+        return {"status": "ready", "database": "ok"}
+
+    return app
+
+app = create_app()
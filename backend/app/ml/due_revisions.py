@@ -0,0 +1,104 @@
+# app/ml/due_revisions.py
+"""
+Queries for topics that are due for revision.
+
+Per-user lookups walk the (user_id, next_revision) index with keyset pagination on
+(next_revision, id). The all-users scan for the nightly reminder batch streams the
+same index in (user_id, next_revision) order with a server-side cursor and yields
+one batch per user, so memory is bounded by the chunk size, not the table.
+
+    python -m app.ml.due_revisions --on 2026-10-18 > reminders.ndjson
+"""
+import argparse
+import json
+from datetime import date
+from typing import Iterator, List, Optional, Tuple
+
+from sqlalchemy import Row, Select, select
+from sqlalchemy.orm import Session
+
+from app.models.study_topic import StudyTopic
+from app.utils.pagination import keyset_after
+
+
+def due_topics_query(user_id, due_before: date, due_from: Optional[date] = None,
+                     after: Optional[Tuple[date, str]] = None, limit: int = 50) -> Select:
+    """
+    One page of a user's topics with next_revision in [due_from, due_before].
+
+    Args:
+        user_id: Owner of the topics.
+        due_before (date): Last due date included (usually today).
+        due_from (Optional[date]): First due date included; None also returns overdue topics.
+        after (Optional[Tuple[date, str]]): (next_revision, id) of the last row of the previous page.
+        limit (int): Page size.
+
+    Returns:
+        Select: Query ordered by (next_revision, id).
+    """
+    query = select(StudyTopic).where(
+        StudyTopic.user_id == user_id,
+        StudyTopic.next_revision.isnot(None),
+        StudyTopic.next_revision <= due_before,
+    )
+    if due_from is not None:
+        query = query.where(StudyTopic.next_revision >= due_from)
+    if after is not None:
+        query = query.where(keyset_after((StudyTopic.next_revision, StudyTopic.id), after))
+    return query.order_by(StudyTopic.next_revision, StudyTopic.id).limit(limit)
+
+
+def iter_due_for_all_users(db: Session, due_before: date, due_from: Optional[date] = None,
+                           chunk_size: int = 10000) -> Iterator[Tuple[object, List[Row]]]:
+    """Stream (user_id, due topics) for every user with something due, one user at a time."""
+    query = select(
+        StudyTopic.user_id, StudyTopic.id, StudyTopic.title, StudyTopic.subject, StudyTopic.next_revision
+    ).where(
+        StudyTopic.next_revision.isnot(None),
+        StudyTopic.next_revision <= due_before,
+    )
+    if due_from is not None:
+        query = query.where(StudyTopic.next_revision >= due_from)
+    query = query.order_by(StudyTopic.user_id, StudyTopic.next_revision, StudyTopic.id)
+
+    current_user, topics = None, []
+    for row in db.execute(query.execution_options(yield_per=chunk_size)):
+        if row.user_id != current_user and topics:
+            yield current_user, topics
+            topics = []
+        current_user = row.user_id
+        topics.append(row)
+    if topics:
+        yield current_user, topics
+
+
+def reminder_lines(db: Session, due_before: date, due_from: Optional[date] = None,
+                   chunk_size: int = 10000) -> Iterator[str]:
+    """The all-users scan as NDJSON, one line per user."""
+    for user_id, topics in iter_due_for_all_users(db, due_before, due_from, chunk_size):
+        yield json.dumps({
+            "user_id": str(user_id),
+            "topics": [
+                {"id": str(t.id), "title": t.title, "subject": t.subject, "next_revision": t.next_revision.isoformat()}
+                for t in topics
+            ],
+        }) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--on", type=date.fromisoformat, default=date.today(), help="due on or before this date")
+    parser.add_argument("--from", dest="due_from", type=date.fromisoformat, default=None,
+                        help="skip topics due before this date")
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    args = parser.parse_args()
+
+    from app.database import ReplicaSessionLocal, SessionLocal
+
+    with (ReplicaSessionLocal or SessionLocal)() as db:
+        for line in reminder_lines(db, args.on, args.due_from, args.chunk_size):
+            print(line, end="")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+# app/ml/recompute_schedule.py
+"""
+Recompute the revision schedule of topics whose interval comes from the revision
+model, after a new model is promoted.
+
+Only topics in the first two reviews of a streak (review_count 1 or 2) depend on
+the model: their interval is the model's first interval for the latest session
+(at least SECOND_INTERVAL_DAYS on the second review) times the user's interval
+modifier. Longer streaks grow from their own interval and ease factor, and a lapse
+resets to one day, so those topics are left alone. The new interval comes from
+`scheduler.review`, and review_interval_days and next_revision are written together.
+
+Topics are walked in primary-key order in fixed-size chunks. Each chunk's latest
+rated session per topic is fetched in one query, scored with one vectorized
+model call, and written back with one UPDATE ... FROM (VALUES ...) statement on
+Postgres (an executemany elsewhere).
+
+    python -m app.ml.recompute_schedule --chunk-size 5000
+"""
+import argparse
+import logging
+import time
+from datetime import timedelta
+from typing import Dict
+
+from sqlalchemy import Date, Float, cast, column, func, select, update, values
+from sqlalchemy.orm import Session
+
+from app.ml.revision_model import durations_in_minutes, predict_next_revision_batch, registry
+from app.ml.scheduler import MemoryState, review
+from app.models.study_session import StudySession
+from app.models.study_topic import StudyTopic
+from app.models.user import User
+
+# Streak positions whose interval is derived from the model's first interval
+MODEL_REVIEW_COUNTS = (1, 2)
+
+logger = logging.getLogger("SmartStudyApp")
+
+
+def latest_rated_sessions(db: Session, topic_ids):
+    """Most recent session with a comprehension level and times, per topic in `topic_ids`."""
+    ranked = select(
+        StudySession.topic_id,
+        StudySession.date,
+        StudySession.start_time,
+        StudySession.end_time,
+        StudySession.comprehension_level,
+        func.row_number().over(
+            partition_by=StudySession.topic_id,
+            order_by=(StudySession.date.desc(), StudySession.start_time.desc()),
+        ).label("rank"),
+    ).where(
+        StudySession.topic_id.in_(topic_ids),
+        StudySession.comprehension_level.isnot(None),
+        StudySession.date.isnot(None),
+        StudySession.start_time.isnot(None),
+        StudySession.end_time.isnot(None),
+    ).subquery()
+    return db.execute(select(ranked).where(ranked.c.rank == 1)).all()
+
+
+def recompute_chunk(db: Session, topics) -> int:
+    """Score one chunk of topic rows (see `recompute_next_revisions`) and write back what changed."""
+    current = {topic.id: topic for topic in topics}
+    # Only the session that set the current interval counts
+    sessions = [s for s in latest_rated_sessions(db, list(current)) if s.date == current[s.topic_id].last_studied]
+    if not sessions:
+        return 0
+
+    minutes = durations_in_minutes([s.start_time for s in sessions], [s.end_time for s in sessions])
+    rated = [(s, m) for s, m in zip(sessions, minutes) if m > 0]
+    if not rated:
+        return 0
+    days = predict_next_revision_batch([s.comprehension_level for s, _ in rated], [m for _, m in rated])
+
+    changes = []
+    for (session, _), first_interval in zip(rated, days):
+        topic = current[session.topic_id]
+        # Replay the review that produced the current state, from the state before it
+        before = MemoryState(topic.ease_factor, topic.review_interval_days, topic.review_count - 1)
+        state = review(before, session.comprehension_level, first_interval_days=int(first_interval),
+                       interval_modifier=topic.revision_interval_modifier)
+        next_revision = session.date + timedelta(days=round(state.interval_days))
+        if state.review_count == topic.review_count and (topic.review_interval_days, topic.next_revision) != (state.interval_days, next_revision):
+            changes.append((topic.id, state.interval_days, next_revision))
+    if not changes:
+        return 0
+
+    if db.get_bind().dialect.name == "postgresql":
+        # One statement for the whole chunk instead of a round trip per row
+        new_values = values(
+            column("id", StudyTopic.id.type), column("review_interval_days", Float), column("next_revision", Date),
+            name="new_values",
+        ).data(changes)
+        db.execute(
+            update(StudyTopic)
+            .where(StudyTopic.id == cast(new_values.c.id, StudyTopic.id.type))
+            .values(review_interval_days=new_values.c.review_interval_days,
+                    next_revision=cast(new_values.c.next_revision, Date))
+            .execution_options(synchronize_session=False)
+        )
+    else:
+        db.execute(update(StudyTopic), [
+            {"id": topic_id, "review_interval_days": interval, "next_revision": day}
+            for topic_id, interval, day in changes
+        ])
+    return len(changes)
+
+
+def recompute_next_revisions(db: Session, chunk_size: int = 5000) -> Dict[str, float]:
+    """Walk the model-scheduled topics in chunks, committing after each; returns throughput figures."""
+    started = time.perf_counter()
+    scanned = updated = 0
+    last_id = None
+    while True:
+        query = (
+            select(StudyTopic.id, StudyTopic.next_revision, StudyTopic.last_studied, StudyTopic.ease_factor,
+                   StudyTopic.review_interval_days, StudyTopic.review_count, User.revision_interval_modifier)
+            .join(User, User.id == StudyTopic.user_id)
+            .where(StudyTopic.review_count.in_(MODEL_REVIEW_COUNTS))
+            .order_by(StudyTopic.id)
+            .limit(chunk_size)
+        )
+        if last_id is not None:
+            query = query.where(StudyTopic.id > last_id)
+        topics = db.execute(query).all()
+        if not topics:
+            break
+        updated += recompute_chunk(db, topics)
+        db.commit()
+        scanned += len(topics)
+        last_id = topics[-1].id
+        logger.info(f"Recomputed schedule for {scanned} topics ({updated} changed)")
+
+    elapsed = time.perf_counter() - started
+    return {
+        "model_version": registry.active_version,
+        "topics_scanned": scanned,
+        "topics_updated": updated,
+        "seconds": round(elapsed, 3),
+        "rows_per_sec": round(scanned / elapsed, 1) if elapsed else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    from app.database import SessionLocal
+
+    with SessionLocal() as db:
+        result = recompute_next_revisions(db, chunk_size=args.chunk_size)
+    print(result)
+
+
+if __name__ == "__main__":
+    main()
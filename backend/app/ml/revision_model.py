@@ -1,10 +1,13 @@
 # app/ml/revision_model.py
 import numpy as np
-from sklearn.linear_model import LinearRegression
 import pickle
 import os
+import time
 from datetime import datetime, timedelta
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
 import logging
+from app.utils.config import REVISION_MODEL_CHECK_INTERVAL_SECONDS
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -16,18 +19,132 @@ X_train = np.array([
 ])
 y_train = np.array([1, 2, 2, 3, 4, 5, 7, 8, 14, 15])  # Days until next revision
 
-# Train a simple linear regression model
-model = LinearRegression()
-model.fit(X_train, y_train)
+# Saved model location. Nothing is trained or written at import time: when the file
+# is missing, predictions use the built-in model, trained once on first use.
+model_path = os.getenv("REVISION_MODEL_PATH", "revision_model.pkl")
 
-# Save the model to a file
-model_path = "revision_model.pkl"
-with open(model_path, "wb") as f:
-    pickle.dump(model, f)
+_default_model = None
+
+class LinearRevisionModel:
+    """
+    Linear days-until-revision model that predicts with plain NumPy.
+
+    This is the artifact format the API loads: it unpickles and predicts without
+    scikit-learn, which is only needed by the offline training tools.
+    """
+
+    def __init__(self, coef, intercept: float, version: Optional[str] = None):
+        self.coef_ = np.asarray(coef, dtype=float)
+        self.intercept_ = float(intercept)
+        self.version_ = version
+
+    @classmethod
+    def from_estimator(cls, estimator, version: Optional[str] = None) -> "LinearRevisionModel":
+        """Copy the coefficients out of any fitted linear estimator (e.g. scikit-learn's)."""
+        return cls(np.ravel(estimator.coef_), np.ravel([estimator.intercept_])[0],
+                   version or getattr(estimator, "version_", None))
+
+    def predict(self, features) -> np.ndarray:
+        return np.asarray(features, dtype=float) @ self.coef_ + self.intercept_
+
+def train_default_model() -> LinearRevisionModel:
+    """Least-squares fit of the built-in linear model on the simulated data."""
+    design = np.column_stack((X_train, np.ones(len(X_train))))
+    solution, *_ = np.linalg.lstsq(design, y_train, rcond=None)
+    return LinearRevisionModel(solution[:-1], solution[-1], version="builtin")
+
+def get_default_model():
+    global _default_model
+    if _default_model is None:
+        _default_model = train_default_model()
+    return _default_model
+
+def save_model(model, path: str = model_path) -> None:
+    """Write the model next to `path` and rename it into place, so readers never see a partial file."""
+    if not isinstance(model, LinearRevisionModel):
+        model = LinearRevisionModel.from_estimator(model)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(model, f)
+    os.replace(tmp_path, path)
+
+class ModelRegistry:
+    """
+    Holds the revision model in memory, loaded once per process.
+
+    The model file's mtime is re-checked at most every `check_interval` seconds;
+    when it changes, the new file is unpickled and swapped in as one reference
+    assignment, so concurrent predictions see either the old or the new model.
+    If the file is missing the built-in model is used, and if a new file fails to
+    load the previously active model keeps serving.
+    """
+
+    def __init__(self, path: str, check_interval: float = 5.0):
+        self.path = path
+        self.check_interval = check_interval
+        self._active: Optional[Tuple[Any, str]] = None  # (model, version)
+        self._file_mtime: Optional[int] = None
+        self._checked_at: Optional[float] = None
+        self._lock = Lock()
+        self.reloads = 0
+        self.load_failures = 0
+
+    def get(self) -> Tuple[Any, str]:
+        """Return the active (model, version), reloading it first if the file changed."""
+        now = time.monotonic()
+        if self._active is None or self._checked_at is None or now - self._checked_at >= self.check_interval:
+            with self._lock:
+                self._refresh(now)
+        return self._active
+
+    def _refresh(self, now: float) -> None:
+        self._checked_at = now
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+
+        if mtime is None:
+            if self._active is None or self._file_mtime is not None:
+                self._active = (get_default_model(), "builtin")
+                self._file_mtime = None
+            return
+        if mtime == self._file_mtime and self._active is not None:
+            return
+
+        try:
+            with open(self.path, "rb") as f:
+                model = pickle.load(f)
+        except Exception as e:
+            self.load_failures += 1
+            logger.error(f"Could not load revision model from {self.path}: {str(e)}")
+            if self._active is None:
+                self._active = (get_default_model(), "builtin")
+            return
+
+        version = getattr(model, "version_", None) or f"file:{mtime}"
+        self._active = (model, str(version))
+        self._file_mtime = mtime
+        self.reloads += 1
+        logger.info(f"Revision model {version} loaded from {self.path}")
+
+    @property
+    def active_version(self) -> Optional[str]:
+        return self._active[1] if self._active is not None else None
+
+    def info(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "active_version": self.active_version,
+            "reloads": self.reloads,
+            "load_failures": self.load_failures,
+        }
+
+registry = ModelRegistry(model_path, check_interval=REVISION_MODEL_CHECK_INTERVAL_SECONDS)
 
 def predict_next_revision(comprehension_level: int, duration: float) -> int:
     """
-    Predict the number of days until the next revision using a linear regression model.
+    Predict the number of days until the next revision using the registry's active model.
     
     Args:
         comprehension_level (int): User's comprehension level (1-5).
@@ -36,13 +153,8 @@ def predict_next_revision(comprehension_level: int, duration: float) -> int:
     Returns:
         int: Number of days until the next revision (minimum 1 day).
     """
-    if not os.path.exists(model_path):
-        logger.warning("ML model file not found. Defaulting to 7 days.")
-        return 7  # Fallback interval
-
     try:
-        with open(model_path, "rb") as f:
-            loaded_model = pickle.load(f)
+        loaded_model, _ = registry.get()
         
         # Predict using the model
         features = np.array([[comprehension_level, duration]])
@@ -52,6 +164,36 @@ def predict_next_revision(comprehension_level: int, duration: float) -> int:
         logger.error(f"Error in ML prediction: {str(e)}")
         return 7  # Fallback interval
 
+def predict_next_revision_batch(comprehension_levels, durations) -> np.ndarray:
+    """
+    Vectorized predict_next_revision: one model call for any number of sessions.
+    
+    Args:
+        comprehension_levels (array-like): Comprehension levels (1-5).
+        durations (array-like): Study session durations in minutes.
+    
+    Returns:
+        np.ndarray: Integer days until the next revision for each session (minimum 1 day).
+    """
+    levels = np.asarray(comprehension_levels, dtype=float)
+    minutes = np.asarray(durations, dtype=float)
+    if levels.size == 0:
+        return np.empty(0, dtype=int)
+    try:
+        loaded_model, _ = registry.get()
+        days = loaded_model.predict(np.column_stack((levels, minutes)))
+        return np.maximum(1, np.rint(days)).astype(int)
+    except Exception as e:
+        logger.error(f"Error in batch ML prediction: {str(e)}")
+        return np.full(levels.shape[0], 7, dtype=int)  # Fallback interval
+
+def durations_in_minutes(start_times, end_times) -> np.ndarray:
+    """Vectorized calculate_duration for `datetime.time` values; overnight sessions wrap."""
+    to_seconds = lambda t: t.hour * 3600 + t.minute * 60 + t.second
+    start = np.fromiter((to_seconds(t) for t in start_times), dtype=float, count=len(start_times))
+    end = np.fromiter((to_seconds(t) for t in end_times), dtype=float, count=len(end_times))
+    return np.mod(end - start, 86400) / 60
+
 def calculate_duration(start_time: str, end_time: str) -> float:
     """
     Calculate the duration in minutes between start_time and end_time.
@@ -72,4 +214,9 @@ def calculate_duration(start_time: str, end_time: str) -> float:
         return delta.total_seconds() / 60
     except ValueError as e:
         logger.error(f"Error calculating duration: {str(e)}")
-        return 0.0
\ No newline at end of file
+        return 0.0
+
+if __name__ == "__main__":
+    # Write the built-in model to REVISION_MODEL_PATH: python -m app.ml.revision_model
+    save_model(train_default_model())
+    logger.info(f"Revision model saved to {model_path}")
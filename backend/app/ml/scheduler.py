@@ -0,0 +1,160 @@
+# app/ml/scheduler.py
+"""
+Per-topic spaced-repetition scheduling (SM-2 style).
+
+Each StudyTopic carries its own memory state: an ease factor, the interval last
+scheduled and how many successful reviews in a row it has had. A study session
+updates that state in O(1) with plain arithmetic; the first interval of a topic
+comes from the revision model's (NumPy) prediction for that session.
+
+Every user also has an interval modifier that stretches or shrinks all of their
+intervals. It is re-fitted offline from session history (see `main`), using the
+retention rule of thumb modifier = ln(target retention) / ln(observed retention).
+
+    python -m app.ml.scheduler --chunk-size 50000
+"""
+import argparse
+import logging
+import math
+import time
+from typing import Dict, NamedTuple
+
+import numpy as np
+from sqlalchemy import select, update
+
+from app.utils.config import REVISION_MIN_REVIEWS_FOR_FIT, REVISION_TARGET_RETENTION
+
+logger = logging.getLogger("SmartStudyApp")
+
+DEFAULT_EASE = 2.5
+MIN_EASE = 1.3
+PASSING_LEVEL = 3  # comprehension levels below this count as a lapse
+SECOND_INTERVAL_DAYS = 6.0
+MAX_INTERVAL_DAYS = 365.0  # long streaks would otherwise grow past any useful (or representable) date
+MIN_MODIFIER, MAX_MODIFIER = 0.5, 2.5
+
+
+class MemoryState(NamedTuple):
+    ease_factor: float
+    interval_days: float
+    review_count: int
+
+
+def review(state: MemoryState, comprehension_level: int, first_interval_days: float, interval_modifier: float = 1.0) -> MemoryState:
+    """
+    Apply one study session to a topic's memory state.
+
+    Args:
+        state (MemoryState): The topic's state before this session.
+        comprehension_level (int): Session rating (1-5); below PASSING_LEVEL resets the streak.
+        first_interval_days (float): Interval to use when the streak is starting.
+        interval_modifier (float): The user's fitted interval multiplier.
+
+    Returns:
+        MemoryState: The new state; `interval_days` is the gap until the next revision.
+    """
+    level = min(5, max(1, int(comprehension_level)))
+    lapse = 5 - level
+    ease = max(MIN_EASE, state.ease_factor + 0.1 - lapse * (0.08 + lapse * 0.02))
+
+    if level < PASSING_LEVEL:
+        return MemoryState(ease, 1.0, 0)
+    if state.review_count == 0:
+        interval = first_interval_days
+    elif state.review_count == 1:
+        interval = max(SECOND_INTERVAL_DAYS, first_interval_days)
+    else:
+        interval = state.interval_days * ease
+    interval = min(MAX_INTERVAL_DAYS, max(1.0, interval * interval_modifier))
+    return MemoryState(ease, interval, state.review_count + 1)
+
+
+def retention_counts(user_idx: np.ndarray, topic_idx: np.ndarray, levels: np.ndarray, n_users: int):
+    """
+    Count reviews and successful recalls per user from sessions sorted by (topic, time).
+
+    A review is any session that follows an earlier session on the same topic; it
+    is a recall when its comprehension level is passing.
+    """
+    same_topic = topic_idx[1:] == topic_idx[:-1]
+    reviewers = user_idx[1:][same_topic]
+    recalled = (levels[1:][same_topic] >= PASSING_LEVEL).astype(float)
+    reviews = np.bincount(reviewers, minlength=n_users).astype(float)
+    recalls = np.bincount(reviewers, weights=recalled, minlength=n_users)
+    return reviews, recalls
+
+
+def fit_interval_modifiers(reviews: np.ndarray, recalls: np.ndarray,
+                           target_retention: float = REVISION_TARGET_RETENTION,
+                           min_reviews: int = REVISION_MIN_REVIEWS_FOR_FIT) -> np.ndarray:
+    """Vectorized per-user modifier; users with too little history keep 1.0."""
+    observed = np.clip(np.divide(recalls, reviews, out=np.ones_like(reviews), where=reviews > 0), 0.01, 0.99)
+    modifiers = np.clip(math.log(target_retention) / np.log(observed), MIN_MODIFIER, MAX_MODIFIER)
+    return np.where(reviews >= min_reviews, np.round(modifiers, 3), 1.0)
+
+
+def refit_interval_modifiers(db, chunk_size: int = 50000) -> Dict[str, float]:
+    """Stream every rated session in (topic, time) order and refit all users' modifiers."""
+    from app.models.study_session import StudySession
+    from app.models.user import User
+    from app.utils.auth import user_cache
+
+    started = time.perf_counter()
+    user_index: Dict = {}
+    reviews = np.zeros(0)
+    recalls = np.zeros(0)
+    carry = None  # last row of the previous chunk, so pairs spanning chunks are counted
+    rows = 0
+
+    query = select(StudySession.user_id, StudySession.topic_id, StudySession.comprehension_level).where(
+        StudySession.topic_id.isnot(None), StudySession.comprehension_level.isnot(None)
+    ).order_by(StudySession.topic_id, StudySession.date, StudySession.start_time)
+
+    result = db.execute(query.execution_options(yield_per=chunk_size))
+    for chunk in result.partitions():
+        if carry is not None:
+            chunk = [carry] + list(chunk)
+        users = np.fromiter((user_index.setdefault(r.user_id, len(user_index)) for r in chunk), dtype=np.int64, count=len(chunk))
+        topic_ids = {}
+        topics = np.fromiter((topic_ids.setdefault(r.topic_id, len(topic_ids)) for r in chunk), dtype=np.int64, count=len(chunk))
+        levels = np.fromiter((r.comprehension_level for r in chunk), dtype=np.int64, count=len(chunk))
+
+        chunk_reviews, chunk_recalls = retention_counts(users, topics, levels, len(user_index))
+        reviews = np.pad(reviews, (0, len(user_index) - len(reviews))) + chunk_reviews
+        recalls = np.pad(recalls, (0, len(user_index) - len(recalls))) + chunk_recalls
+        rows += len(chunk) - (carry is not None)
+        carry = chunk[-1]
+
+    modifiers = fit_interval_modifiers(reviews, recalls)
+    user_ids = list(user_index)
+    if user_ids:
+        db.execute(update(User), [
+            {"id": user_id, "revision_interval_modifier": float(modifier)}
+            for user_id, modifier in zip(user_ids, modifiers)
+        ])
+        db.commit()
+        # Bulk UPDATE fires no mapper events; other processes see the new updated_at instead
+        user_cache.clear()
+
+    elapsed = time.perf_counter() - started
+    return {
+        "sessions": rows,
+        "users_fitted": int(np.sum(reviews >= REVISION_MIN_REVIEWS_FOR_FIT)),
+        "users_seen": len(user_ids),
+        "seconds": round(elapsed, 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chunk-size", type=int, default=50000)
+    args = parser.parse_args()
+
+    from app.database import SessionLocal
+
+    with SessionLocal() as db:
+        print(refit_interval_modifiers(db, chunk_size=args.chunk_size))
+
+
+if __name__ == "__main__":
+    main()
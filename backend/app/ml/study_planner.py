@@ -0,0 +1,119 @@
+# app/ml/study_planner.py
+"""
+Greedy study-plan generator.
+
+Free time up to an exam is cut into fixed-length blocks, and the blocks are filled
+in chronological order. A block goes to a due revision when one is due on or before
+that day (earliest due first). Otherwise it goes to the topic with the lowest
+stride-scheduling pass value. Each time a topic gets a block, its pass value grows
+by 1 / weight, so topics share the time in proportion to their priority weights and
+stay interleaved instead of being studied one after another. Both choices are heap
+operations, so a plan costs O((blocks + topics) log topics); there is no search.
+"""
+import heapq
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from app.utils.timeslots import Interval, merge_intervals
+
+PRIORITY_WEIGHTS = {"high": 3.0, "medium": 2.0, "low": 1.0}
+DEFAULT_PRIORITY = "medium"
+
+STUDY, REVISION = "study", "revision"
+
+
+class PlanTask(NamedTuple):
+    topic_id: Any
+    blocks: int  # study blocks still needed to cover the remaining hours
+    weight: float
+    revision_due: Optional[date]  # one revision block on or after this day, if any
+
+
+class PlannedBlock(NamedTuple):
+    topic_id: Any
+    start: datetime
+    end: datetime
+    kind: str  # STUDY or REVISION
+
+
+def weekly_windows(first_day: date, last_day: date, availability: Iterable[Tuple[int, time, time]]) -> List[Interval]:
+    """
+    Expand weekly availability into dated windows.
+
+    Args:
+        first_day (date): First day of the plan.
+        last_day (date): Last day of the plan (inclusive).
+        availability: (weekday, start_time, end_time) tuples, Monday = 0, with end_time after start_time.
+
+    Returns:
+        List[Interval]: Disjoint windows sorted by start; overlapping entries are merged.
+    """
+    by_weekday: Dict[int, List[Tuple[time, time]]] = {}
+    for weekday, start, end in availability:
+        by_weekday.setdefault(weekday, []).append((start, end))
+    windows = []
+    day = first_day
+    while day <= last_day:
+        windows.extend(
+            (datetime.combine(day, start), datetime.combine(day, end))
+            for start, end in sorted(by_weekday.get(day.weekday(), ()))
+        )
+        day += timedelta(days=1)
+    return merge_intervals(windows)
+
+
+def split_into_blocks(slots: Iterable[Interval], block_minutes: int, min_minutes: int) -> List[Interval]:
+    """
+    Cut free slots into blocks of `block_minutes`.
+
+    A leftover at the end of a slot is kept when it is at least `min_minutes` long.
+    """
+    block, shortest = timedelta(minutes=block_minutes), timedelta(minutes=min_minutes)
+    blocks = []
+    for start, end in slots:
+        while end - start >= block:
+            blocks.append((start, start + block))
+            start += block
+        if end - start >= shortest:
+            blocks.append((start, end))
+    return blocks
+
+
+def plan_sessions(tasks: Sequence[PlanTask], blocks: Sequence[Interval]):
+    """
+    Assign blocks to revisions and study time.
+
+    Args:
+        tasks (Sequence[PlanTask]): One entry per topic that needs study time or a revision.
+        blocks (Sequence[Interval]): Free blocks sorted by start.
+
+    Returns:
+        Tuple[List[PlannedBlock], Dict[Any, Tuple[int, bool]]]: The planned blocks, and for every
+        topic with work left over, its unscheduled study blocks and whether its revision is unscheduled.
+    """
+    revisions = [(task.revision_due, -task.weight, i) for i, task in enumerate(tasks) if task.revision_due is not None]
+    heapq.heapify(revisions)
+    remaining = [task.blocks for task in tasks]
+    study = [(1.0 / task.weight, i) for i, task in enumerate(tasks) if task.blocks > 0]
+    heapq.heapify(study)
+
+    planned = []
+    for start, end in blocks:
+        if revisions and revisions[0][0] <= start.date():
+            i = heapq.heappop(revisions)[2]
+            planned.append(PlannedBlock(tasks[i].topic_id, start, end, REVISION))
+        elif study:
+            pass_value, i = study[0]
+            planned.append(PlannedBlock(tasks[i].topic_id, start, end, STUDY))
+            remaining[i] -= 1
+            if remaining[i]:
+                heapq.heapreplace(study, (pass_value + 1.0 / tasks[i].weight, i))
+            else:
+                heapq.heappop(study)
+        elif not revisions:
+            break
+
+    unscheduled = {tasks[i].topic_id: (remaining[i], False) for _, i in study}
+    for _, _, i in revisions:
+        unscheduled[tasks[i].topic_id] = (remaining[i], True)
+    return planned, unscheduled
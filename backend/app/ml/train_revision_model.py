@@ -0,0 +1,169 @@
+# app/ml/train_revision_model.py
+"""
+Offline training of the revision model on real study sessions.
+
+Sessions are streamed out of the database in (topic, time) order with a
+server-side cursor (`yield_per`), `--chunk-size` rows at a time. Each session is
+one example: its features are what the API predicts from (comprehension level,
+duration in minutes) and its label is the observed gap in days until the next
+session on the same topic. The model is fitted incrementally, chunk by chunk, so
+memory stays flat however many sessions there are.
+
+The result is written as a versioned artifact next to REVISION_MODEL_PATH and then
+promoted onto that path atomically; running API processes pick it up through the
+model registry without a restart.
+
+    python -m app.ml.train_revision_model --chunk-size 50000
+"""
+import argparse
+import logging
+import os
+import time
+from datetime import datetime
+from typing import Dict, Optional
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.ml.revision_model import LinearRevisionModel, durations_in_minutes, model_path, save_model
+from app.models.study_session import StudySession
+from app.models.study_topic import StudyTopic
+
+logger = logging.getLogger("SmartStudyApp")
+
+MIN_GAP_DAYS = 0.5  # a same-day follow-up is a continuation, not a revision
+MAX_GAP_DAYS = 60.0  # longer gaps are abandoned topics rather than chosen intervals
+
+
+class IncrementalLinearFit:
+    """
+    Least-squares linear regression fitted one mini-batch at a time.
+
+    Only the normal-equation sums (X'X and X'y) are kept between batches, so the
+    fit is exact, independent of batch order and uses constant memory.
+    """
+
+    def __init__(self, n_features: int):
+        self.xtx = np.zeros((n_features + 1, n_features + 1))
+        self.xty = np.zeros(n_features + 1)
+        self.n_samples = 0
+
+    def partial_fit(self, features: np.ndarray, labels: np.ndarray) -> "IncrementalLinearFit":
+        design = np.column_stack((features, np.ones(len(features))))
+        self.xtx += design.T @ design
+        self.xty += design.T @ labels
+        self.n_samples += len(labels)
+        return self
+
+    def to_model(self, version: Optional[str] = None) -> LinearRevisionModel:
+        solution, *_ = np.linalg.lstsq(self.xtx, self.xty, rcond=None)
+        return LinearRevisionModel(solution[:-1], solution[-1], version=version)
+
+
+def training_examples(rows):
+    """
+    Features and labels for one chunk of sessions sorted by (topic, date, start_time).
+
+    The last session of the chunk has no successor yet, so it is left out here and
+    must be carried into the next chunk by the caller.
+    """
+    topic_index: Dict = {}
+    topics = np.fromiter((topic_index.setdefault(r.topic_id, len(topic_index)) for r in rows), dtype=np.int64, count=len(rows))
+    start_days = np.fromiter((r.date.toordinal() for r in rows), dtype=float, count=len(rows))
+    start_seconds = np.fromiter(
+        (r.start_time.hour * 3600 + r.start_time.minute * 60 + r.start_time.second for r in rows),
+        dtype=float, count=len(rows),
+    )
+    starts = start_days + start_seconds / 86400
+    levels = np.fromiter((r.comprehension_level for r in rows), dtype=float, count=len(rows))
+    minutes = durations_in_minutes([r.start_time for r in rows], [r.end_time for r in rows])
+
+    gaps = starts[1:] - starts[:-1]
+    keep = (topics[1:] == topics[:-1]) & (gaps >= MIN_GAP_DAYS) & (gaps <= MAX_GAP_DAYS)
+    features = np.column_stack((levels[:-1], minutes[:-1]))[keep]
+    return features, gaps[keep]
+
+
+def train_from_sessions(db: Session, chunk_size: int = 50000) -> Dict:
+    """Stream every rated, timed session and fit the model; returns the fit and counters."""
+    query = (
+        select(
+            StudySession.topic_id,
+            StudySession.date,
+            StudySession.start_time,
+            StudySession.end_time,
+            StudySession.comprehension_level,
+        )
+        .join(StudyTopic, StudyTopic.id == StudySession.topic_id)
+        .where(
+            StudySession.date.isnot(None),
+            StudySession.start_time.isnot(None),
+            StudySession.end_time.isnot(None),
+            StudySession.comprehension_level.isnot(None),
+        )
+        .order_by(StudySession.topic_id, StudySession.date, StudySession.start_time)
+    )
+
+    fit = IncrementalLinearFit(n_features=2)
+    carry = None
+    rows = 0
+    result = db.execute(query.execution_options(yield_per=chunk_size))
+    for chunk in result.partitions():
+        rows += len(chunk)
+        if carry is not None:
+            chunk = [carry] + list(chunk)
+        features, labels = training_examples(chunk)
+        if len(labels):
+            fit.partial_fit(features, labels)
+        carry = chunk[-1]
+    return {"fit": fit, "sessions": rows, "examples": fit.n_samples}
+
+
+def versioned_path(path: str, version: str) -> str:
+    root, ext = os.path.splitext(path)
+    return f"{root}-{version}{ext or '.pkl'}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chunk-size", type=int, default=50000)
+    parser.add_argument("--min-examples", type=int, default=1000,
+                        help="refuse to publish a model fitted on fewer examples")
+    parser.add_argument("--no-promote", action="store_true",
+                        help="only write the versioned artifact, leave the served model alone")
+    args = parser.parse_args()
+
+    from app.database import SessionLocal
+
+    started = time.perf_counter()
+    with SessionLocal() as db:
+        result = train_from_sessions(db, chunk_size=args.chunk_size)
+    elapsed = time.perf_counter() - started
+
+    if result["examples"] < args.min_examples:
+        raise SystemExit(f"only {result['examples']} training examples (need {args.min_examples}); model not written")
+
+    version = f"{datetime.utcnow():%Y%m%dT%H%M%SZ}-n{result['examples']}"
+    model = result["fit"].to_model(version=version)
+    artifact = versioned_path(model_path, version)
+    save_model(model, artifact)
+    if not args.no_promote:
+        save_model(model, model_path)
+
+    logger.info(f"Revision model {version} trained on {result['examples']} examples "
+                f"from {result['sessions']} sessions in {elapsed:.1f}s")
+    print({
+        "version": version,
+        "sessions": result["sessions"],
+        "examples": result["examples"],
+        "coef": model.coef_.round(4).tolist(),
+        "intercept": round(model.intercept_, 4),
+        "artifact": artifact,
+        "promoted": not args.no_promote,
+        "seconds": round(elapsed, 3),
+    })
+
+
+if __name__ == "__main__":
+    main()
@@ -7,4 +7,7 @@ from .chat_session import ChatSession
 from .chat_message import ChatMessage
 from .progress import Progress
 from .achievement import Achievement
-from .user_achievement import UserAchievement
\ No newline at end of file
+from .user_achievement import UserAchievement
+from .study_topic import StudyTopic
+from .ai_interaction import AIInteraction
+from .cache_version import CacheVersion
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey
+from sqlalchemy import Column, String, DateTime, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID, TEXT
 from sqlalchemy.sql import func
 import uuid
@@ -7,6 +7,11 @@ from sqlalchemy.orm import relationship
 
 class AIInteraction(Base):
     __tablename__ = "ai_interactions"
+    __table_args__ = (
+        Index("ix_ai_interactions_user_id_created_at", "user_id", "created_at"),
+    )
+    # Fetch server-generated values with RETURNING instead of a refresh after commit
+    __mapper_args__ = {"eager_defaults": True}
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     query = Column(TEXT, nullable=False)
@@ -0,0 +1,19 @@
+from sqlalchemy import BigInteger, Column, DateTime, DDL, String, event
+from sqlalchemy.sql import func
+from app.database import Base
+
+# Cached datasets whose version is bumped on every write; readers compare versions
+QUIZ_CATALOG = "quiz_catalog"
+
+class CacheVersion(Base):
+    __tablename__ = "cache_versions"
+    name = Column(String, primary_key=True)
+    version = Column(BigInteger, nullable=False, server_default="1")
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+# Tables created outside Alembic (development, create_all) get the same seed row as migration 0008
+event.listen(
+    CacheVersion.__table__,
+    "after_create",
+    DDL(f"INSERT INTO cache_versions (name, version) VALUES ('{QUIZ_CATALOG}', 1)"),
+)
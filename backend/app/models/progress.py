@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Float, ForeignKey, DateTime
+from sqlalchemy import Column, String, Float, ForeignKey, DateTime, Index, Integer
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 import uuid
@@ -6,9 +6,18 @@ from app.database import Base  # Absolute import
 
 class Progress(Base):
     __tablename__ = "progress"
+    __table_args__ = (
+        # Upsert target for delta updates, and the per-user read
+        Index("ix_progress_user_id_subject_topic", "user_id", "subject", "topic", unique=True),
+    )
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     subject = Column(String, nullable=False)
-    topic = Column(String)
+    topic = Column(String, nullable=False, server_default="")  # "" when progress is not tied to a topic
     progress_percentage = Column(Float, nullable=False)
-    last_updated = Column(DateTime, default=func.now(), onupdate=func.now())
\ No newline at end of file
+    # Additive totals maintained by app/utils/progress.py; progress_percentage is derived from them
+    studied_hours = Column(Float, nullable=False, server_default="0")
+    target_hours = Column(Float, nullable=False, server_default="0")
+    quiz_attempts = Column(Integer, nullable=False, server_default="0")
+    quiz_score_total = Column(Integer, nullable=False, server_default="0")
+    last_updated = Column(DateTime, default=func.now(), onupdate=func.now())
@@ -1,12 +1,23 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, text
+from sqlalchemy import Column, Float, Integer, String, ForeignKey, DateTime, Index, text
 from sqlalchemy.dialects.postgresql import UUID, JSON
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
 import uuid
 
+def _question_count(context):
+    return len(context.get_current_parameters().get("questions") or [])
+
+def _total_marks(context):
+    return float(sum(question.get("marks", 0) for question in context.get_current_parameters().get("questions") or []))
+
 class Quiz(Base):
     __tablename__ = "quizzes"
+    __table_args__ = (
+        Index("ix_quizzes_user_id_title", "user_id", "title"),
+    )
+    # Fetch server-generated values with RETURNING instead of a refresh after commit
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
@@ -17,6 +28,9 @@ class Quiz(Base):
     difficulty = Column(String)
     questions = Column(JSON)  # Changed to JSON to store MCQ structure
     time_limit = Column(Integer)
+    # Derived from questions on INSERT, so listings need not load the questions column
+    question_count = Column(Integer, nullable=False, default=_question_count, server_default="0")
+    total_marks = Column(Float, nullable=False, default=_total_marks, server_default="0")
     created_at = Column(DateTime(timezone=False), server_default=func.now())
     updated_at = Column(DateTime(timezone=False), onupdate=func.now())
     status = Column(String, nullable=False, server_default=text("'not-started'"))
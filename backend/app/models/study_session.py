@@ -1,5 +1,5 @@
 # app/models/study_session.py
-from sqlalchemy import Column, String, Date, Time, Boolean, Integer, ForeignKey, DateTime
+from sqlalchemy import Column, String, Date, Time, Boolean, Integer, ForeignKey, DateTime, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.database import Base
@@ -8,6 +8,13 @@ import uuid  # Added this import
 
 class StudySession(Base):
     __tablename__ = "study_sessions"
+    __table_args__ = (
+        Index("ix_study_sessions_user_id_date_start_time", "user_id", "date", "start_time"),
+        Index("ix_study_sessions_user_id_subject_date_start_time", "user_id", "subject", "date", "start_time"),
+        Index("ix_study_sessions_topic_id", "topic_id"),
+        # Postgres also has ex_study_sessions_user_id_time_range (migration 0006), an
+        # exclusion constraint that rejects overlapping sessions of one user
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
@@ -1,5 +1,5 @@
 # app/models/study_topic.py
-from sqlalchemy import Column, String, Float, ForeignKey, Date, Enum, DateTime
+from sqlalchemy import Column, String, Float, Integer, ForeignKey, Date, Enum, DateTime, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.database import Base
@@ -14,6 +14,12 @@ class StudyStatus(enum.Enum):
 
 class StudyTopic(Base):
     __tablename__ = "study_topics"
+    __table_args__ = (
+        Index("ix_study_topics_user_id_next_revision", "user_id", "next_revision"),
+        Index("ix_study_topics_user_id_created_at", "user_id", "created_at"),
+    )
+    # Fetch server-generated values with RETURNING instead of a refresh after commit
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
@@ -24,6 +30,10 @@ class StudyTopic(Base):
     status = Column(Enum(StudyStatus), default=StudyStatus.not_started)
     last_studied = Column(Date, nullable=True)
     next_revision = Column(Date, nullable=True)
+    # Spaced-repetition memory state, updated per session by app.ml.scheduler
+    ease_factor = Column(Float, nullable=False, default=2.5, server_default="2.5")
+    review_interval_days = Column(Float, nullable=False, default=0.0, server_default="0")
+    review_count = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
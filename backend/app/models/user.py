@@ -1,5 +1,5 @@
 # app/models/user.py
-from sqlalchemy import Column, String, DateTime
+from sqlalchemy import Column, String, DateTime, Float
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -8,6 +8,8 @@ from app.database import Base
 
 class User(Base):
     __tablename__ = "users"
+    # Fetch server-generated values with RETURNING instead of a refresh after commit
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String, nullable=False)
@@ -17,6 +19,8 @@ class User(Base):
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     profile_image = Column(String, nullable=True)
     preferences = Column(String, nullable=True)
+    # Scales every revision interval; re-fitted from the user's recall history
+    revision_interval_modifier = Column(Float, nullable=False, default=1.0, server_default="1.0")
 
     quizzes = relationship("Quiz", back_populates="user")
     quiz_attempts = relationship("QuizAttempt", back_populates="user", cascade="all, delete-orphan")
@@ -1,15 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import func
-from app.database import get_db
+from app.database import get_async_db
 from app.models.ai_interaction import AIInteraction
 from app.models.user import User
 from app.schemas.ai_interaction import AIInteractionCreate, AIInteractionResponse
 from app.utils.auth import get_current_user
-from together import Together
+import asyncio
 import logging
 import uuid
-import time
 import os
 
 router = APIRouter(
@@ -23,11 +23,19 @@ logger = logging.getLogger("SmartStudyApp")
 
 # Together AI API configuration - Get from environment variable
 TOGETHER_API_KEY = os.getenv("TOGETHER_API_KEY")
-if not TOGETHER_API_KEY:
-    logger.error("TOGETHER_API_KEY environment variable not set")
-    raise HTTPException(status_code=500, detail="AI service not configured")
 
-client = Together(api_key=TOGETHER_API_KEY)
+_client = None
+
+def get_together_client():
+    """Build the Together client on first use so importing this module stays cheap."""
+    global _client
+    if _client is None:
+        if not TOGETHER_API_KEY:
+            logger.error("TOGETHER_API_KEY environment variable not set")
+            raise HTTPException(status_code=500, detail="AI service not configured")
+        from together import Together
+        _client = Together(api_key=TOGETHER_API_KEY)
+    return _client
 
 # Use only models available on the free tier
 FALLBACK_MODELS = [
@@ -40,7 +48,7 @@ RETRY_DELAY = 5  # Reduced from 2 to 5 seconds
 RATE_LIMIT_WAIT = 15  # Reduced from 30 to 15 seconds
 
 @router.post("/ask", response_model=AIInteractionResponse)
-async def ask_ai_tutor(request: AIInteractionCreate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+async def ask_ai_tutor(request: AIInteractionCreate, db: AsyncSession = Depends(get_async_db), current_user: User = Depends(get_current_user)):
     logger.info(f"AI Tutor request from user ID: {current_user.id} with query: {request.query}")
     
     # Quick responses for simple questions to avoid API calls
@@ -61,8 +69,7 @@ async def ask_ai_tutor(request: AIInteractionCreate, db: Session = Depends(get_d
         created_at=func.now(),
     )
     db.add(db_interaction)
-    db.commit()
-    db.refresh(db_interaction)
+    await db.commit()
     
     logger.info(f"AI interaction stored with ID: {db_interaction.id}")
     return db_interaction
@@ -70,6 +77,7 @@ async def ask_ai_tutor(request: AIInteractionCreate, db: Session = Depends(get_d
 async def generate_ai_response(query: str):
     """Generate AI response with optimized retry logic"""
     ai_response = None
+    client = get_together_client()
     
     # Retry logic with different models
     for attempt in range(MAX_RETRIES):
@@ -78,7 +86,9 @@ async def generate_ai_response(query: str):
             current_model = FALLBACK_MODELS[0]
             logger.info(f"Attempt {attempt + 1}/{MAX_RETRIES} using model: {current_model}")
             
-            response = client.chat.completions.create(
+            # The Together client is synchronous; keep the HTTP call off the event loop
+            response = await run_in_threadpool(
+                client.chat.completions.create,
                 model=current_model,
                 messages=[
                     {"role": "system", "content": "You are a helpful AI tutor for computer science and engineering students. Provide clear, concise explanations with examples when helpful."},
@@ -101,9 +111,9 @@ async def generate_ai_response(query: str):
                 if "rate limit" in error_msg.lower() or "429" in error_msg:
                     wait_time = RATE_LIMIT_WAIT
                     logger.info(f"Rate limit detected, waiting {wait_time} seconds before retry")
-                    time.sleep(wait_time)
+                    await asyncio.sleep(wait_time)
                 else:
-                    time.sleep(RETRY_DELAY)
+                    await asyncio.sleep(RETRY_DELAY)
                 continue
             else:
                 # All attempts failed
@@ -1,9 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models.user import User
 from app.schemas.auth import UserCreate, UserLogin, UserResponse, Token
-from app.utils.auth import hash_password, create_access_token, verify_password
+from app.utils.auth import hash_password_async, create_access_token, verify_password_async
 from app.utils.logging import setup_logging
 from datetime import datetime
 import uuid
@@ -13,10 +14,10 @@ logger = setup_logging()
 router = APIRouter(prefix="/api/auth", tags=["Authentication"])
 
 @router.post("/register", response_model=UserResponse, status_code=201)
-def register(user: UserCreate, db: Session = Depends(get_db)):
+async def register(user: UserCreate, db: Session = Depends(get_db)):
     logger.info(f"Register attempt for email: {user.email}")
     # Check if email already exists
-    existing_user = db.query(User).filter(User.email == user.email).first()
+    existing_user = await run_in_threadpool(lambda: db.query(User).filter(User.email == user.email).first())
     if existing_user:
         logger.warning(f"Registration failed: Email {user.email} already registered")
         raise HTTPException(
@@ -25,7 +26,8 @@ def register(user: UserCreate, db: Session = Depends(get_db)):
         )
     
     # Create new user
-    hashed_password = hash_password(user.password)
+    # Hash in the dedicated password pool; raises 503 when it is saturated
+    hashed_password = await hash_password_async(user.password)
     db_user = User(
         id=str(uuid.uuid4()),
         name=user.name,
@@ -35,8 +37,7 @@ def register(user: UserCreate, db: Session = Depends(get_db)):
         updated_at=datetime.utcnow()
     )
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await run_in_threadpool(db.commit)
     logger.info(f"User registered successfully: {user.email}")
     
     # Convert the SQLAlchemy object to a dict explicitly to ensure serialization
@@ -52,10 +53,10 @@ def register(user: UserCreate, db: Session = Depends(get_db)):
     return user_dict
 
 @router.post("/login", response_model=Token)
-def login(user: UserLogin, db: Session = Depends(get_db)):
+async def login(user: UserLogin, db: Session = Depends(get_db)):
     logger.info(f"Login attempt for email: {user.email}")
-    db_user = db.query(User).filter(User.email == user.email).first()
-    if not db_user or not verify_password(user.password, db_user.password_hash):
+    db_user = await run_in_threadpool(lambda: db.query(User).filter(User.email == user.email).first())
+    if not db_user or not await verify_password_async(user.password, db_user.password_hash):
         logger.warning(f"Login failed for email: {user.email}")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
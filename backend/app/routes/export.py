@@ -0,0 +1,164 @@
+# app/routes/export.py
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from typing import List, Optional
+from datetime import date, datetime, time
+import csv
+import enum
+import io
+import json
+import uuid
+import zlib
+from app.database import ReplicaSessionLocal, SessionLocal
+from app.models.ai_interaction import AIInteraction
+from app.models.quiz_attempt import QuizAttempt
+from app.models.study_session import StudySession
+from app.models.study_topic import StudyTopic
+from app.models.user import User
+from app.utils.auth import get_current_user
+from app.utils.config import EXPORT_CHUNK_SIZE
+from app.utils.logging import setup_logging
+from app.utils.pagination import encode_cursor, parse_cursor
+from app.utils.read_routing import read_router, request_watermark
+
+router = APIRouter(prefix="/api/export", tags=["Export"])
+logger = setup_logging()
+
+# Exported in this order; each resource is read in primary key order so a cursor
+# (resource, id) pins down exactly where an interrupted export stopped
+RESOURCES = {
+    "topics": StudyTopic,
+    "sessions": StudySession,
+    "quiz_attempts": QuizAttempt,
+    "ai_interactions": AIInteraction,
+}
+
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+def _plain(value):
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, enum.Enum):
+        return value.value
+    return value
+
+
+def _columns(model):
+    return [column for column in model.__table__.columns if column.key != "user_id"]
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """True when Accept-Encoding gives gzip (or, failing an explicit entry, `*`) a q-value above 0."""
+    weights = {}
+    for part in accept_encoding.lower().split(","):
+        coding, *params = (item.strip() for item in part.split(";"))
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding:
+            weights[coding] = q
+    q = weights.get("gzip", weights.get("x-gzip", weights.get("*", 0.0)))
+    return q > 0
+
+
+def _export_rows(db, user_id, resources: List[str], after: Optional[list]):
+    """Yield (resource, [(cursor, row), ...]) per chunk of `EXPORT_CHUNK_SIZE` rows."""
+    start = resources.index(after[0]) if after else 0
+    for position, resource in enumerate(resources[start:], start):
+        model = RESOURCES[resource]
+        query = select(*_columns(model)).where(model.user_id == user_id)
+        if after and position == start:
+            query = query.where(model.id > after[1])
+        query = query.order_by(model.id).execution_options(yield_per=EXPORT_CHUNK_SIZE)
+        for chunk in db.execute(query).partitions():
+            yield resource, [(encode_cursor(resource, row.id), row) for row in chunk]
+
+
+def _encode_chunks(db, user_id, resources, after, fmt: str):
+    """Serialized export, one string per fetched chunk."""
+    if fmt == "ndjson":
+        for resource, rows in _export_rows(db, user_id, resources, after):
+            yield "".join(
+                json.dumps({"type": resource, "cursor": cursor, **{k: _plain(v) for k, v in row._mapping.items()}}) + "\n"
+                for cursor, row in rows
+            )
+        return
+
+    header = ["cursor"] + [column.key for column in _columns(RESOURCES[resources[0]])]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if not after:
+        writer.writerow(header)
+    for _, rows in _export_rows(db, user_id, resources, after):
+        writer.writerows([cursor, *(_plain(v) for v in row)] for cursor, row in rows)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+@router.get("")
+def export_study_history(
+    request: Request,
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    resources: Optional[List[str]] = Query(None),
+    cursor: Optional[str] = None,
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Stream the user's whole history as NDJSON (every resource, tagged with `type`) or
+    CSV (one resource per export).
+
+    Every row carries a `cursor`; pass the last one received to resume an interrupted
+    export right after it. Responses are gzip-compressed on the fly when the client
+    sends `Accept-Encoding: gzip`.
+    """
+    resources = resources or list(RESOURCES)
+    unknown = [name for name in resources if name not in RESOURCES]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown resources: {', '.join(unknown)}")
+    if format == "csv" and len(resources) != 1:
+        raise HTTPException(status_code=400, detail="CSV export takes exactly one resource")
+    resources = [name for name in RESOURCES if name in resources]
+
+    after = None
+    if cursor:
+        after = parse_cursor(cursor, (str, uuid.UUID))
+        if after[0] not in resources:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    user_id = current_user.id
+    gzip = _accepts_gzip(request.headers.get("accept-encoding", ""))
+    session_factory = ReplicaSessionLocal if read_router.use_replica(str(user_id), request_watermark(request)) else SessionLocal
+    logger.info(f"Exporting {', '.join(resources)} as {format} for user ID: {user_id}")
+
+    def body():
+        # The session lives as long as the stream, not the request handler
+        with session_factory() as db:
+            compressor = zlib.compressobj(wbits=31) if gzip else None
+            for text in _encode_chunks(db, user_id, resources, after, format):
+                data = text.encode()
+                if compressor is None:
+                    yield data
+                else:
+                    compressed = compressor.compress(data)
+                    if compressed:
+                        yield compressed
+            if compressor is not None:
+                yield compressor.flush()
+
+    filename = f"study-history.{format}" if format == "ndjson" else f"{resources[0]}.csv"
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"', "Vary": "Accept-Encoding"}
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(body(), media_type=MEDIA_TYPES[format], headers=headers)
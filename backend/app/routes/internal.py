@@ -0,0 +1,64 @@
+# app/routes/internal.py
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from datetime import date
+from typing import Optional
+import secrets
+from app.ml.due_revisions import reminder_lines
+from app.ml.revision_model import registry as revision_model_registry
+from app.database import ReplicaSessionLocal, SessionLocal, async_engine, async_replica_engine, engine, replica_engine
+from app.utils.auth import password_pool, user_cache
+from app.utils.config import DB_MAX_OVERFLOW, DB_POOL_SIZE, INTERNAL_API_TOKEN
+from app.utils.db_metrics import pool_stats
+from app.utils.read_routing import read_router
+from app.utils.quiz_catalog import quiz_catalog, quiz_summaries
+from app.utils.study_stats import stats_cache
+
+def require_internal_token(x_internal_token: Optional[str] = Header(default=None)):
+    """Closed unless INTERNAL_API_TOKEN is set and the request sends it."""
+    if not INTERNAL_API_TOKEN:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="INTERNAL_API_TOKEN is not configured")
+    if not secrets.compare_digest(x_internal_token or "", INTERNAL_API_TOKEN):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+
+router = APIRouter(
+    prefix="/api/internal",
+    tags=["internal"],
+    dependencies=[Depends(require_internal_token)],
+    include_in_schema=False,
+)
+
+@router.get("/stats")
+def get_stats():
+    """Per-process runtime counters used to size pools and caches against worker count."""
+    return {
+        "db_pools": {
+            "configured": {"pool_size": DB_POOL_SIZE, "max_overflow": DB_MAX_OVERFLOW},
+            "primary": pool_stats(engine),
+            "primary_async": pool_stats(async_engine.sync_engine),
+            "replica": pool_stats(replica_engine) if replica_engine is not None else None,
+            "replica_async": pool_stats(async_replica_engine.sync_engine) if async_replica_engine is not None else None,
+        },
+        "read_routing": read_router.stats(),
+        "auth_user_cache": user_cache.stats(),
+        "study_stats_cache": stats_cache.stats(),
+        "quiz_catalog": quiz_catalog.stats(),
+        "quiz_summaries": quiz_summaries.stats(),
+        "password_pool": password_pool.stats(),
+        "revision_model": revision_model_registry.info(),
+    }
+
+@router.get("/revisions/due")
+def stream_due_revisions(
+    due_before: Optional[date] = None,
+    due_from: Optional[date] = None,
+    chunk_size: int = Query(10000, ge=100, le=100000),
+):
+    """Nightly reminder feed: every user's due topics as NDJSON, streamed from a server-side cursor."""
+    due_before = due_before or date.today()
+
+    def lines():
+        with (ReplicaSessionLocal or SessionLocal)() as db:
+            yield from reminder_lines(db, due_before, due_from, chunk_size)
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
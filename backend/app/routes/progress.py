@@ -0,0 +1,58 @@
+# app/routes/progress.py
+from fastapi import APIRouter, Depends
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from typing import Optional
+from app.models.progress import Progress
+from app.models.user import User
+from app.schemas.progress import ProgressResponse
+from app.utils.auth import get_current_user
+from app.utils.logging import setup_logging
+from app.utils.progress import TOTALS, percentage
+from app.utils.read_routing import get_read_db
+
+router = APIRouter(prefix="/api/progress", tags=["Progress"])
+logger = setup_logging()
+
+@router.get("", response_model=ProgressResponse)
+def get_progress(
+    subject: Optional[str] = None,
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Progress per subject and topic, read from the incrementally maintained progress
+    table with one lookup on ix_progress_user_id_subject_topic. Subject figures are
+    rolled up from the topic rows with the same formula.
+    """
+    logger.info(f"Fetching progress for user ID: {current_user.id}")
+    query = select(Progress).where(Progress.user_id == current_user.id)
+    if subject is not None:
+        query = query.where(Progress.subject == subject)
+    rows = db.execute(query.order_by(Progress.subject, Progress.topic)).scalars().all()
+
+    subjects = {}
+    for row in rows:
+        subjects.setdefault(row.subject, []).append(row)
+    result = []
+    for name, topic_rows in subjects.items():
+        totals = [sum(getattr(row, column) for row in topic_rows) for column in TOTALS]
+        result.append({
+            "subject": name,
+            "progress_percentage": percentage(*totals),
+            "studied_hours": totals[0],
+            "target_hours": totals[1],
+            "quiz_attempts": totals[2],
+            "topics": [
+                {
+                    "topic": row.topic,
+                    "progress_percentage": row.progress_percentage,
+                    "studied_hours": row.studied_hours,
+                    "target_hours": row.target_hours,
+                    "quiz_attempts": row.quiz_attempts,
+                    "average_quiz_score": row.quiz_score_total / row.quiz_attempts if row.quiz_attempts else None,
+                }
+                for row in topic_rows
+            ],
+        })
+    return {"subjects": result}
@@ -1,16 +1,21 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from app.database import get_db
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
 from app.models.quiz import Quiz
 from app.models.quiz_attempt import QuizAttempt
 from app.models.user import User
-from app.schemas.quizzes import QuizCreate, QuizResponse
+from app.schemas.quizzes import QuizCreate, QuizResponse, QuizSummary
 from app.schemas.quiz_attempt import QuizAttemptCreate, QuizAttemptResponse
 from app.utils.auth import get_current_user
+from app.utils.etags import etag_matches, make_etag, not_modified, set_etag
+from app.utils.progress import ProgressDelta, progress_key, progress_upsert
+from app.utils.quiz_catalog import bump_catalog_version, load_overlay, quiz_catalog, quiz_summaries, with_attempt
+from app.utils.read_routing import get_async_read_db
 import logging
 from datetime import datetime
 import uuid
-from typing import List
+from typing import List, Literal, Optional, Union
 
 router = APIRouter(
     prefix="/api/quizzes",
@@ -24,39 +29,73 @@ logger = logging.getLogger("SmartStudyApp")
 # Default user ID for shared quizzes (same as in populate_mock_tests.py)
 DEFAULT_USER_ID = "026bbd66-baec-4d36-b9cf-a98695a672b9"
 
-@router.get("/", response_model=List[QuizResponse])
-async def get_quizzes(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    logger.info(f"Fetching quizzes for user ID: {current_user.id}")
-    # Fetch global quizzes for the default user
-    quizzes = db.query(Quiz).filter(Quiz.user_id == DEFAULT_USER_ID).all()
-    
-    # Fetch the current user's attempts for these quizzes
-    quiz_attempts = db.query(QuizAttempt).filter(
-        QuizAttempt.user_id == current_user.id,
-        QuizAttempt.quiz_id.in_([quiz.id for quiz in quizzes])
-    ).all()
-    
-    # Map attempts to a dictionary for quick lookup
-    attempt_map = {attempt.quiz_id: attempt for attempt in quiz_attempts}
-    
-    # Update quizzes with user-specific attempt data
-    for quiz in quizzes:
-        attempt = attempt_map.get(quiz.id)
-        if attempt:
-            quiz.status = attempt.status
-            quiz.score = attempt.score
-            quiz.last_attempt = attempt.completed_at
-    
-    return quizzes
+async def _get_shared_quiz(db: AsyncSession, quiz_id: str):
+    result = await db.execute(
+        select(Quiz).where(Quiz.id == quiz_id, Quiz.user_id == DEFAULT_USER_ID).limit(1)
+    )
+    return result.scalars().first()
+
+async def _get_user_attempt(db: AsyncSession, user_id, quiz_id: str):
+    result = await db.execute(
+        select(QuizAttempt).where(
+            QuizAttempt.user_id == user_id,
+            QuizAttempt.quiz_id == quiz_id
+        ).limit(1)
+    )
+    return result.scalars().first()
+
+async def _add_completed_attempt_progress(db: AsyncSession, user_id, quiz: Quiz, attempt: QuizAttemptCreate):
+    """Count an attempt that is now completed towards the user's progress on the quiz's subject and topic."""
+    if attempt.status != "completed" or attempt.score is None or not quiz.subject:
+        return
+    await db.execute(progress_upsert(db, user_id, {
+        progress_key(quiz.subject, quiz.topic): ProgressDelta(quiz_attempts=1, quiz_score_total=attempt.score)
+    }))
+
+def _quizzes_etag(view: str, version, attempts) -> Optional[str]:
+    """Catalog version plus the user's attempt state; None without a version row, as nothing then tracks catalog changes."""
+    if version is None:
+        return None
+    return make_etag(view, version, sorted(
+        (quiz_id, attempt.status, attempt.score, attempt.completed_at) for quiz_id, attempt in attempts.items()
+    ))
+
+@router.get("/", response_model=Union[List[QuizResponse], List[QuizSummary]])
+async def get_quizzes(
+    view: Literal["full", "summary"] = Query("full", description="summary leaves out the questions"),
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    logger.info(f"Fetching quizzes ({view}) for user ID: {current_user.id}")
+    # One query for the catalog version and this user's attempts; the catalog itself is cached
+    version, attempts = await load_overlay(db, current_user.id)
+    etag = _quizzes_etag(view, version, attempts)
+    if etag and etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    catalog = await (quiz_summaries if view == "summary" else quiz_catalog).get(db, DEFAULT_USER_ID, version)
+
+    # Quizzes without an attempt reuse their cached JSON, so the body is assembled here
+    body = b",".join(
+        with_attempt(quiz, attempts[quiz.id]).model_dump_json(by_alias=True).encode() if quiz.id in attempts
+        else catalog.encoded[quiz.id]
+        for quiz in catalog.quizzes
+    )
+    response = Response(content=b"[" + body + b"]", media_type="application/json")
+    if etag:
+        set_etag(response, etag)
+    return response
 
 @router.post("/", response_model=QuizResponse)
-async def create_quiz(quiz: QuizCreate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+async def create_quiz(quiz: QuizCreate, db: AsyncSession = Depends(get_async_db), current_user: User = Depends(get_current_user)):
     logger.info(f"Creating quiz for user ID: {current_user.id}")
     # Check for existing quiz with the same title
-    existing_quiz = db.query(Quiz).filter(
-        Quiz.user_id == current_user.id,
-        Quiz.title == quiz.title
-    ).first()
+    existing_quiz = (await db.execute(
+        select(Quiz).where(
+            Quiz.user_id == current_user.id,
+            Quiz.title == quiz.title
+        ).limit(1)
+    )).scalars().first()
     if existing_quiz:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -76,48 +115,53 @@ async def create_quiz(quiz: QuizCreate, db: Session = Depends(get_db), current_u
         difficulty=quiz.difficulty,
         questions=questions_dict,  # Use the list of dictionaries
         time_limit=quiz.time_limit,
-        status="not-started"
+        status="not-started",
+        updated_at=None,  # Set explicitly so the ORM does not re-select it after the INSERT
     )
     db.add(db_quiz)
-    db.commit()
-    db.refresh(db_quiz)
+    if str(current_user.id) == DEFAULT_USER_ID:
+        # A new catalog quiz: every worker reloads its cached catalog on its next read
+        await db.execute(bump_catalog_version())
+    await db.commit()
     logger.info(f"Quiz created with ID: {db_quiz.id}")
     return db_quiz
 
 @router.get("/{quiz_id}", response_model=QuizResponse)
-async def get_quiz(quiz_id: str, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+async def get_quiz(
+    quiz_id: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(get_current_user)
+):
     logger.info(f"Fetching quiz ID: {quiz_id} for user ID: {current_user.id}")
-    # Fetch quiz for the default user
-    db_quiz = db.query(Quiz).filter(Quiz.id == quiz_id, Quiz.user_id == DEFAULT_USER_ID).first()
+    try:
+        quiz_id = str(uuid.UUID(quiz_id))
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Quiz not found")
+    version, attempts = await load_overlay(db, current_user.id, quiz_id)
+    etag = _quizzes_etag(quiz_id, version, attempts)
+    if etag and etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    db_quiz = (await quiz_catalog.get(db, DEFAULT_USER_ID, version)).by_id.get(quiz_id)
     if not db_quiz:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Quiz not found")
-    
-    # Fetch the current user's attempt for this quiz
-    attempt = db.query(QuizAttempt).filter(
-        QuizAttempt.user_id == current_user.id,
-        QuizAttempt.quiz_id == quiz_id
-    ).first()
-    
-    if attempt:
-        db_quiz.status = attempt.status
-        db_quiz.score = attempt.score
-        db_quiz.last_attempt = attempt.completed_at
-    
-    return db_quiz
+
+    if etag:
+        set_etag(response, etag)
+    attempt = attempts.get(quiz_id)
+    return with_attempt(db_quiz, attempt) if attempt else db_quiz
 
 @router.post("/{quiz_id}/attempt", response_model=QuizAttemptResponse)
-async def start_quiz_attempt(quiz_id: str, attempt: QuizAttemptCreate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+async def start_quiz_attempt(quiz_id: str, attempt: QuizAttemptCreate, db: AsyncSession = Depends(get_async_db), current_user: User = Depends(get_current_user)):
     logger.info(f"Starting quiz attempt for quiz ID: {quiz_id} by user ID: {current_user.id}")
     # Verify the quiz exists
-    db_quiz = db.query(Quiz).filter(Quiz.id == quiz_id, Quiz.user_id == DEFAULT_USER_ID).first()
+    db_quiz = await _get_shared_quiz(db, quiz_id)
     if not db_quiz:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Quiz not found")
     
     # Check if an attempt already exists
-    existing_attempt = db.query(QuizAttempt).filter(
-        QuizAttempt.user_id == current_user.id,
-        QuizAttempt.quiz_id == quiz_id
-    ).first()
+    existing_attempt = await _get_user_attempt(db, current_user.id, quiz_id)
     
     if existing_attempt:
         # Update the existing attempt if it's not completed
@@ -125,8 +169,8 @@ async def start_quiz_attempt(quiz_id: str, attempt: QuizAttemptCreate, db: Sessi
             existing_attempt.status = attempt.status
             existing_attempt.score = attempt.score
             existing_attempt.completed_at = attempt.completed_at
-            db.commit()
-            db.refresh(existing_attempt)
+            await _add_completed_attempt_progress(db, current_user.id, db_quiz, attempt)
+            await db.commit()
             return existing_attempt
         else:
             # If completed, create a new attempt (for retake)
@@ -140,8 +184,8 @@ async def start_quiz_attempt(quiz_id: str, attempt: QuizAttemptCreate, db: Sessi
                 completed_at=attempt.completed_at
             )
             db.add(db_attempt)
-            db.commit()
-            db.refresh(db_attempt)
+            await _add_completed_attempt_progress(db, current_user.id, db_quiz, attempt)
+            await db.commit()
             return db_attempt
     
     # Create a new attempt
@@ -155,7 +199,7 @@ async def start_quiz_attempt(quiz_id: str, attempt: QuizAttemptCreate, db: Sessi
         completed_at=attempt.completed_at
     )
     db.add(db_attempt)
-    db.commit()
-    db.refresh(db_attempt)
+    await _add_completed_attempt_progress(db, current_user.id, db_quiz, attempt)
+    await db.commit()
     logger.info(f"Quiz attempt created with ID: {db_attempt.id}")
     return db_attempt
\ No newline at end of file
@@ -1,22 +1,39 @@
 # app/routes/study_plan.py
-from fastapi import APIRouter, Depends, HTTPException
-from app.schemas.study_plan import StudySessionCreate, StudySessionResponse, StudyTopicCreate, StudyTopicResponse, StudySessionWithTopicResponse
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
+from app.schemas.study_plan import DueRevisionsPage, FreeSlot, StudyPlanRequest, StudyPlanResponse, StudySessionBulkCreate, StudySessionBulkResponse, StudySessionCreate, StudySessionResponse, StudyStatsResponse, StudyTopicCreate, StudyTopicResponse, StudySessionWithTopicResponse
 from app.models.study_session import StudySession
-from app.models.study_topic import StudyTopic
+from app.models.study_topic import StudyStatus, StudyTopic
 from app.utils.auth import get_current_user
+from app.utils.etags import etag_matches, not_modified, set_etag, watermark_etag
 from app.database import get_db
+from app.utils.read_routing import get_read_db
 from app.models.user import User
+from sqlalchemy import bindparam, case, func, insert, literal, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+import math
 import uuid
-from datetime import datetime, timedelta
+from datetime import date, datetime, time, timedelta
 from app.utils.logging import setup_logging
 from datetime import datetime as dt
-from typing import List
-from app.ml.revision_model import predict_next_revision, calculate_duration
+from typing import List, Optional
+from app.ml.revision_model import calculate_duration, durations_in_minutes, predict_next_revision, predict_next_revision_batch
+from app.ml.scheduler import MemoryState, review
+from app.ml.due_revisions import due_topics_query
+from app.ml.study_planner import DEFAULT_PRIORITY, PRIORITY_WEIGHTS, REVISION, PlanTask, plan_sessions, split_into_blocks, weekly_windows
+from app.utils.study_stats import duration_seconds, get_study_stats, mark_stats_dirty
+from app.utils.progress import ProgressDelta, apply_progress_deltas, progress_key
+from app.utils.pagination import NEXT_CURSOR_HEADER, encode_cursor, keyset_after, parse_cursor
+from app.utils.config import FREE_SLOTS_MAX_DAYS, PLAN_MAX_DAYS
+from app.utils.timeslots import OVERLAP_CONSTRAINT, IntervalIndex, busy_intervals, day_windows, free_slots, overlaps_existing, session_interval
 
 router = APIRouter(prefix="/api/study-plan", tags=["Study Plan"])
 logger = setup_logging()
 
+# Keyset pagination order for the listings (ASC NULLS LAST, matching the indexes)
+TOPIC_SORT_KEY = (StudyTopic.created_at, StudyTopic.id)
+SESSION_SORT_KEY = (StudySession.date, StudySession.start_time, StudySession.id)
+
 # Study Topic Endpoints
 @router.post("/topics", response_model=StudyTopicResponse, status_code=201)
 def create_study_topic(
@@ -38,8 +55,10 @@ def create_study_topic(
     
     try:
         db.add(db_topic)
+        apply_progress_deltas(db, current_user.id, {
+            progress_key(db_topic.subject, db_topic.title): ProgressDelta(target_hours=db_topic.estimated_hours)
+        })
         db.commit()
-        db.refresh(db_topic)
         logger.info(f"Study topic created with ID: {db_topic.id}")
         return db_topic  # Pydantic model handles serialization
     except Exception as e:
@@ -49,18 +68,155 @@ def create_study_topic(
 
 @router.get("/topics", response_model=List[StudyTopicResponse])
 def get_study_topics(
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
-    skip: int = 0,
-    limit: int = 100
+    subject: Optional[str] = None,
+    cursor: Optional[str] = None,
+    skip: int = Query(0, ge=0, deprecated=True),
+    limit: int = Query(100, ge=1, le=500)
 ):
+    """Topics oldest first by (created_at, id); the next page's cursor is in the X-Next-Cursor header."""
     logger.info(f"Fetching study topics for user ID: {current_user.id}")
-    study_topics = db.query(StudyTopic).filter(
-        StudyTopic.user_id == current_user.id
-    ).offset(skip).limit(limit).all()
+    etag = watermark_etag(db, StudyTopic, current_user.id, str(request.query_params))
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+    query = db.query(StudyTopic).filter(StudyTopic.user_id == current_user.id)
+    if subject is not None:
+        query = query.filter(StudyTopic.subject == subject)
+    if cursor:
+        after = parse_cursor(cursor, (datetime.fromisoformat, uuid.UUID))
+        query = query.filter(keyset_after(TOPIC_SORT_KEY, after))
+    study_topics = query.order_by(*(c.asc().nulls_last() for c in TOPIC_SORT_KEY)).offset(skip).limit(limit + 1).all()
+
+    if len(study_topics) > limit:
+        study_topics = study_topics[:limit]
+        last = study_topics[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last.created_at, last.id)
     return study_topics  # Pydantic model handles serialization
 
+@router.get("/stats", response_model=StudyStatsResponse)
+def get_stats(
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Study hours per subject, week and topic, computed in SQL and cached per user until their sessions change."""
+    logger.info(f"Fetching study stats for user ID: {current_user.id}")
+    return get_study_stats(db, current_user.id, date_from, date_to)
+
+@router.get("/revisions/due", response_model=DueRevisionsPage)
+def get_due_revisions(
+    due_before: Optional[date] = None,
+    due_from: Optional[date] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Topics due for revision by `due_before` (default today), oldest first, keyset-paginated."""
+    due_before = due_before or date.today()
+    after = parse_cursor(cursor, (date.fromisoformat, uuid.UUID)) if cursor else None
+
+    topics = db.scalars(due_topics_query(current_user.id, due_before, due_from, after, limit + 1)).all()
+    next_cursor = None
+    if len(topics) > limit:
+        topics = topics[:limit]
+        next_cursor = encode_cursor(topics[-1].next_revision.isoformat(), topics[-1].id)
+    return {"items": topics, "next_cursor": next_cursor}
+
 # Study Session Endpoints
+# One topic's new reviews, applied on top of the current row. Hours and status are
+# SQL expressions, so concurrent writers add up instead of overwriting each other.
+_NEW_HOURS = StudyTopic.actual_hours + bindparam("minutes") / 60
+TOPIC_REVIEW_UPDATE = (
+    update(StudyTopic)
+    .where(StudyTopic.id == bindparam("topic_id"))
+    .values(
+        actual_hours=_NEW_HOURS,
+        status=case(
+            (_NEW_HOURS >= StudyTopic.estimated_hours, literal(StudyStatus.completed, StudyTopic.status.type)),
+            else_=literal(StudyStatus.in_progress, StudyTopic.status.type),
+        ),
+        ease_factor=bindparam("new_ease_factor"),
+        review_interval_days=bindparam("new_review_interval_days"),
+        review_count=bindparam("new_review_count"),
+        last_studied=bindparam("new_last_studied"),
+        next_revision=bindparam("new_next_revision"),
+        updated_at=bindparam("new_updated_at"),
+    )
+)
+
+def _review_params(study_topic: StudyTopic, reviews, interval_modifier: float) -> dict:
+    """
+    Fold rated sessions, in chronological order, into the topic's revision schedule.
+
+    Each review is (date, duration_minutes, comprehension_level, first_interval_days).
+    Sessions dated before the topic's last_studied (imported history) only add their
+    hours; the schedule never moves backwards. Returns the parameters of
+    TOPIC_REVIEW_UPDATE for this topic.
+    """
+    state = MemoryState(study_topic.ease_factor, study_topic.review_interval_days, study_topic.review_count)
+    last_studied, next_revision = study_topic.last_studied, study_topic.next_revision
+    minutes = 0.0
+    for date_obj, duration, comprehension_level, first_interval in reviews:
+        minutes += duration
+        if date_obj is not None and last_studied is not None and date_obj < last_studied:
+            continue
+        state = review(state, comprehension_level, first_interval_days=first_interval, interval_modifier=interval_modifier)
+        last_studied = date_obj
+        next_revision = date_obj + timedelta(days=round(state.interval_days))
+    return {
+        "topic_id": study_topic.id,
+        "minutes": minutes,
+        "new_ease_factor": state.ease_factor,
+        "new_review_interval_days": state.interval_days,
+        "new_review_count": state.review_count,
+        "new_last_studied": last_studied,
+        "new_next_revision": next_revision,
+        "new_updated_at": datetime.utcnow(),
+    }
+
+def _parse_session_fields(session: StudySessionCreate):
+    """Parse the 'YYYY-MM-DD' date and 'HH:MM:SS' times of a session payload; raises ValueError."""
+    date_obj = dt.strptime(session.date, '%Y-%m-%d').date() if session.date else None
+    start_time_obj = dt.strptime(session.start_time, '%H:%M:%S').time() if session.start_time else None
+    end_time_obj = dt.strptime(session.end_time, '%H:%M:%S').time() if session.end_time else None
+    return date_obj, start_time_obj, end_time_obj
+
+def _is_overlap_violation(e: IntegrityError) -> bool:
+    """The Postgres exclusion constraint caught an overlap that raced past the pre-check."""
+    return OVERLAP_CONSTRAINT in str(e.orig)
+
+def _overlap_errors(db: Session, user_id, scheduled) -> dict:
+    """
+    Bulk items that would double-book the user, as {index: error}.
+
+    `scheduled` is [(index, interval)]. Items are checked against the user's sessions
+    in the batch's date range, then swept in start order against the items accepted
+    before them, so the cost is O(n log n) in batch size plus existing sessions.
+    """
+    scheduled = sorted((interval, index) for index, interval in scheduled if interval)
+    if not scheduled:
+        return {}
+    existing = IntervalIndex(busy_intervals(
+        db, user_id, scheduled[0][0][0].date(), max(end for (_, end), _ in scheduled).date()
+    ))
+    errors, batch_end = {}, None
+    for (start, end), index in scheduled:
+        if existing.overlaps(start, end):
+            errors[index] = "Overlaps an existing study session"
+        elif start < end:
+            if batch_end is not None and start < batch_end:
+                errors[index] = "Overlaps another session in this batch"
+            else:
+                batch_end = end if batch_end is None else max(batch_end, end)
+    return errors
+
 @router.post("/sessions", response_model=StudySessionWithTopicResponse, status_code=201)
 def create_study_session(
     session: StudySessionCreate,
@@ -73,25 +229,18 @@ def create_study_session(
     # Validate topic_id if provided
     study_topic = None
     if topic_id:
+        # Row lock: concurrent sessions on one topic apply their reviews one after another
         study_topic = db.query(StudyTopic).filter(
             StudyTopic.id == topic_id,
             StudyTopic.user_id == current_user.id
-        ).first()
+        ).with_for_update().first()
         if not study_topic:
             raise HTTPException(status_code=404, detail="Study topic not found")
 
     # Manually parse date, start_time, and end_time
-    date_obj = None
-    if session.date:
-        date_obj = dt.strptime(session.date, '%Y-%m-%d').date()
-    
-    start_time_obj = None
-    if session.start_time:
-        start_time_obj = dt.strptime(session.start_time, '%H:%M:%S').time()
-    
-    end_time_obj = None
-    if session.end_time:
-        end_time_obj = dt.strptime(session.end_time, '%H:%M:%S').time()
+    date_obj, start_time_obj, end_time_obj = _parse_session_fields(session)
+    if overlaps_existing(db, current_user.id, session_interval(date_obj, start_time_obj, end_time_obj)):
+        raise HTTPException(status_code=409, detail="Study session overlaps an existing session")
 
     # Calculate duration
     duration = 0.0
@@ -119,82 +268,355 @@ def create_study_session(
     
     try:
         db.add(db_session)
-        # Update the study topic with ML-based next_revision
+        # Advance the topic's spaced-repetition state and schedule its next revision
         if study_topic and session.comprehension_level and duration > 0:
-            study_topic.actual_hours += duration / 60
-            study_topic.last_studied = date_obj
-            study_topic.status = "completed" if study_topic.actual_hours >= study_topic.estimated_hours else "in-progress"
-            revision_days = predict_next_revision(session.comprehension_level, duration)
-            study_topic.next_revision = date_obj + timedelta(days=revision_days)
+            first_interval = predict_next_revision(session.comprehension_level, duration)
+            params = _review_params(study_topic, [(date_obj, duration, session.comprehension_level, first_interval)],
+                                    current_user.revision_interval_modifier)
+            # The updated row comes back through RETURNING into study_topic
+            db.execute(TOPIC_REVIEW_UPDATE.returning(StudyTopic).execution_options(populate_existing=True), params).all()
+            apply_progress_deltas(db, current_user.id, {
+                progress_key(study_topic.subject, study_topic.title): ProgressDelta(studied_hours=params["minutes"] / 60)
+            })
         db.commit()
-        db.refresh(db_session)
-        if study_topic:
-            db.refresh(study_topic)
         logger.info(f"Study session created with ID: {db_session.id}")
         
-        # Manually serialize session to ensure date, start_time, and end_time are strings
-        session_response = {
-            "id": db_session.id,
-            "user_id": db_session.user_id,
-            "topic_id": db_session.topic_id,
-            "title": db_session.title,
-            "date": db_session.date.strftime('%Y-%m-%d') if db_session.date else None,
-            "start_time": db_session.start_time.strftime('%H:%M:%S') if db_session.start_time else None,
-            "end_time": db_session.end_time.strftime('%H:%M:%S') if db_session.end_time else None,
-            "subject": db_session.subject,
-            "topic": db_session.topic,
-            "priority": db_session.priority,
-            "completed": db_session.completed,
-            "comprehension_level": db_session.comprehension_level,
-            "notes": db_session.notes,
-            "created_at": db_session.created_at,
-            "updated_at": db_session.updated_at
-        }
-        
         # Return session and updated topic
-        response = {
-            "session": session_response,
-            "topic": study_topic if topic_id else None
-        }
-        return response
+        return {"session": db_session, "topic": study_topic}
+    except IntegrityError as e:
+        db.rollback()
+        if _is_overlap_violation(e):
+            raise HTTPException(status_code=409, detail="Study session overlaps an existing session")
+        logger.error(f"Error creating study session: {str(e)}")
+        raise HTTPException(status_code=500, detail="Could not create study session")
     except Exception as e:
         logger.error(f"Error creating study session: {str(e)}")
         db.rollback()
         raise HTTPException(status_code=500, detail="Could not create study session")
 
+@router.post("/sessions/bulk", response_model=StudySessionBulkResponse, status_code=201)
+def create_study_sessions_bulk(
+    payload: StudySessionBulkCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Import many sessions in one transaction.
+
+    Items that fail validation or would overlap another session are reported in
+    `results` and skipped; the rest are inserted with one bulk INSERT, and each
+    touched topic gets a single update that folds in all of its new rated sessions
+    in chronological order.
+    """
+    logger.info(f"Bulk creating {len(payload.sessions)} study sessions for user ID: {current_user.id}")
+
+    topic_ids = {item.topic_id for item in payload.sessions if item.topic_id}
+    topics = {}
+    if topic_ids:
+        topics = {
+            topic.id: topic
+            for topic in db.query(StudyTopic).filter(
+                StudyTopic.id.in_(topic_ids),
+                StudyTopic.user_id == current_user.id
+            ).order_by(StudyTopic.id).with_for_update()
+        }
+
+    now = datetime.utcnow()
+    errors, parsed = {}, []
+    for index, item in enumerate(payload.sessions):
+        if item.topic_id and item.topic_id not in topics:
+            errors[index] = "Study topic not found"
+            continue
+        if item.comprehension_level is not None and not 1 <= item.comprehension_level <= 5:
+            errors[index] = "comprehension_level must be between 1 and 5"
+            continue
+        try:
+            parsed.append((index, item, *_parse_session_fields(item)))
+        except ValueError as e:
+            errors[index] = str(e)
+    errors.update(_overlap_errors(db, current_user.id, [
+        (index, session_interval(date_obj, start_time_obj, end_time_obj))
+        for index, _, date_obj, start_time_obj, end_time_obj in parsed
+    ]))
+
+    results = [{"index": index, "error": error} for index, error in errors.items()]
+    rows, rated = [], []
+    for index, item, date_obj, start_time_obj, end_time_obj in parsed:
+        if index in errors:
+            continue
+        session_id = uuid.uuid4()
+        results.append({"index": index, "id": session_id})
+        rows.append({
+            "id": session_id,
+            "user_id": current_user.id,
+            "topic_id": item.topic_id,
+            "title": item.title,
+            "date": date_obj,
+            "start_time": start_time_obj,
+            "end_time": end_time_obj,
+            "subject": item.subject,
+            "topic": item.topic,
+            "priority": item.priority,
+            "completed": item.completed,
+            "comprehension_level": item.comprehension_level,
+            "notes": item.notes,
+            "created_at": now,
+            "updated_at": now,
+        })
+        if item.topic_id and item.comprehension_level and date_obj and start_time_obj and end_time_obj:
+            rated.append((item.topic_id, date_obj, start_time_obj, end_time_obj, item.comprehension_level))
+    results.sort(key=lambda r: r["index"])
+
+    # One vectorized model call for every rated session in the batch
+    reviews_by_topic = {}
+    if rated:
+        durations = durations_in_minutes([r[2] for r in rated], [r[3] for r in rated])
+        first_intervals = predict_next_revision_batch([r[4] for r in rated], durations)
+        for (topic_id, date_obj, start_time_obj, _, level), duration, first_interval in zip(rated, durations, first_intervals):
+            if duration > 0:
+                reviews_by_topic.setdefault(topic_id, []).append(
+                    (date_obj, start_time_obj, float(duration), level, int(first_interval))
+                )
+
+    try:
+        if rows:
+            db.execute(insert(StudySession), rows)
+            mark_stats_dirty(db, current_user.id)
+        topic_params, progress_deltas = [], {}
+        for topic_id, reviews in reviews_by_topic.items():
+            reviews.sort(key=lambda r: (r[0], r[1]))
+            params = _review_params(topics[topic_id], [(d, minutes, level, first) for d, _, minutes, level, first in reviews],
+                                    current_user.revision_interval_modifier)
+            topic_params.append(params)
+            key = progress_key(topics[topic_id].subject, topics[topic_id].title)
+            progress_deltas[key] = ProgressDelta(
+                studied_hours=progress_deltas.get(key, ProgressDelta()).studied_hours + params["minutes"] / 60
+            )
+        if topic_params:
+            # executemany on the connection: one statement for every touched topic
+            db.connection().execute(TOPIC_REVIEW_UPDATE, topic_params)
+            apply_progress_deltas(db, current_user.id, progress_deltas)
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        if _is_overlap_violation(e):
+            raise HTTPException(status_code=409, detail="Study sessions overlap a session created concurrently")
+        logger.error(f"Error bulk creating study sessions: {str(e)}")
+        raise HTTPException(status_code=500, detail="Could not create study sessions")
+    except Exception as e:
+        logger.error(f"Error bulk creating study sessions: {str(e)}")
+        db.rollback()
+        raise HTTPException(status_code=500, detail="Could not create study sessions")
+
+    logger.info(f"Bulk created {len(rows)} study sessions, updated {len(reviews_by_topic)} topics")
+    return {
+        "created": len(rows),
+        "failed": len(results) - len(rows),
+        "topics_updated": len(reviews_by_topic),
+        "results": results,
+    }
+
 @router.get("/sessions", response_model=List[StudySessionResponse])
 def get_study_sessions(
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
-    skip: int = 0,
-    limit: int = 100
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    subject: Optional[str] = None,
+    completed: Optional[bool] = None,
+    topic_id: Optional[uuid.UUID] = None,
+    cursor: Optional[str] = None,
+    skip: int = Query(0, ge=0, deprecated=True),
+    limit: int = Query(100, ge=1, le=500)
 ):
+    """
+    Sessions in calendar order by (date, start_time, id), filtered server-side.
+
+    `date_from`/`date_to` are inclusive. The next page's cursor is in the
+    X-Next-Cursor header and is absent on the last page.
+    """
     logger.info(f"Fetching study sessions for user ID: {current_user.id}")
-    study_sessions = db.query(StudySession).filter(
-        StudySession.user_id == current_user.id
-    ).offset(skip).limit(limit).all()
-    
-    # Manually serialize each session
-    return [
-        {
-            "id": session.id,
-            "user_id": session.user_id,
-            "topic_id": session.topic_id,
-            "title": session.title,
-            "date": session.date.strftime('%Y-%m-%d') if session.date else None,
-            "start_time": session.start_time.strftime('%H:%M:%S') if session.start_time else None,
-            "end_time": session.end_time.strftime('%H:%M:%S') if session.end_time else None,
-            "subject": session.subject,
-            "topic": session.topic,
-            "priority": session.priority,
-            "completed": session.completed,
-            "comprehension_level": session.comprehension_level,
-            "notes": session.notes,
-            "created_at": session.created_at,
-            "updated_at": session.updated_at
-        }
-        for session in study_sessions
-    ]
+    etag = watermark_etag(db, StudySession, current_user.id, str(request.query_params))
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+    query = db.query(StudySession).filter(StudySession.user_id == current_user.id)
+    if date_from is not None:
+        query = query.filter(StudySession.date >= date_from)
+    if date_to is not None:
+        query = query.filter(StudySession.date <= date_to)
+    if subject is not None:
+        query = query.filter(StudySession.subject == subject)
+    if completed is not None:
+        query = query.filter(StudySession.completed == completed)
+    if topic_id is not None:
+        query = query.filter(StudySession.topic_id == topic_id)
+    if cursor:
+        after = parse_cursor(cursor, (date.fromisoformat, time.fromisoformat, uuid.UUID))
+        query = query.filter(keyset_after(SESSION_SORT_KEY, after))
+    study_sessions = query.order_by(*(c.asc().nulls_last() for c in SESSION_SORT_KEY)).offset(skip).limit(limit + 1).all()
+
+    if len(study_sessions) > limit:
+        study_sessions = study_sessions[:limit]
+        last = study_sessions[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last.date, last.start_time, last.id)
+
+    return study_sessions
+
+@router.get("/free-slots", response_model=List[FreeSlot])
+def get_free_slots(
+    date_from: date,
+    date_to: date,
+    day_start: time = time(0),
+    day_end: Optional[time] = None,
+    min_minutes: int = Query(0, ge=0),
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Open windows between the user's sessions from `date_from` to `date_to` (inclusive).
+
+    Each day contributes its [day_start, day_end) window, the whole day by default.
+    Sessions come back from the index already in start order and are subtracted
+    from the windows in one pass.
+    """
+    logger.info(f"Fetching free slots for user ID: {current_user.id}")
+    if date_to < date_from:
+        raise HTTPException(status_code=400, detail="date_to must not be before date_from")
+    if (date_to - date_from).days >= FREE_SLOTS_MAX_DAYS:
+        raise HTTPException(status_code=400, detail=f"Date range is limited to {FREE_SLOTS_MAX_DAYS} days")
+    if day_end is not None and day_end <= day_start:
+        raise HTTPException(status_code=400, detail="day_end must be after day_start")
+
+    slots = free_slots(
+        busy_intervals(db, current_user.id, date_from, date_to),
+        day_windows(date_from, date_to, day_start, day_end),
+        timedelta(minutes=min_minutes),
+    )
+    return [{"start": start, "end": end, "minutes": (end - start).total_seconds() / 60} for start, end in slots]
+
+@router.post("/generate", response_model=StudyPlanResponse, status_code=201)
+def generate_study_plan(
+    request: StudyPlanRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Schedule sessions for the remaining hours and due revisions of every topic until the exam.
+
+    Weekly availability minus the user's existing sessions is cut into blocks of
+    `session_minutes`, filled by app.ml.study_planner and written with one bulk INSERT.
+    Sessions already planned for a topic count against its remaining hours, so running
+    this again only schedules what is missing. Work that does not fit before the exam
+    is reported in `unscheduled`.
+    """
+    logger.info(f"Generating study plan for user ID: {current_user.id}")
+    first_day = request.start_date or date.today()
+    last_day = request.exam_date - timedelta(days=1)
+    if last_day < first_day:
+        raise HTTPException(status_code=400, detail="exam_date must be after start_date")
+    if (last_day - first_day).days >= PLAN_MAX_DAYS:
+        raise HTTPException(status_code=400, detail=f"Plans are limited to {PLAN_MAX_DAYS} days")
+    if any(window.end_time <= window.start_time for window in request.availability):
+        raise HTTPException(status_code=400, detail="Each availability window must end after it starts")
+
+    topics = {
+        topic.id: topic
+        for topic in db.execute(
+            select(StudyTopic.id, StudyTopic.title, StudyTopic.subject, StudyTopic.estimated_hours,
+                   StudyTopic.actual_hours, StudyTopic.next_revision)
+            .where(StudyTopic.user_id == current_user.id)
+        )
+    }
+    # Unrated, unfinished sessions from first_day on are already planned work (e.g. an earlier plan)
+    planned_before = {
+        row.topic_id: row
+        for row in db.execute(
+            select(StudySession.topic_id,
+                   func.sum(duration_seconds(db.get_bind().dialect.name)).label("seconds"),
+                   func.max(StudySession.date).label("last_day"))
+            .where(
+                StudySession.user_id == current_user.id,
+                StudySession.topic_id.isnot(None),
+                StudySession.date >= first_day,
+                StudySession.start_time.isnot(None),
+                StudySession.end_time.isnot(None),
+                StudySession.comprehension_level.is_(None),
+                StudySession.completed.isnot(True),
+            )
+            .group_by(StudySession.topic_id)
+        )
+    }
+    tasks = []
+    for topic in topics.values():
+        planned_hours, planned_until = 0.0, None
+        if topic.id in planned_before:
+            planned_hours = float(planned_before[topic.id].seconds or 0) / 3600
+            planned_until = planned_before[topic.id].last_day
+        remaining_hours = max(0.0, topic.estimated_hours - topic.actual_hours - planned_hours)
+        blocks = math.ceil(round(remaining_hours * 60 / request.session_minutes, 6))
+        revision_due = topic.next_revision
+        if revision_due is not None and (revision_due > last_day or (planned_until is not None and planned_until >= revision_due)):
+            revision_due = None
+        if blocks or revision_due:
+            priority = request.topic_priorities.get(topic.id, DEFAULT_PRIORITY)
+            tasks.append(PlanTask(topic.id, blocks, PRIORITY_WEIGHTS[priority], revision_due))
+
+    windows = weekly_windows(first_day, last_day, [(w.weekday, w.start_time, w.end_time) for w in request.availability])
+    slots = free_slots(busy_intervals(db, current_user.id, first_day, last_day), windows,
+                       timedelta(minutes=request.min_session_minutes))
+    planned, unscheduled = plan_sessions(tasks, split_into_blocks(slots, request.session_minutes, request.min_session_minutes))
+
+    now = datetime.utcnow()
+    rows = []
+    for block in planned:
+        topic = topics[block.topic_id]
+        rows.append({
+            "id": uuid.uuid4(),
+            "user_id": current_user.id,
+            "topic_id": topic.id,
+            "title": f"{'Revise' if block.kind == REVISION else 'Study'}: {topic.title}",
+            "date": block.start.date(),
+            "start_time": block.start.time(),
+            "end_time": block.end.time(),
+            "subject": topic.subject,
+            "topic": topic.title,
+            "priority": request.topic_priorities.get(topic.id, DEFAULT_PRIORITY),
+            "completed": False,
+            "comprehension_level": None,
+            "notes": None,
+            "created_at": now,
+            "updated_at": now,
+        })
+
+    try:
+        if rows:
+            db.execute(insert(StudySession), rows)
+            mark_stats_dirty(db, current_user.id)
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        if _is_overlap_violation(e):
+            raise HTTPException(status_code=409, detail="The plan overlaps a session created concurrently; generate it again")
+        logger.error(f"Error generating study plan: {str(e)}")
+        raise HTTPException(status_code=500, detail="Could not generate study plan")
+    except Exception as e:
+        logger.error(f"Error generating study plan: {str(e)}")
+        db.rollback()
+        raise HTTPException(status_code=500, detail="Could not generate study plan")
+
+    logger.info(f"Generated {len(rows)} study sessions for {len(tasks)} topics")
+    return {
+        "sessions": rows,
+        "scheduled_hours": round(sum((block.end - block.start).total_seconds() for block in planned) / 3600, 2),
+        "unscheduled": [
+            {"topic_id": topic_id, "study_minutes": blocks * request.session_minutes, "revision": revision}
+            for topic_id, (blocks, revision) in unscheduled.items()
+        ],
+    }
 
 @router.get("/sessions/{session_id}", response_model=StudySessionResponse)
 def get_study_session(
@@ -211,24 +633,7 @@ def get_study_session(
     if not study_session:
         raise HTTPException(status_code=404, detail="Study session not found")
     
-    # Manually serialize the session
-    return {
-        "id": study_session.id,
-        "user_id": study_session.user_id,
-        "topic_id": study_session.topic_id,
-        "title": study_session.title,
-        "date": study_session.date.strftime('%Y-%m-%d') if study_session.date else None,
-        "start_time": study_session.start_time.strftime('%H:%M:%S') if study_session.start_time else None,
-        "end_time": study_session.end_time.strftime('%H:%M:%S') if study_session.end_time else None,
-        "subject": study_session.subject,
-        "topic": study_session.topic,
-        "priority": study_session.priority,
-        "completed": study_session.completed,
-        "comprehension_level": study_session.comprehension_level,
-        "notes": study_session.notes,
-        "created_at": study_session.created_at,
-        "updated_at": study_session.updated_at
-    }
+    return study_session
 
 @router.put("/sessions/{session_id}", response_model=StudySessionResponse)
 def update_study_session(
@@ -246,14 +651,19 @@ def update_study_session(
     if not db_session:
         raise HTTPException(status_code=404, detail="Study session not found")
     
-    # Manually parse date, start_time, and end_time
-    if session.date:
-        db_session.date = dt.strptime(session.date, '%Y-%m-%d').date()
-    if session.start_time:
-        db_session.start_time = dt.strptime(session.start_time, '%H:%M:%S').time()
-    if session.end_time:
-        db_session.end_time = dt.strptime(session.end_time, '%H:%M:%S').time()
-        
+    # Manually parse date, start_time, and end_time; omitted fields keep their values
+    date_obj, start_time_obj, end_time_obj = _parse_session_fields(session)
+    date_obj = date_obj or db_session.date
+    start_time_obj = start_time_obj or db_session.start_time
+    end_time_obj = end_time_obj or db_session.end_time
+    # Only a moved session is checked, so one that already overlaps can still have its other fields edited
+    moved = (date_obj, start_time_obj, end_time_obj) != (db_session.date, db_session.start_time, db_session.end_time)
+    if moved and overlaps_existing(db, current_user.id, session_interval(date_obj, start_time_obj, end_time_obj), exclude_id=db_session.id):
+        raise HTTPException(status_code=409, detail="Study session overlaps an existing session")
+    db_session.date = date_obj
+    db_session.start_time = start_time_obj
+    db_session.end_time = end_time_obj
+
     # Update other fields
     db_session.title = session.title
     db_session.subject = session.subject
@@ -266,26 +676,14 @@ def update_study_session(
     
     try:
         db.commit()
-        db.refresh(db_session)
         logger.info(f"Study session ID: {session_id} updated successfully")
-        # Manually serialize the session
-        return {
-            "id": db_session.id,
-            "user_id": db_session.user_id,
-            "topic_id": db_session.topic_id,
-            "title": db_session.title,
-            "date": db_session.date.strftime('%Y-%m-%d') if db_session.date else None,
-            "start_time": db_session.start_time.strftime('%H:%M:%S') if db_session.start_time else None,
-            "end_time": db_session.end_time.strftime('%H:%M:%S') if db_session.end_time else None,
-            "subject": db_session.subject,
-            "topic": db_session.topic,
-            "priority": db_session.priority,
-            "completed": db_session.completed,
-            "comprehension_level": db_session.comprehension_level,
-            "notes": db_session.notes,
-            "created_at": db_session.created_at,
-            "updated_at": db_session.updated_at
-        }
+        return db_session
+    except IntegrityError as e:
+        db.rollback()
+        if _is_overlap_violation(e):
+            raise HTTPException(status_code=409, detail="Study session overlaps an existing session")
+        logger.error(f"Error updating study session: {str(e)}")
+        raise HTTPException(status_code=500, detail="Could not update study session")
     except Exception as e:
         logger.error(f"Error updating study session: {str(e)}")
         db.rollback()
@@ -20,4 +20,4 @@ class AIInteractionResponse(BaseModel):
         return v
 
     class Config:
-        orm_mode = True
\ No newline at end of file
+        from_attributes = True
\ No newline at end of file
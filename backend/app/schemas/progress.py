@@ -0,0 +1,21 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+class TopicProgress(BaseModel):
+    topic: str  # "" for quizzes without a topic
+    progress_percentage: float
+    studied_hours: float
+    target_hours: float
+    quiz_attempts: int
+    average_quiz_score: Optional[float] = None
+
+class SubjectProgress(BaseModel):
+    subject: str
+    progress_percentage: float
+    studied_hours: float
+    target_hours: float
+    quiz_attempts: int
+    topics: List[TopicProgress]
+
+class ProgressResponse(BaseModel):
+    subjects: List[SubjectProgress]
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, validator
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 import uuid
 
@@ -8,6 +8,14 @@ class QuizAttemptCreate(BaseModel):
     score: Optional[int] = None  # Percentage score
     completed_at: Optional[datetime] = None
 
+    @validator('completed_at')
+    def to_naive_utc(cls, v):
+        # Columns are `timestamp without time zone` holding UTC, and asyncpg
+        # refuses to bind offset-aware datetimes to them
+        if v is not None and v.tzinfo is not None:
+            return v.astimezone(timezone.utc).replace(tzinfo=None)
+        return v
+
 class QuizAttemptResponse(BaseModel):
     id: str
     user_id: str
@@ -24,4 +32,4 @@ class QuizAttemptResponse(BaseModel):
         return v
 
     class Config:
-        orm_mode = True
\ No newline at end of file
+        from_attributes = True
\ No newline at end of file
@@ -38,4 +38,25 @@ class QuizResponse(QuizBase):
         return v
 
     class Config:
-        orm_mode = True
\ No newline at end of file
+        from_attributes = True
+
+class QuizSummary(QuizBase):
+    """A quiz without its questions, for listings."""
+    id: str
+    user_id: str
+    question_count: int = 0
+    total_marks: float = 0
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    status: Optional[str] = "not-started"
+    score: Optional[float] = None
+    last_attempt: Optional[datetime] = None
+
+    @validator('id', 'user_id', pre=True)
+    def convert_uuid_to_str(cls, v):
+        if isinstance(v, uuid.UUID):
+            return str(v)
+        return v
+
+    class Config:
+        from_attributes = True
\ No newline at end of file
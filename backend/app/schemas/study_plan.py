@@ -1,7 +1,8 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import date, time, datetime
-from typing import Optional
+from typing import Dict, List, Literal, Optional
 from uuid import UUID
+from app.utils.config import BULK_SESSIONS_MAX_ITEMS
 
 # Study Topic Schemas
 class StudyTopicCreate(BaseModel):
@@ -24,11 +25,10 @@ class StudyTopicResponse(BaseModel):
 
     class Config:
         from_attributes = True
-        json_encoders = {
-            date: lambda v: v.strftime('%Y-%m-%d') if v else None,
-            datetime: lambda v: v.isoformat() if v else None,
-            UUID: lambda v: str(v)
-        }
+
+class DueRevisionsPage(BaseModel):
+    items: List[StudyTopicResponse]
+    next_cursor: Optional[str] = None
 
 # Study Session Schemas
 class StudySessionCreate(BaseModel):
@@ -43,14 +43,31 @@ class StudySessionCreate(BaseModel):
     comprehension_level: Optional[int] = None  # 1-5 scale
     notes: Optional[str] = None
 
+class StudySessionBulkItem(StudySessionCreate):
+    topic_id: Optional[UUID] = None
+
+class StudySessionBulkCreate(BaseModel):
+    sessions: List[StudySessionBulkItem] = Field(..., min_length=1, max_length=BULK_SESSIONS_MAX_ITEMS)
+
+class StudySessionBulkResult(BaseModel):
+    index: int
+    id: Optional[UUID] = None
+    error: Optional[str] = None
+
+class StudySessionBulkResponse(BaseModel):
+    created: int
+    failed: int
+    topics_updated: int
+    results: List[StudySessionBulkResult]
+
 class StudySessionResponse(BaseModel):
     id: UUID
     user_id: UUID
     topic_id: Optional[UUID]
     title: str
-    date: Optional[str]
-    start_time: Optional[str]
-    end_time: Optional[str]
+    date: Optional[date]
+    start_time: Optional[time]
+    end_time: Optional[time]
     subject: Optional[str]
     topic: Optional[str]
     priority: Optional[str]
@@ -62,12 +79,6 @@ class StudySessionResponse(BaseModel):
 
     class Config:
         from_attributes = True
-        json_encoders = {
-            date: lambda v: v.strftime('%Y-%m-%d') if v else None,
-            time: lambda v: v.strftime('%H:%M:%S') if v else None,
-            datetime: lambda v: v.isoformat() if v else None,
-            UUID: lambda v: str(v)
-        }
 
 # New response model to include session and updated topic
 class StudySessionWithTopicResponse(BaseModel):
@@ -76,9 +87,54 @@ class StudySessionWithTopicResponse(BaseModel):
 
     class Config:
         from_attributes = True
-        json_encoders = {
-            date: lambda v: v.strftime('%Y-%m-%d') if v else None,
-            time: lambda v: v.strftime('%H:%M:%S') if v else None,
-            datetime: lambda v: v.isoformat() if v else None,
-            UUID: lambda v: str(v)
-        }
\ No newline at end of file
+# Study stats (aggregated per user)
+class SubjectStats(BaseModel):
+    subject: Optional[str]
+    sessions: int
+    hours: float
+
+class WeekStats(BaseModel):
+    week_start: date
+    sessions: int
+    hours: float
+
+class TopicStats(BaseModel):
+    topic_id: UUID
+    title: str
+    sessions: int
+    hours: float
+
+class StudyStatsResponse(BaseModel):
+    total_sessions: int
+    total_hours: float
+    by_subject: List[SubjectStats]
+    by_week: List[WeekStats]
+    by_topic: List[TopicStats]
+
+class FreeSlot(BaseModel):
+    start: datetime
+    end: datetime
+    minutes: float
+
+class AvailabilityWindow(BaseModel):
+    weekday: int = Field(..., ge=0, le=6)  # Monday = 0
+    start_time: time
+    end_time: time
+
+class StudyPlanRequest(BaseModel):
+    exam_date: date
+    start_date: Optional[date] = None  # today when omitted
+    availability: List[AvailabilityWindow] = Field(..., min_length=1)
+    session_minutes: int = Field(60, ge=15, le=240)
+    min_session_minutes: int = Field(30, ge=15, le=240)
+    topic_priorities: Dict[UUID, Literal["high", "medium", "low"]] = {}
+
+class UnscheduledTopic(BaseModel):
+    topic_id: UUID
+    study_minutes: float
+    revision: bool
+
+class StudyPlanResponse(BaseModel):
+    sessions: List[StudySessionResponse]
+    scheduled_hours: float
+    unscheduled: List[UnscheduledTopic]
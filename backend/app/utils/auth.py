@@ -2,12 +2,23 @@ from passlib.context import CryptContext
 from jose import JWTError, jwt
 from datetime import datetime, timedelta
 from typing import Optional
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy import event, inspect as sa_inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
 from app.database import get_db
 from app.models.user import User
+from app.utils.cache import TTLCache
+from app.utils.config import (
+    AUTH_CACHE_MAX_SIZE,
+    AUTH_CACHE_TTL_SECONDS,
+    PASSWORD_POOL_MAX_QUEUE,
+    PASSWORD_POOL_RETRY_AFTER_SECONDS,
+    PASSWORD_POOL_WORKERS,
+)
+from app.utils.worker_pool import BoundedWorkerPool, PoolSaturated
 import os
+import time
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -20,15 +31,46 @@ ACCESS_TOKEN_EXPIRE_MINUTES = 30
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt releases the GIL, so a small dedicated thread pool keeps hashing off both
+# the event loop and the shared request threadpool during login storms
+password_pool = BoundedWorkerPool(
+    max_workers=PASSWORD_POOL_WORKERS,
+    max_queue=PASSWORD_POOL_MAX_QUEUE,
+    thread_name_prefix="password-hash",
+)
+
 # OAuth2 scheme for token authentication
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
+# Authenticated users keyed by (token subject, token expiry). Entries never outlive
+# the token itself. Each hit is checked against users.updated_at with a primary-key
+# probe, so an update or delete from any process (ORM or Core/bulk, all of which move
+# updated_at) is seen on the next request; only raw SQL that leaves updated_at alone
+# can serve a stale user, for at most AUTH_CACHE_TTL_SECONDS.
+user_cache = TTLCache(max_size=AUTH_CACHE_MAX_SIZE, ttl=AUTH_CACHE_TTL_SECONDS)
+
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
+async def _run_password_job(fn, *args):
+    try:
+        return await password_pool.run(fn, *args)
+    except PoolSaturated:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many sign-in requests right now. Please try again shortly.",
+            headers={"Retry-After": str(PASSWORD_POOL_RETRY_AFTER_SECONDS)},
+        )
+
+async def hash_password_async(password: str) -> str:
+    return await _run_password_job(hash_password, password)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await _run_password_job(verify_password, plain_password, hashed_password)
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     if expires_delta:
@@ -39,7 +81,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+def get_current_user(request: Request, token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -52,8 +94,39 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
             raise credentials_exception
     except JWTError:
         raise credentials_exception
-    
+
+    # Lets request-level middleware (e.g. read-your-writes pinning) see who is calling
+    request.state.user_id = str(user_id)
+
+    cache_key = (str(user_id), payload.get("exp"))
+    cached_user = user_cache.get(cache_key)
+    if cached_user is not None:
+        current = db.query(User.updated_at).filter(User.id == user_id).first()
+        if current is None:
+            user_cache.pop(cache_key)
+            raise credentials_exception
+        if current.updated_at == cached_user.updated_at:
+            # Attach a copy to this request's session without loading the full row
+            return db.merge(cached_user, load=False)
+
     user = db.query(User).filter(User.id == user_id).first()
     if user is None:
         raise credentials_exception
-    return user
\ No newline at end of file
+    expires_in = payload["exp"] - time.time() if payload.get("exp") else None
+    user_cache.set(cache_key, _detached_copy(user), ttl=expires_in)
+    return user
+
+def _detached_copy(user: User) -> User:
+    """Snapshot the user's column values into a clean, session-less instance."""
+    snapshot = User(**{attr.key: getattr(user, attr.key) for attr in sa_inspect(User).column_attrs})
+    make_transient_to_detached(snapshot)
+    return snapshot
+
+def invalidate_cached_user(user_id) -> int:
+    return user_cache.discard_where(lambda key: key[0] == str(user_id))
+
+# Drops this process's entries eagerly; other processes catch up through the updated_at check
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_on_user_write(mapper, connection, target):
+    invalidate_cached_user(target.id)
\ No newline at end of file
@@ -0,0 +1,57 @@
+# app/utils/config.py
+import os
+from dotenv import load_dotenv
+
+load_dotenv()  # Load environment variables from .env
+
+# Authenticated user cache (see app/utils/auth.py); each hit still checks users.updated_at
+AUTH_CACHE_MAX_SIZE = int(os.getenv("AUTH_CACHE_MAX_SIZE", "1024"))  # 0 disables the cache
+AUTH_CACHE_TTL_SECONDS = float(os.getenv("AUTH_CACHE_TTL_SECONDS", "60"))
+
+# Password hashing worker pool (see app/utils/worker_pool.py)
+PASSWORD_POOL_WORKERS = int(os.getenv("PASSWORD_POOL_WORKERS", str(os.cpu_count() or 2)))
+PASSWORD_POOL_MAX_QUEUE = int(os.getenv("PASSWORD_POOL_MAX_QUEUE", "64"))
+PASSWORD_POOL_RETRY_AFTER_SECONDS = int(os.getenv("PASSWORD_POOL_RETRY_AFTER_SECONDS", "2"))
+
+# Database connection pool (applied to both the sync and async engines, per worker process)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT_SECONDS = float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "30"))
+DB_POOL_RECYCLE_SECONDS = int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+
+# Shared secret for /api/internal/* endpoints, sent as X-Internal-Token; when unset they all answer 403
+INTERNAL_API_TOKEN = os.getenv("INTERNAL_API_TOKEN")
+
+# Read replica routing (see app/utils/read_routing.py); DATABASE_REPLICA_URL itself is read in app/database.py
+READ_YOUR_WRITES_SECONDS = float(os.getenv("READ_YOUR_WRITES_SECONDS", "5"))
+REPLICA_MAX_LAG_SECONDS = float(os.getenv("REPLICA_MAX_LAG_SECONDS", "10"))
+REPLICA_LAG_CHECK_INTERVAL_SECONDS = float(os.getenv("REPLICA_LAG_CHECK_INTERVAL_SECONDS", "5"))
+
+# Per-request SQL statistics (see app/utils/query_stats.py)
+QUERY_STATS_ENABLED = os.getenv("QUERY_STATS_ENABLED", "true").lower() in ("1", "true", "yes")
+N_PLUS_ONE_THRESHOLD = int(os.getenv("N_PLUS_ONE_THRESHOLD", "5"))  # warn when one statement repeats more often
+
+# Revision model hot-reload: how often the model file's mtime is re-checked
+REVISION_MODEL_CHECK_INTERVAL_SECONDS = float(os.getenv("REVISION_MODEL_CHECK_INTERVAL_SECONDS", "5"))
+
+# Spaced-repetition scheduler (see app/ml/scheduler.py)
+REVISION_TARGET_RETENTION = float(os.getenv("REVISION_TARGET_RETENTION", "0.85"))
+REVISION_MIN_REVIEWS_FOR_FIT = int(os.getenv("REVISION_MIN_REVIEWS_FOR_FIT", "20"))
+
+# Bulk session import (POST /api/study-plan/sessions/bulk)
+BULK_SESSIONS_MAX_ITEMS = int(os.getenv("BULK_SESSIONS_MAX_ITEMS", "5000"))
+
+# Study history export (GET /api/export): rows fetched per server-side cursor round trip
+EXPORT_CHUNK_SIZE = int(os.getenv("EXPORT_CHUNK_SIZE", "1000"))
+
+# Study stats cache (per worker process; 0 disables). Entries are checked against the
+# user's sessions watermark on every read, so writes from any worker are seen at once.
+STATS_CACHE_MAX_SIZE = int(os.getenv("STATS_CACHE_MAX_SIZE", "2048"))
+STATS_CACHE_TTL_SECONDS = float(os.getenv("STATS_CACHE_TTL_SECONDS", "60"))
+
+# Free-slot finder (GET /api/study-plan/free-slots): longest date range per request
+FREE_SLOTS_MAX_DAYS = int(os.getenv("FREE_SLOTS_MAX_DAYS", "92"))
+
+# Study-plan generator (POST /api/study-plan/generate): longest plan, start date to exam
+PLAN_MAX_DAYS = int(os.getenv("PLAN_MAX_DAYS", "366"))
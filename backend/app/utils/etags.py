@@ -0,0 +1,58 @@
+# app/utils/etags.py
+"""
+Strong ETags and If-None-Match handling for read endpoints.
+
+Handlers compute the ETag from cheap version data before building the body: the
+quiz catalog version and the user's attempt state, or the row count and newest
+updated_at of a user's rows. When the client already holds that version, the
+handler answers 304 without loading or serializing anything.
+"""
+import hashlib
+from typing import Optional
+
+from fastapi import Response
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+# Responses are per user, and clients must revalidate before reusing one
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts) -> str:
+    """A strong ETag over `parts`, which must have a stable repr."""
+    return '"' + hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match uses the weak comparison, so a W/ prefix is ignored."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+
+
+def set_etag(response: Response, etag: str) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+
+
+def not_modified(etag: str) -> Response:
+    response = Response(status_code=304)
+    set_etag(response, etag)
+    return response
+
+
+def user_watermark(db: Session, model, user_id) -> tuple:
+    """
+    (row count, newest updated_at) of a user's rows in `model`'s table.
+
+    Every write sets updated_at and deletes change the count, so any change to the
+    user's rows, committed by any process, changes the watermark.
+    """
+    return tuple(db.query(func.count(model.id), func.max(model.updated_at)).filter(model.user_id == user_id).one())
+
+
+def watermark_etag(db: Session, model, user_id, *parts) -> str:
+    """ETag of a user's rows in `model`'s table; `parts` tell apart views of the same rows (filters, pages)."""
+    return make_etag(model.__tablename__, *user_watermark(db, model, user_id), *parts)
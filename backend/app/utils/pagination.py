@@ -0,0 +1,50 @@
+# app/utils/pagination.py
+from fastapi import HTTPException
+from sqlalchemy import and_, false, or_
+from typing import Callable, List, Optional, Sequence
+import base64
+import json
+
+# Listings that return plain JSON arrays carry the next page's cursor in this header
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(*values) -> str:
+    """Opaque keyset cursor: the sort key of the last row returned, as URL-safe base64."""
+    raw = json.dumps([str(v) if v is not None else None for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List:
+    """Inverse of encode_cursor; a malformed cursor is a 400, not a 500."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+
+def parse_cursor(cursor: str, parsers: Sequence[Callable]) -> List:
+    """Decode a cursor and convert each non-null value with the matching parser (e.g. date.fromisoformat)."""
+    values = decode_cursor(cursor, len(parsers))
+    try:
+        return [parse(value) if value is not None else None for parse, value in zip(parsers, values)]
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def keyset_after(columns: Sequence, values: Sequence[Optional[object]]):
+    """
+    WHERE clause for rows after `values` in ORDER BY columns ASC NULLS LAST.
+
+    Expands (c1, c2, ...) > (v1, v2, ...) by hand so nullable sort columns work:
+    a NULL sorts after every value, and equal prefixes compare with IS NULL.
+    """
+    clauses = []
+    for i, (column, value) in enumerate(zip(columns, values)):
+        prefix = [c.is_(None) if v is None else c == v for c, v in zip(columns[:i], values[:i])]
+        greater = false() if value is None else or_(column > value, column.is_(None))
+        clauses.append(and_(*prefix, greater))
+    return or_(*clauses)
@@ -0,0 +1,194 @@
+# app/utils/progress.py
+"""
+Incrementally maintained Progress rows, one per (user, subject, topic).
+
+Each row keeps additive totals: the study hours done and estimated (from StudyTopic
+actual/estimated hours) and the count and score sum of completed quiz attempts.
+Write paths add their deltas with one upsert in the same transaction as the write.
+progress_percentage is recomputed from the new totals inside that statement, so a
+read is a single indexed lookup.
+
+`rebuild_progress` recomputes every row from study_topics and quiz_attempts, in
+chunks of users, to repair drift:
+
+    python -m app.utils.progress --chunk-size 1000
+"""
+import argparse
+import logging
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from sqlalchemy import case, delete, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.models.progress import Progress
+from app.models.quiz import Quiz
+from app.models.quiz_attempt import QuizAttempt
+from app.models.study_topic import StudyTopic
+from app.models.user import User
+
+logger = logging.getLogger("SmartStudyApp")
+
+TOTALS = ("studied_hours", "target_hours", "quiz_attempts", "quiz_score_total")
+
+
+class ProgressDelta(NamedTuple):
+    studied_hours: float = 0.0
+    target_hours: float = 0.0
+    quiz_attempts: int = 0
+    quiz_score_total: int = 0
+
+
+def progress_key(subject: str, topic: Optional[str]) -> Tuple[str, str]:
+    """Rows without a topic are keyed by an empty string, so the unique index covers them."""
+    return subject, topic or ""
+
+
+def percentage(studied_hours, target_hours, quiz_attempts, quiz_score_total) -> float:
+    """
+    Mean of study completion (hours against the estimate, capped at 100) and the
+    average quiz score. A part with no data is left out. Mirrors `_percentage_expr`.
+    """
+    parts = []
+    if target_hours > 0:
+        parts.append(min(100.0, 100.0 * studied_hours / target_hours))
+    if quiz_attempts > 0:
+        parts.append(quiz_score_total / quiz_attempts)
+    return sum(parts) / len(parts) if parts else 0.0
+
+
+def _percentage_expr(studied_hours, target_hours, quiz_attempts, quiz_score_total):
+    """SQL form of `percentage`; NULL parts drop out through the COALESCE."""
+    study = case((target_hours <= 0, None), (studied_hours >= target_hours, 100.0), else_=100.0 * studied_hours / target_hours)
+    quiz = case((quiz_attempts <= 0, None), else_=1.0 * quiz_score_total / quiz_attempts)
+    return func.coalesce((study + quiz) / 2, study, quiz, 0.0)
+
+
+def progress_upsert(db, user_id, deltas: Dict[Tuple[str, str], ProgressDelta]):
+    """
+    One INSERT ... ON CONFLICT DO UPDATE adding `deltas` (keyed by `progress_key`) to the user's rows.
+
+    Returns None when there is nothing to add. Works for Session and AsyncSession;
+    the caller executes the statement in its own transaction. Keys are sorted so
+    concurrent writers lock rows in the same order.
+    """
+    deltas = {key: delta for key, delta in deltas.items() if any(delta)}
+    if not deltas:
+        return None
+    dialect = db.get_bind().dialect.name
+    insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+    stmt = insert(Progress).values([
+        {
+            "id": uuid.uuid4(),
+            "user_id": user_id,
+            "subject": subject,
+            "topic": topic,
+            **delta._asdict(),
+            "progress_percentage": percentage(*delta),
+            "last_updated": func.now(),
+        }
+        for (subject, topic), delta in sorted(deltas.items())
+    ])
+    totals = [getattr(Progress, name) + getattr(stmt.excluded, name) for name in TOTALS]
+    return stmt.on_conflict_do_update(
+        index_elements=["user_id", "subject", "topic"],
+        set_={
+            **dict(zip(TOTALS, totals)),
+            "progress_percentage": _percentage_expr(*totals),
+            "last_updated": func.now(),
+        },
+    )
+
+
+def apply_progress_deltas(db: Session, user_id, deltas: Dict[Tuple[str, str], ProgressDelta]) -> None:
+    stmt = progress_upsert(db, user_id, deltas)
+    if stmt is not None:
+        db.execute(stmt)
+
+
+def aggregate_progress(db: Session, user_ids) -> Dict[tuple, ProgressDelta]:
+    """Progress totals recomputed from study topics and completed quiz attempts, keyed by (user_id, subject, topic)."""
+    totals = defaultdict(lambda: [0.0, 0.0, 0, 0])
+    for row in db.execute(
+        select(StudyTopic.user_id, StudyTopic.subject, StudyTopic.title,
+               func.sum(StudyTopic.actual_hours), func.sum(StudyTopic.estimated_hours))
+        .where(StudyTopic.user_id.in_(user_ids))
+        .group_by(StudyTopic.user_id, StudyTopic.subject, StudyTopic.title)
+    ):
+        entry = totals[(row[0], *progress_key(row[1], row[2]))]
+        entry[0] += float(row[3] or 0)
+        entry[1] += float(row[4] or 0)
+    for row in db.execute(
+        select(QuizAttempt.user_id, Quiz.subject, Quiz.topic, func.count(), func.sum(QuizAttempt.score))
+        .join(Quiz, Quiz.id == QuizAttempt.quiz_id)
+        .where(
+            QuizAttempt.user_id.in_(user_ids),
+            QuizAttempt.status == "completed",
+            QuizAttempt.score.isnot(None),
+            Quiz.subject.isnot(None),
+        )
+        .group_by(QuizAttempt.user_id, Quiz.subject, Quiz.topic)
+    ):
+        entry = totals[(row[0], *progress_key(row[1], row[2]))]
+        entry[2] += int(row[3])
+        entry[3] += int(row[4] or 0)
+    return {key: ProgressDelta(*values) for key, values in totals.items()}
+
+
+def rebuild_progress(db: Session, chunk_size: int = 1000) -> Dict[str, float]:
+    """
+    Replace every Progress row with totals recomputed from the source tables.
+
+    Users are walked in primary-key order, `chunk_size` at a time. Each chunk is one
+    transaction: delete the users' rows, aggregate, insert. The delete comes first,
+    so writers that already hold a row lock finish before the aggregate reads.
+    A delta for a brand-new (subject, topic) that commits in the middle of a chunk
+    can still be lost, so run the repair when writes are quiet.
+    """
+    started = time.perf_counter()
+    users = rows = 0
+    last_id = None
+    while True:
+        query = select(User.id).order_by(User.id).limit(chunk_size)
+        if last_id is not None:
+            query = query.where(User.id > last_id)
+        user_ids = db.execute(query).scalars().all()
+        if not user_ids:
+            break
+        db.execute(delete(Progress).where(Progress.user_id.in_(user_ids)))
+        fresh = aggregate_progress(db, user_ids)
+        now = datetime.utcnow()
+        if fresh:
+            db.execute(Progress.__table__.insert(), [
+                {"id": uuid.uuid4(), "user_id": user_id, "subject": subject, "topic": topic,
+                 **totals._asdict(), "progress_percentage": percentage(*totals), "last_updated": now}
+                for (user_id, subject, topic), totals in fresh.items()
+            ])
+        db.commit()
+        users += len(user_ids)
+        rows += len(fresh)
+        last_id = user_ids[-1]
+        logger.info(f"Rebuilt progress for {users} users ({rows} rows)")
+
+    elapsed = time.perf_counter() - started
+    return {"users": users, "rows": rows, "seconds": round(elapsed, 3)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    from app.database import SessionLocal
+
+    with SessionLocal() as db:
+        result = rebuild_progress(db, chunk_size=args.chunk_size)
+    print(result)
+
+
+if __name__ == "__main__":
+    main()
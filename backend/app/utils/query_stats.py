@@ -0,0 +1,91 @@
+# app/utils/query_stats.py
+from collections import Counter
+from contextvars import ContextVar
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from typing import Optional
+import logging
+import time
+from app.utils.config import N_PLUS_ONE_THRESHOLD
+
+logger = logging.getLogger("SmartStudyApp")
+
+
+class RequestQueryStats:
+    """SQL statements executed while serving one request."""
+
+    __slots__ = ("count", "total_seconds", "statements")
+
+    def __init__(self):
+        self.count = 0
+        self.total_seconds = 0.0
+        self.statements = Counter()
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.total_seconds += elapsed
+        self.statements[statement] += 1
+
+    def repeated(self, threshold: int):
+        """Statements issued more than `threshold` times, most frequent first."""
+        return [(statement, n) for statement, n in self.statements.most_common() if n > threshold]
+
+
+# The stats object is mutated in place, so queries run from threadpool workers (which
+# get a copy of the request's context) are still counted against the request
+_current_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar("request_query_stats", default=None)
+
+
+def current_query_stats() -> Optional[RequestQueryStats]:
+    return _current_stats.get()
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_stats.get() is not None:
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    started = conn.info.get("query_started_at")
+    if stats is not None and started:
+        stats.record(statement, time.perf_counter() - started.pop())
+
+
+class QueryStatsMiddleware:
+    """
+    Counts SQL statements and database time per HTTP request.
+
+    Totals are sent as a `Server-Timing: db;dur=<ms>;desc="<n> queries"` header and
+    logged once the response completes. A statement repeated more than
+    `threshold` times in one request is logged as a suspected N+1 pattern.
+    """
+
+    def __init__(self, app, threshold: int = N_PLUS_ONE_THRESHOLD):
+        self.app = app
+        self.threshold = threshold
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestQueryStats()
+        token = _current_stats.set(stats)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                timing = f'db;dur={stats.total_seconds * 1000:.2f};desc="{stats.count} queries"'
+                message["headers"] = list(message.get("headers", [])) + [(b"server-timing", timing.encode("latin-1"))]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_stats.reset(token)
+            route = f"{scope['method']} {scope['path']}"
+            logger.info(f"{route} issued {stats.count} queries in {stats.total_seconds * 1000:.2f} ms")
+            for statement, n in stats.repeated(self.threshold):
+                logger.warning(f"Possible N+1 in {route}: statement ran {n} times: {' '.join(statement.split())[:200]}")
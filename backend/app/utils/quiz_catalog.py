@@ -0,0 +1,129 @@
+# app/utils/quiz_catalog.py
+from pydantic import BaseModel
+from sqlalchemy import and_, select, update
+from sqlalchemy.orm import load_only
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Dict, List, NamedTuple, Optional, Type
+import logging
+from app.models.cache_version import QUIZ_CATALOG, CacheVersion
+from app.models.quiz import Quiz
+from app.models.quiz_attempt import QuizAttempt
+from app.schemas.quizzes import QuizResponse, QuizSummary
+
+logger = logging.getLogger("SmartStudyApp")
+
+
+class QuizCatalog(NamedTuple):
+    version: Optional[int]
+    quizzes: List[BaseModel]
+    by_id: Dict[str, BaseModel]
+    encoded: Dict[str, bytes]  # JSON of each quiz as seen by a user with no attempt
+
+
+def overlay_query(user_id, quiz_id=None):
+    """
+    The catalog version and the user's quiz attempts (oldest first) in one query.
+
+    cache_versions is the driving table, so the version row comes back even when the
+    user has no attempts; the attempts are found through ix_quiz_attempts_user_id_quiz_id.
+    """
+    on = QuizAttempt.user_id == user_id
+    if quiz_id is not None:
+        on = and_(on, QuizAttempt.quiz_id == quiz_id)
+    return (
+        select(CacheVersion.version, QuizAttempt.quiz_id, QuizAttempt.status, QuizAttempt.score, QuizAttempt.completed_at)
+        .select_from(CacheVersion)
+        .outerjoin(QuizAttempt, on)
+        .where(CacheVersion.name == QUIZ_CATALOG)
+        .order_by(QuizAttempt.started_at)
+    )
+
+
+async def load_overlay(db: AsyncSession, user_id, quiz_id=None):
+    """(catalog version, {quiz id: latest attempt}) for one user."""
+    rows = (await db.execute(overlay_query(user_id, quiz_id))).all()
+    version = rows[0].version if rows else None
+    if not rows:
+        # No version row to drive the join: read the attempts on their own
+        query = select(QuizAttempt.quiz_id, QuizAttempt.status, QuizAttempt.score, QuizAttempt.completed_at).where(QuizAttempt.user_id == user_id)
+        if quiz_id is not None:
+            query = query.where(QuizAttempt.quiz_id == quiz_id)
+        rows = (await db.execute(query.order_by(QuizAttempt.started_at))).all()
+    # Rows are oldest first, so the latest attempt per quiz wins
+    return version, {str(row.quiz_id): row for row in rows if row.quiz_id is not None}
+
+
+def bump_catalog_version():
+    """UPDATE that invalidates every process's catalog; run it in the transaction that writes catalog quizzes."""
+    return update(CacheVersion).where(CacheVersion.name == QUIZ_CATALOG).values(version=CacheVersion.version + 1)
+
+
+def with_attempt(quiz: BaseModel, attempt) -> BaseModel:
+    """Copy of a cached quiz carrying one user's latest attempt; the cached model is never modified."""
+    return quiz.model_copy(update={"status": attempt.status, "score": attempt.score, "last_attempt": attempt.completed_at})
+
+
+class QuizCatalogCache:
+    """
+    The shared quiz catalog as `schema` models, validated and JSON-encoded once per
+    process per version. With `columns`, only those columns are loaded.
+
+    Readers pass the version they just read from cache_versions. The catalog is
+    reloaded only when that version is newer than the cached one, so a lagging
+    replica never swaps a newer catalog for an older one. With no version row,
+    nothing can be trusted and every read reloads.
+    """
+
+    def __init__(self, schema: Type[BaseModel], columns=None):
+        self.schema = schema
+        self.columns = columns
+        self._catalog: Optional[QuizCatalog] = None
+        self.hits = 0
+        self.loads = 0
+
+    async def get(self, db: AsyncSession, owner_id, version: Optional[int]) -> QuizCatalog:
+        catalog = self._catalog
+        if catalog is not None and version is not None and catalog.version is not None and version <= catalog.version:
+            self.hits += 1
+            return catalog
+
+        query = select(Quiz).where(Quiz.user_id == owner_id).order_by(Quiz.created_at, Quiz.id)
+        if self.columns is not None:
+            query = query.options(load_only(*self.columns))
+        quizzes = (await db.execute(query)).scalars().all()
+        models = [self.schema.model_validate(quiz) for quiz in quizzes]
+        catalog = QuizCatalog(
+            version=version,
+            quizzes=models,
+            by_id={model.id: model for model in models},
+            encoded={model.id: model.model_dump_json(by_alias=True).encode() for model in models},
+        )
+        self.loads += 1
+        if version is None:
+            logger.warning("No quiz catalog version row; the catalog is reloaded on every request")
+        else:
+            # Concurrent reloads may race; keep whichever saw the newer version
+            current = self._catalog
+            if current is None or current.version is None or version >= current.version:
+                self._catalog = catalog
+            logger.info(f"Loaded quiz catalog version {version} as {self.schema.__name__} ({len(models)} quizzes)")
+        return catalog
+
+    def clear(self) -> None:
+        self._catalog = None
+
+    def stats(self) -> Dict[str, Any]:
+        catalog = self._catalog
+        return {
+            "version": catalog.version if catalog else None,
+            "quizzes": len(catalog.quizzes) if catalog else 0,
+            "hits": self.hits,
+            "loads": self.loads,
+        }
+
+
+# Summaries skip the questions column; every other QuizSummary field is a Quiz column
+SUMMARY_COLUMNS = [getattr(Quiz, name) for name in QuizSummary.model_fields if name in Quiz.__table__.columns]
+
+quiz_catalog = QuizCatalogCache(QuizResponse)
+quiz_summaries = QuizCatalogCache(QuizSummary, SUMMARY_COLUMNS)
@@ -0,0 +1,211 @@
+# app/utils/read_routing.py
+from fastapi import Depends, Request
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import text
+from starlette.datastructures import MutableHeaders
+from threading import Lock
+from typing import Any, Dict, Optional
+import hashlib
+import hmac
+import logging
+import math
+import time
+from app.database import AsyncReplicaSessionLocal, AsyncSessionLocal, ReplicaSessionLocal, SessionLocal, replica_engine
+from app.models.user import User
+from app.utils.auth import SECRET_KEY, get_current_user
+from app.utils.config import (
+    READ_YOUR_WRITES_SECONDS,
+    REPLICA_LAG_CHECK_INTERVAL_SECONDS,
+    REPLICA_MAX_LAG_SECONDS,
+)
+
+logger = logging.getLogger("SmartStudyApp")
+
+# Zero when the standby has replayed everything it received (or is not a standby at all)
+POSTGRES_LAG_SQL = text("""
+    SELECT COALESCE(
+        CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+             ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+        END, 0)
+""")
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+# Signed time of a user's last write, handed to the client so any worker can honour it
+WRITE_WATERMARK_HEADER = "X-Write-Watermark"
+WRITE_WATERMARK_COOKIE = "write_watermark"
+# Tolerated clock difference between the worker that issued a watermark and the one reading it
+WATERMARK_CLOCK_SKEW_SECONDS = 1.0
+
+
+def _watermark_signature(user_id: str, issued_ms: int) -> str:
+    return hmac.new((SECRET_KEY or "").encode(), f"{user_id}:{issued_ms}".encode(), hashlib.sha256).hexdigest()[:32]
+
+
+def request_watermark(request: Request) -> Optional[str]:
+    return request.headers.get(WRITE_WATERMARK_HEADER) or request.cookies.get(WRITE_WATERMARK_COOKIE)
+
+
+class ReplicaRouter:
+    """
+    Decides whether a read may go to the replica.
+
+    Reads fall back to the primary when no replica is configured, when the user
+    wrote something in the last `pin_seconds` (read-your-writes), or when the
+    replica is unreachable or lagging more than `max_lag_seconds`.
+
+    A write is remembered twice: as a pin in the worker that served it, and as a
+    signed watermark (the write's wall-clock time) returned to the client in a
+    cookie and a header. The client sends the watermark back, so whichever worker
+    serves the next read sees the write.
+    """
+
+    def __init__(self, engine, pin_seconds: float, max_lag_seconds: float, lag_check_interval: float,
+                 clock=time.monotonic, wall_clock=time.time):
+        self.engine = engine
+        self.pin_seconds = pin_seconds
+        self.max_lag_seconds = max_lag_seconds
+        self.lag_check_interval = lag_check_interval
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._pins: Dict[str, float] = {}
+        self._lock = Lock()
+        self._lag: Optional[float] = None
+        self._lag_checked_at: Optional[float] = None
+        self.counts = {"replica": 0, "primary_pinned": 0, "primary_lagging": 0, "primary_no_replica": 0}
+
+    def mark_write(self, user_id: str) -> None:
+        now = self._clock()
+        with self._lock:
+            self._pins[user_id] = now + self.pin_seconds
+            if len(self._pins) > 10000:
+                self._pins = {uid: until for uid, until in self._pins.items() if until > now}
+
+    def is_pinned(self, user_id: Optional[str]) -> bool:
+        if not user_id:
+            return False
+        until = self._pins.get(user_id)
+        return until is not None and until > self._clock()
+
+    def issue_watermark(self, user_id: str) -> str:
+        issued_ms = int(self._wall_clock() * 1000)
+        return f"{issued_ms}.{_watermark_signature(user_id, issued_ms)}"
+
+    def watermark_fresh(self, user_id: Optional[str], watermark: Optional[str]) -> bool:
+        """True when `watermark` was issued for this user less than `pin_seconds` ago."""
+        if not user_id or not watermark:
+            return False
+        issued, _, signature = watermark.partition(".")
+        try:
+            issued_ms = int(issued)
+        except ValueError:
+            return False
+        if not hmac.compare_digest(signature, _watermark_signature(user_id, issued_ms)):
+            return False
+        age = self._wall_clock() - issued_ms / 1000
+        return -WATERMARK_CLOCK_SKEW_SECONDS <= age < self.pin_seconds
+
+    def lag_check_due(self) -> bool:
+        return self._lag_checked_at is None or self._clock() - self._lag_checked_at >= self.lag_check_interval
+
+    def refresh_lag(self) -> Optional[float]:
+        """Measure replica lag in seconds; None means the replica could not be reached."""
+        try:
+            with self.engine.connect() as connection:
+                if connection.dialect.name == "postgresql":
+                    lag = float(connection.execute(POSTGRES_LAG_SQL).scalar() or 0.0)
+                else:
+                    connection.execute(text("SELECT 1"))
+                    lag = 0.0
+        except Exception as e:
+            logger.warning(f"Read replica unavailable, routing reads to primary: {str(e)}")
+            lag = None
+        self._lag, self._lag_checked_at = lag, self._clock()
+        return lag
+
+    def use_replica(self, user_id: Optional[str], watermark: Optional[str] = None) -> bool:
+        if self.engine is None:
+            self.counts["primary_no_replica"] += 1
+            return False
+        if self.is_pinned(user_id) or self.watermark_fresh(user_id, watermark):
+            self.counts["primary_pinned"] += 1
+            return False
+        if self.lag_check_due():
+            self.refresh_lag()
+        if self._lag is None or self._lag > self.max_lag_seconds:
+            self.counts["primary_lagging"] += 1
+            return False
+        self.counts["replica"] += 1
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "replica_configured": self.engine is not None,
+            "replica_lag_seconds": self._lag,
+            "pinned_users": sum(1 for until in list(self._pins.values()) if until > self._clock()),
+            **self.counts,
+        }
+
+
+read_router = ReplicaRouter(
+    replica_engine,
+    pin_seconds=READ_YOUR_WRITES_SECONDS,
+    max_lag_seconds=REPLICA_MAX_LAG_SECONDS,
+    lag_check_interval=REPLICA_LAG_CHECK_INTERVAL_SECONDS,
+)
+
+
+def get_read_db(request: Request, current_user: User = Depends(get_current_user)):
+    """Session for read-only endpoints: the replica when it is safe, otherwise the primary."""
+    use_replica = read_router.use_replica(str(current_user.id), request_watermark(request))
+    session_factory = ReplicaSessionLocal if use_replica else SessionLocal
+    db = session_factory()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_read_db(request: Request, current_user: User = Depends(get_current_user)):
+    if read_router.engine is not None and read_router.lag_check_due():
+        await run_in_threadpool(read_router.refresh_lag)
+    use_replica = read_router.use_replica(str(current_user.id), request_watermark(request))
+    session_factory = AsyncReplicaSessionLocal if use_replica else AsyncSessionLocal
+    async with session_factory() as db:
+        yield db
+
+
+class ReadYourWritesMiddleware:
+    """
+    Pins a user to the primary after any successful non-GET request.
+
+    `get_current_user` records the authenticated user id in the request state; the
+    pin is taken before the response starts, so the client's next read sees it.
+    With a replica configured, the response also carries the signed write
+    watermark (cookie and header) for reads that land on another worker.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        state = scope.setdefault("state", {})
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and message["status"] < 400 and state.get("user_id"):
+                read_router.mark_write(state["user_id"])
+                if read_router.engine is not None:
+                    watermark = read_router.issue_watermark(state["user_id"])
+                    headers = MutableHeaders(scope=message)
+                    headers.append(WRITE_WATERMARK_HEADER, watermark)
+                    headers.append("set-cookie", (
+                        f"{WRITE_WATERMARK_COOKIE}={watermark}; Max-Age={math.ceil(read_router.pin_seconds)}; "
+                        "Path=/api; HttpOnly; SameSite=Lax"
+                    ))
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,134 @@
+# app/utils/study_stats.py
+from datetime import date
+from sqlalchemy import Date, Integer, and_, cast, event, func, literal_column, select
+from sqlalchemy.orm import Session
+from typing import Any, Dict, Optional
+import logging
+from app.models.study_session import StudySession
+from app.models.study_topic import StudyTopic
+from app.utils.cache import TTLCache
+from app.utils.config import STATS_CACHE_MAX_SIZE, STATS_CACHE_TTL_SECONDS
+from app.utils.etags import user_watermark
+
+logger = logging.getLogger("SmartStudyApp")
+
+# (sessions watermark, aggregates) keyed by (user_id, date_from, date_to)
+stats_cache = TTLCache(max_size=STATS_CACHE_MAX_SIZE, ttl=STATS_CACHE_TTL_SECONDS)
+
+_DIRTY_KEY = "study_stats_dirty_users"
+
+
+def _seconds_since_midnight(column, dialect: str):
+    if dialect == "postgresql":
+        return func.extract("epoch", column)
+    # SQLite keeps times as 'HH:MM:SS[.ffffff]' text
+    return (func.julianday(column) - func.julianday("00:00:00")) * 86400
+
+
+def duration_seconds(dialect: str):
+    """Session length in seconds; sessions that end before they start ran past midnight."""
+    span = _seconds_since_midnight(StudySession.end_time, dialect) - _seconds_since_midnight(StudySession.start_time, dialect)
+    return func.mod(func.round(span) + 86400, 86400) if dialect == "postgresql" else (cast(func.round(span), Integer) + 86400) % 86400
+
+
+def week_start(dialect: str):
+    """Monday of the session's week."""
+    if dialect == "postgresql":
+        # A literal, not a bind parameter, so SELECT and GROUP BY render the same expression
+        return cast(func.date_trunc(literal_column("'week'"), StudySession.date), Date)
+    return func.date(StudySession.date, "-6 days", "weekday 1")
+
+
+def compute_study_stats(db: Session, user_id, date_from: Optional[date] = None, date_to: Optional[date] = None) -> Dict[str, Any]:
+    """Hours per subject, per week and per topic, aggregated in the database."""
+    dialect = db.get_bind().dialect.name
+    seconds = duration_seconds(dialect)
+    conditions = [
+        StudySession.user_id == user_id,
+        StudySession.start_time.isnot(None),
+        StudySession.end_time.isnot(None),
+    ]
+    if date_from is not None:
+        conditions.append(StudySession.date >= date_from)
+    if date_to is not None:
+        conditions.append(StudySession.date <= date_to)
+    where = and_(*conditions)
+
+    def hours(total_seconds):
+        return round(float(total_seconds or 0) / 3600, 2)
+
+    subject_rows = db.execute(
+        select(StudySession.subject, func.count().label("sessions"), func.sum(seconds).label("seconds"))
+        .where(where).group_by(StudySession.subject).order_by(StudySession.subject)
+    ).all()
+    week = week_start(dialect).label("week_start")
+    week_rows = db.execute(
+        select(week, func.count().label("sessions"), func.sum(seconds).label("seconds"))
+        .where(where, StudySession.date.isnot(None)).group_by(week).order_by(week)
+    ).all()
+    topic_rows = db.execute(
+        select(StudySession.topic_id, StudyTopic.title, func.count().label("sessions"), func.sum(seconds).label("seconds"))
+        .join(StudyTopic, StudyTopic.id == StudySession.topic_id)
+        .where(where).group_by(StudySession.topic_id, StudyTopic.title).order_by(StudyTopic.title)
+    ).all()
+
+    return {
+        "total_sessions": sum(row.sessions for row in subject_rows),
+        "total_hours": hours(sum(float(row.seconds or 0) for row in subject_rows)),
+        "by_subject": [{"subject": row.subject, "sessions": row.sessions, "hours": hours(row.seconds)} for row in subject_rows],
+        "by_week": [
+            {"week_start": row.week_start if isinstance(row.week_start, date) else date.fromisoformat(row.week_start),
+             "sessions": row.sessions, "hours": hours(row.seconds)}
+            for row in week_rows
+        ],
+        "by_topic": [
+            {"topic_id": row.topic_id, "title": row.title, "sessions": row.sessions, "hours": hours(row.seconds)}
+            for row in topic_rows
+        ],
+    }
+
+
+def get_study_stats(db: Session, user_id, date_from: Optional[date] = None, date_to: Optional[date] = None) -> Dict[str, Any]:
+    """
+    Cached aggregates, checked against the user's sessions watermark on every read.
+
+    The watermark is one indexed query. It changes with any commit to the user's
+    sessions, so a write made in another worker is seen on the next read.
+    """
+    key = (str(user_id), date_from, date_to)
+    watermark = user_watermark(db, StudySession, user_id)
+    entry = stats_cache.get(key)
+    if entry is not None and entry[0] == watermark:
+        return entry[1]
+    stats = compute_study_stats(db, user_id, date_from, date_to)
+    stats_cache.set(key, (watermark, stats))
+    return stats
+
+
+def invalidate_study_stats(user_id) -> int:
+    return stats_cache.discard_where(lambda key: key[0] == str(user_id))
+
+
+def mark_stats_dirty(db: Session, user_id) -> None:
+    """Invalidate the user's stats once `db` commits (for writes that bypass the ORM unit of work)."""
+    db.info.setdefault(_DIRTY_KEY, set()).add(str(user_id))
+
+
+@event.listens_for(StudySession, "after_insert")
+@event.listens_for(StudySession, "after_update")
+@event.listens_for(StudySession, "after_delete")
+def _session_written(mapper, connection, target):
+    db = Session.object_session(target)
+    if db is not None:
+        mark_stats_dirty(db, target.user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(db):
+    for user_id in db.info.pop(_DIRTY_KEY, ()):
+        invalidate_study_stats(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_dirty_on_rollback(db):
+    db.info.pop(_DIRTY_KEY, None)
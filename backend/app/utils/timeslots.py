@@ -0,0 +1,124 @@
+# app/utils/timeslots.py
+from bisect import bisect_left
+from datetime import date, datetime, time, timedelta
+from itertools import accumulate
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from typing import Iterable, List, Optional, Tuple
+from app.models.study_session import StudySession
+
+Interval = Tuple[datetime, datetime]
+
+# Name of the Postgres exclusion constraint (migration 0006) that rejects overlapping sessions
+OVERLAP_CONSTRAINT = "ex_study_sessions_user_id_time_range"
+
+
+def session_interval(day: Optional[date], start: Optional[time], end: Optional[time]) -> Optional[Interval]:
+    """Half-open [start, end) of a session, or None if it is not fully scheduled; sessions that end before they start ran past midnight."""
+    if day is None or start is None or end is None:
+        return None
+    begin = datetime.combine(day, start)
+    finish = datetime.combine(day if end >= start else day + timedelta(days=1), end)
+    return begin, finish
+
+
+class IntervalIndex:
+    """
+    Static set of half-open intervals answering "does [start, end) overlap any of them?" in O(log n).
+
+    Intervals are sorted by start once; a running maximum of their ends tells whether
+    any interval starting before `end` reaches past `start`. Existing rows may
+    already overlap each other, which is why this is not a plain bisect on a
+    disjoint list.
+    """
+
+    def __init__(self, intervals: Iterable[Interval]):
+        ordered = sorted(i for i in intervals if i[0] < i[1])
+        self._starts = [start for start, _ in ordered]
+        self._max_ends = list(accumulate((end for _, end in ordered), max))
+
+    def overlaps(self, start: datetime, end: datetime) -> bool:
+        if start >= end:
+            return False
+        i = bisect_left(self._starts, end)
+        return i > 0 and self._max_ends[i - 1] > start
+
+
+def busy_intervals(db: Session, user_id, first_day: date, last_day: date, exclude_id=None) -> List[Interval]:
+    """
+    Intervals of the user's scheduled sessions that can touch [first_day, last_day], by start.
+
+    Reads only the three time columns through ix_study_sessions_user_id_date_start_time,
+    starting one day early to catch sessions that run past midnight.
+    """
+    query = (
+        select(StudySession.date, StudySession.start_time, StudySession.end_time)
+        .where(
+            StudySession.user_id == user_id,
+            StudySession.date >= first_day - timedelta(days=1),
+            StudySession.date <= last_day,
+            StudySession.start_time.isnot(None),
+            StudySession.end_time.isnot(None),
+        )
+        .order_by(StudySession.date, StudySession.start_time)
+    )
+    if exclude_id is not None:
+        query = query.where(StudySession.id != exclude_id)
+    return [interval for row in db.execute(query) if (interval := session_interval(*row))]
+
+
+def overlaps_existing(db: Session, user_id, interval: Optional[Interval], exclude_id=None) -> bool:
+    """True if `interval` overlaps one of the user's other sessions."""
+    if interval is None:
+        return False
+    start, end = interval
+    return IntervalIndex(busy_intervals(db, user_id, start.date(), end.date(), exclude_id)).overlaps(start, end)
+
+
+def merge_intervals(intervals: Iterable[Interval]) -> List[Interval]:
+    """Union of intervals already sorted by start, as disjoint intervals."""
+    merged: List[Interval] = []
+    for start, end in intervals:
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def free_slots(busy: Iterable[Interval], windows: Iterable[Interval], min_length: timedelta = timedelta(0)) -> List[Interval]:
+    """
+    Parts of each window not covered by a busy interval, at least `min_length` long.
+
+    Both inputs must be sorted by start and `windows` must be disjoint. One pass
+    over both lists, so the cost is dominated by sorting `busy`.
+    """
+    merged = merge_intervals(busy)
+    slots: List[Interval] = []
+    i = 0
+    for window_start, window_end in windows:
+        # Busy intervals that end before this window cannot touch it or any later one
+        while i < len(merged) and merged[i][1] <= window_start:
+            i += 1
+        cursor = window_start
+        j = i
+        while j < len(merged) and merged[j][0] < window_end:
+            if merged[j][0] > cursor and merged[j][0] - cursor >= min_length:
+                slots.append((cursor, merged[j][0]))
+            cursor = max(cursor, merged[j][1])
+            j += 1
+        if cursor < window_end and window_end - cursor >= min_length:
+            slots.append((cursor, window_end))
+    return slots
+
+
+def day_windows(first_day: date, last_day: date, day_start: time, day_end: Optional[time]) -> List[Interval]:
+    """One [day_start, day_end) window per day; day_end None means midnight."""
+    windows = []
+    day = first_day
+    while day <= last_day:
+        end = datetime.combine(day, day_end) if day_end is not None else datetime.combine(day + timedelta(days=1), time())
+        windows.append((datetime.combine(day, day_start), end))
+        day += timedelta(days=1)
+    return windows
@@ -0,0 +1,70 @@
+# app/utils/worker_pool.py
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Callable, Dict, Optional
+import asyncio
+import functools
+
+
+class PoolSaturated(Exception):
+    """Raised when a BoundedWorkerPool already has its maximum number of jobs pending."""
+
+
+class BoundedWorkerPool:
+    """
+    Thread pool for CPU-heavy work that must stay off the event loop and the
+    shared request threadpool.
+
+    At most `max_workers` jobs run at once and at most `max_queue` more wait for a
+    worker; anything beyond that is rejected immediately with PoolSaturated so
+    callers can shed load instead of piling up.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int, thread_name_prefix: str = "worker"):
+        self.max_workers = max(1, max_workers)
+        self.max_queue = max(0, max_queue)
+        self._thread_name_prefix = thread_name_prefix
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = Lock()
+        self._pending = 0
+        self.completed = 0
+        self.rejected = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        # Created lazily so forked worker processes never inherit a parent's threads
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix=self._thread_name_prefix
+            )
+        return self._executor
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            if self._pending >= self.max_workers + self.max_queue:
+                self.rejected += 1
+                raise PoolSaturated(f"{self._thread_name_prefix} pool is full")
+            self._pending += 1
+            executor = self._get_executor()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, functools.partial(fn, *args))
+        finally:
+            with self._lock:
+                self._pending -= 1
+                self.completed += 1
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "pending": self._pending,
+                "completed": self.completed,
+                "rejected": self.rejected,
+            }
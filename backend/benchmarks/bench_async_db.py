@@ -0,0 +1,100 @@
+# benchmarks/bench_async_db.py
+"""
+Requests/sec for concurrent quiz listings served by a single event loop (one
+uvicorn worker): the previous `async def` handler running blocking queries on the
+sync session, against the AsyncSession-based GET /api/quizzes/.
+
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_async_db --requests 2000 --concurrency 50
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import datetime
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal, get_db
+from app.main import app
+from app.models.quiz import Quiz
+from app.models.quiz_attempt import QuizAttempt
+from app.models.user import User
+from app.routes.quizzes import DEFAULT_USER_ID
+from app.utils.auth import get_current_user
+from app.utils.quiz_catalog import bump_catalog_version
+from benchmarks.common import create_benchmark_user, print_table
+
+# The pre-async handler, reproduced so both variants run against the same data
+legacy_app = FastAPI()
+
+
+@legacy_app.get("/api/quizzes/")
+async def legacy_get_quizzes(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+    quizzes = db.query(Quiz).filter(Quiz.user_id == DEFAULT_USER_ID).all()
+    attempts = db.query(QuizAttempt).filter(
+        QuizAttempt.user_id == current_user.id,
+        QuizAttempt.quiz_id.in_([quiz.id for quiz in quizzes])
+    ).all()
+    attempt_map = {attempt.quiz_id: attempt for attempt in attempts}
+    return [
+        {"id": str(quiz.id), "title": quiz.title, "status": getattr(attempt_map.get(quiz.id), "status", quiz.status)}
+        for quiz in quizzes
+    ]
+
+
+def seed_catalog(db, quiz_count: int, questions: int = 10) -> None:
+    if db.get(User, uuid.UUID(DEFAULT_USER_ID)) is None:
+        db.add(User(id=uuid.UUID(DEFAULT_USER_ID), name="Catalog", email="catalog@example.com",
+                    password_hash="!", created_at=datetime.utcnow(), updated_at=datetime.utcnow()))
+        db.flush()
+    existing = db.query(Quiz).filter(Quiz.user_id == DEFAULT_USER_ID).count()
+    db.add_all([
+        Quiz(id=uuid.uuid4(), user_id=DEFAULT_USER_ID, title=f"Benchmark quiz {existing + i}", subject="GATE CS",
+             topic="Mock", difficulty="Medium", time_limit=60, status="not-started",
+             questions=[{"question_text": "Q", "options": ["a", "b", "c", "d"], "correct_answer": 0,
+                         "marks": 1, "negative_marks": -0.33}] * questions)
+        for i in range(max(0, quiz_count - existing))
+    ])
+    db.execute(bump_catalog_version())
+    db.commit()
+
+
+async def drive(target: FastAPI, token: str, total: int, concurrency: int) -> float:
+    headers = {"Authorization": f"Bearer {token}"}
+    semaphore = asyncio.Semaphore(concurrency)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=target), base_url="http://bench") as client:
+        async def one():
+            async with semaphore:
+                response = await client.get("/api/quizzes/", headers=headers)
+                response.raise_for_status()
+
+        await asyncio.gather(*(one() for _ in range(min(20, total))))  # warm up pools
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(total)))
+        return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--quizzes", type=int, default=20)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    seed_catalog(db, args.quizzes)
+    _, token = create_benchmark_user(db)
+    db.close()
+
+    rows = []
+    for label, target in (("sync session in async def", legacy_app), ("AsyncSession", app)):
+        elapsed = asyncio.run(drive(target, token, args.requests, args.concurrency))
+        rows.append({"handler": label, "requests": args.requests, "seconds": round(elapsed, 3),
+                     "req_per_s": round(args.requests / elapsed, 1)})
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
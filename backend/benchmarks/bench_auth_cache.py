@@ -0,0 +1,68 @@
+# benchmarks/bench_auth_cache.py
+"""
+p50/p99 latency of GET /api/study-plan/sessions with the authenticated-user cache
+disabled (one full users-row load per request) and enabled (one updated_at probe).
+
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_auth_cache --requests 2000
+"""
+import argparse
+import uuid
+from datetime import date, datetime, time, timedelta
+
+from fastapi.testclient import TestClient
+
+from app.database import SessionLocal
+from app.main import app
+from app.models.study_session import StudySession
+from app.utils import auth
+from benchmarks.common import create_benchmark_user, print_table, summarize, time_calls
+
+
+def seed_sessions(db, user_id, count: int) -> None:
+    db.add_all([
+        StudySession(
+            id=uuid.uuid4(),
+            user_id=user_id,
+            title=f"Session {i}",
+            date=date(2025, 1, 1) + timedelta(days=i),
+            start_time=time(9, 0),
+            end_time=time(10, 30),
+            subject="Algorithms",
+            completed=bool(i % 2),
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow(),
+        )
+        for i in range(count)
+    ])
+    db.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--sessions", type=int, default=20, help="Sessions seeded for the benchmark user")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    user, token = create_benchmark_user(db)
+    seed_sessions(db, user.id, args.sessions)
+    db.close()
+
+    client = TestClient(app)
+    headers = {"Authorization": f"Bearer {token}"}
+    call = lambda: client.get("/api/study-plan/sessions", headers=headers)
+
+    configured_size = auth.user_cache.max_size
+    rows = []
+    for label, max_size in (("cache disabled", 0), ("cache enabled", configured_size or 1024)):
+        auth.user_cache.clear()
+        auth.user_cache.max_size = max_size
+        rows.append({"mode": label, **summarize(time_calls(call, args.requests))})
+    auth.user_cache.max_size = configured_size
+
+    print_table(rows)
+    print("cache stats:", auth.user_cache.stats())
+
+
+if __name__ == "__main__":
+    main()
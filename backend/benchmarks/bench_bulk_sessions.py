@@ -0,0 +1,110 @@
+# benchmarks/bench_bulk_sessions.py
+"""
+Sessions/sec imported one request at a time (POST /api/study-plan/sessions) against
+POST /api/study-plan/sessions/bulk, spread over --topics topics of one user. Afterwards, checks that importing history
+older than a topic's last study leaves its revision schedule alone.
+
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_bulk_sessions --sessions 2000 --batch-size 500
+"""
+import argparse
+import time
+from datetime import date, timedelta
+
+from fastapi.testclient import TestClient
+
+from app.database import SessionLocal
+from app.main import app
+from benchmarks.common import create_benchmark_user, print_table
+
+
+# Non-overlapping hour slots per day, so no session is rejected as a double booking
+SLOTS_PER_DAY = 12
+
+
+def session_payloads(count: int, topic_ids, first_day: date):
+    return [
+        {
+            "title": f"Imported session {i}",
+            "date": (first_day + timedelta(days=i // SLOTS_PER_DAY)).isoformat(),
+            "start_time": f"{8 + i % SLOTS_PER_DAY:02d}:00:00",
+            "end_time": f"{8 + i % SLOTS_PER_DAY:02d}:50:00",
+            "comprehension_level": 1 + i % 5,
+            "completed": True,
+            "topic_id": topic_ids[i % len(topic_ids)],
+        }
+        for i in range(count)
+    ]
+
+
+def check_history_import(client, headers) -> None:
+    """Importing sessions older than a topic's last study must add hours without moving its schedule back."""
+    topic_id = client.post("/api/study-plan/topics", json={"title": "History check", "subject": "GATE CS",
+                                                            "estimated_hours": 20}, headers=headers).json()["id"]
+    recent = {"title": "Recent", "date": "2030-10-01", "start_time": "09:00:00", "end_time": "10:00:00",
+              "comprehension_level": 4, "completed": True}
+    before = client.post(f"/api/study-plan/sessions?topic_id={topic_id}", json=recent, headers=headers).json()["topic"]
+    history = [
+        {"title": "History", "topic_id": topic_id, "date": day, "start_time": "09:00:00", "end_time": "10:00:00",
+         "comprehension_level": 2, "completed": True}
+        for day in ("2030-09-01", "2030-09-02")
+    ]
+    client.post("/api/study-plan/sessions/bulk", json={"sessions": history}, headers=headers).raise_for_status()
+    after = next(t for t in client.get("/api/study-plan/topics?limit=500", headers=headers).json() if t["id"] == topic_id)
+    for field in ("last_studied", "next_revision"):
+        if after[field] != before[field]:
+            raise RuntimeError(f"history import changed {field}: {before[field]} -> {after[field]}")
+    if after["actual_hours"] != before["actual_hours"] + 2:
+        raise RuntimeError(f"history import added {after['actual_hours'] - before['actual_hours']} hours, expected 2")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=2000)
+    parser.add_argument("--topics", type=int, default=50)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        _, token = create_benchmark_user(db)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    rows = []
+    with TestClient(app) as client:
+        def new_topics():
+            return [
+                client.post("/api/study-plan/topics", json={"title": f"Topic {i}", "subject": "GATE CS",
+                                                             "estimated_hours": 20}, headers=headers).json()["id"]
+                for i in range(args.topics)
+            ]
+
+        first_day = date(2025, 1, 1)
+        payloads = session_payloads(args.sessions, new_topics(), first_day)
+        started = time.perf_counter()
+        for payload in payloads:
+            topic_id = payload.pop("topic_id")
+            response = client.post(f"/api/study-plan/sessions?topic_id={topic_id}", json=payload, headers=headers)
+            response.raise_for_status()
+        elapsed = time.perf_counter() - started
+        rows.append({"endpoint": "POST /sessions", "requests": len(payloads), "seconds": round(elapsed, 2),
+                     "sessions_per_sec": round(len(payloads) / elapsed)})
+
+        # The bulk run follows the per-request run's days instead of double-booking them
+        payloads = session_payloads(args.sessions, new_topics(), first_day + timedelta(days=args.sessions // SLOTS_PER_DAY + 1))
+        started = time.perf_counter()
+        requests = 0
+        for offset in range(0, len(payloads), args.batch_size):
+            response = client.post("/api/study-plan/sessions/bulk",
+                                   json={"sessions": payloads[offset:offset + args.batch_size]}, headers=headers)
+            response.raise_for_status()
+            requests += 1
+        elapsed = time.perf_counter() - started
+        rows.append({"endpoint": f"POST /sessions/bulk ({args.batch_size}/req)", "requests": requests,
+                     "seconds": round(elapsed, 2), "sessions_per_sec": round(len(payloads) / elapsed)})
+
+        check_history_import(client, headers)
+
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# benchmarks/bench_etags.py
+"""
+Bytes, latency, CPU time and SQL statements per poll of the quiz and study-plan
+reads, unconditional against If-None-Match with the current ETag (a 304). CPU
+time is process time per request, client included, as the test client runs in
+process.
+
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_etags --quizzes 200 --requests 200
+"""
+import argparse
+import statistics
+import time
+from datetime import date, timedelta
+
+from fastapi.testclient import TestClient
+
+from app.database import SessionLocal
+from app.main import app
+from benchmarks.bench_async_db import seed_catalog
+from benchmarks.bench_write_roundtrips import QUERY_COUNT
+from benchmarks.common import create_benchmark_user, print_table, summarize
+
+
+def poll(client, url: str, headers: dict, requests: int, expected: int):
+    samples, counts, size = [], [], 0
+    cpu_started = time.process_time()
+    for _ in range(requests):
+        started = time.perf_counter()
+        response = client.get(url, headers=headers)
+        samples.append(time.perf_counter() - started)
+        if response.status_code != expected:
+            raise RuntimeError(f"GET {url} returned {response.status_code}, expected {expected}")
+        match = QUERY_COUNT.search(response.headers.get("server-timing", ""))
+        counts.append(int(match.group(1)) if match else -1)
+        size = len(response.content)
+    cpu_ms = (time.process_time() - cpu_started) * 1000 / requests
+    return {"bytes": size, "statements": statistics.median(counts), "cpu_ms": round(cpu_ms, 3), **summarize(samples)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--quizzes", type=int, default=200)
+    parser.add_argument("--sessions", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        seed_catalog(db, args.quizzes)
+        _, token = create_benchmark_user(db)
+    auth = {"Authorization": f"Bearer {token}"}
+
+    with TestClient(app) as client:
+        topic_id = client.post("/api/study-plan/topics", json={"title": "Benchmark topic", "subject": "GATE CS",
+                                                                "estimated_hours": 1000}, headers=auth).json()["id"]
+        client.post("/api/study-plan/sessions/bulk", headers=auth, json={"sessions": [
+            {"title": "Session", "topic_id": topic_id, "date": (date(2025, 1, 1) + timedelta(days=i)).isoformat(),
+             "start_time": "09:00:00", "end_time": "10:00:00"}
+            for i in range(args.sessions)
+        ]}).raise_for_status()
+        quiz_id = client.get("/api/quizzes/?view=summary", headers=auth).json()[0]["id"]
+
+        rows = []
+        for url in ("/api/quizzes/", "/api/quizzes/?view=summary", f"/api/quizzes/{quiz_id}",
+                    "/api/study-plan/topics", "/api/study-plan/sessions"):
+            etag = client.get(url, headers=auth).headers["etag"]
+            name = url.replace(quiz_id, "{quiz_id}")
+            for mode, headers, expected in (("unconditional", auth, 200),
+                                            ("if-none-match", {**auth, "If-None-Match": etag}, 304)):
+                rows.append({"endpoint": name, "request": mode, **poll(client, url, headers, args.requests, expected)})
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# benchmarks/bench_export.py
+"""
+Throughput of GET /api/export for one user with --sessions sessions, and peak
+Python memory of the export encoder itself (TestClient buffers whole bodies, and
+tracing allocations slows everything down, so memory is measured without HTTP).
+Peak memory should stay flat as --sessions grows.
+
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_export --sessions 200000
+"""
+import argparse
+import time
+import tracemalloc
+import uuid
+from datetime import date, datetime, time as time_of_day, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+
+from app.database import SessionLocal
+from app.main import app
+from app.models.study_session import StudySession
+from app.routes.export import _encode_chunks
+from benchmarks.common import create_benchmark_user, print_table
+
+
+def seed_sessions(db, user_id, count: int) -> None:
+    now = datetime.utcnow()
+    for offset in range(0, count, 10000):
+        db.execute(insert(StudySession), [
+            {"id": uuid.uuid4(), "user_id": user_id, "title": f"Session {i}", "date": date(2000, 1, 1) + timedelta(days=i // 8),
+             "start_time": time_of_day(8 + i % 8), "end_time": time_of_day(8 + i % 8, 50), "subject": f"Subject {i % 6}", "completed": True, "comprehension_level": 1 + i % 5, "notes": "Exported by the benchmark",
+             "created_at": now, "updated_at": now}
+            for i in range(offset, min(count, offset + 10000))
+        ])
+    db.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=200_000)
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        user, token = create_benchmark_user(db)
+        user_id = user.id
+        seed_sessions(db, user_id, args.sessions)
+
+    rows = []
+    with TestClient(app) as client:
+        for fmt, encoding in (("ndjson", "identity"), ("ndjson", "gzip"), ("csv", "identity")):
+            params = {"format": fmt, "resources": "sessions"}
+            headers = {"Authorization": f"Bearer {token}", "Accept-Encoding": encoding}
+            started = time.perf_counter()
+            with client.stream("GET", "/api/export", params=params, headers=headers) as response:
+                wire_bytes = sum(len(chunk) for chunk in response.iter_raw())
+            elapsed = time.perf_counter() - started
+
+            with SessionLocal() as db:
+                tracemalloc.start()
+                for _ in _encode_chunks(db, user_id, ["sessions"], None, fmt):
+                    pass
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+            rows.append({"format": fmt, "encoding": encoding, "rows": args.sessions, "seconds": round(elapsed, 2),
+                         "rows_per_sec": round(args.sessions / elapsed), "wire_mb": round(wire_bytes / 2**20, 1),
+                         "encoder_peak_mb": round(peak / 2**20, 1)})
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
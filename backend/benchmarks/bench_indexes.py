@@ -0,0 +1,117 @@
+# benchmarks/bench_indexes.py
+"""
+EXPLAIN ANALYZE snapshots of the quiz listing and study-session listing queries on
+a seeded Postgres database, with and without the per-user indexes from migration
+0002. The "without" plans are taken inside a transaction that drops the indexes
+and is rolled back, so the database is left unchanged.
+
+    DATABASE_URL=postgresql://... alembic upgrade head
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_indexes --rows 1000000 --output explain.txt
+"""
+import argparse
+import time
+
+from sqlalchemy import text
+
+from app.database import engine
+from app.routes.quizzes import DEFAULT_USER_ID
+
+SEED_SQL = [
+    """
+    INSERT INTO users (id, name, email, password_hash)
+    SELECT md5('bench-user-' || g)::uuid, 'Bench ' || g, 'bench-' || g || '@example.com', '!'
+    FROM generate_series(0, :users - 1) g
+    ON CONFLICT DO NOTHING
+    """,
+    """
+    INSERT INTO users (id, name, email, password_hash)
+    VALUES (CAST(:default_user AS uuid), 'Catalog', 'catalog@example.com', '!')
+    ON CONFLICT DO NOTHING
+    """,
+    """
+    INSERT INTO quizzes (id, user_id, title, subject, topic, difficulty, time_limit, status, questions)
+    SELECT md5('bench-quiz-' || g)::uuid,
+           CASE WHEN g < 50 THEN CAST(:default_user AS uuid) ELSE md5('bench-user-' || (g % :users))::uuid END,
+           'Quiz ' || g, 'Subject ' || (g % 8), 'Topic', 'Medium', 60, 'not-started', '[]'::json
+    FROM generate_series(0, :quizzes - 1) g
+    ON CONFLICT DO NOTHING
+    """,
+    """
+    INSERT INTO quiz_attempts (id, user_id, quiz_id, status, score, started_at)
+    SELECT gen_random_uuid(), md5('bench-user-' || (g % :users))::uuid,
+           md5('bench-quiz-' || (g % :quizzes))::uuid, 'completed', g % 100, now()
+    FROM generate_series(0, :rows - 1) g
+    """,
+    """
+    INSERT INTO study_sessions (id, user_id, title, date, start_time, end_time, subject, completed, created_at, updated_at)
+    SELECT gen_random_uuid(), md5('bench-user-' || (g % :users))::uuid, 'Session ' || g,
+           DATE '2024-01-01' + (g / :users) / 10, TIME '08:00' + (g / :users % 10) * INTERVAL '1 hour',
+           TIME '09:00' + (g / :users % 10) * INTERVAL '1 hour', 'Subject ' || (g % 8), g % 2 = 0, now(), now()
+    FROM generate_series(0, :rows - 1) g
+    """,
+    "ANALYZE users, quizzes, quiz_attempts, study_sessions",
+]
+
+QUERIES = {
+    "quiz listing: shared catalog": (
+        "SELECT id, title FROM quizzes WHERE user_id = CAST(:default_user AS uuid)",
+        ["ix_quizzes_user_id_title"],
+    ),
+    "quiz listing: user attempt overlay": (
+        """SELECT * FROM quiz_attempts WHERE user_id = md5('bench-user-1')::uuid
+           AND quiz_id IN (SELECT id FROM quizzes WHERE user_id = CAST(:default_user AS uuid))""",
+        ["ix_quiz_attempts_user_id_quiz_id", "ix_quizzes_user_id_title"],
+    ),
+    "session listing": (
+        "SELECT * FROM study_sessions WHERE user_id = md5('bench-user-1')::uuid LIMIT 100",
+        ["ix_study_sessions_user_id_date_start_time"],
+    ),
+}
+
+
+def explain(connection, sql: str) -> str:
+    rows = connection.execute(text("EXPLAIN (ANALYZE, BUFFERS) " + sql), {"default_user": DEFAULT_USER_ID})
+    return "\n".join(row[0] for row in rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Rows seeded into quiz_attempts and study_sessions")
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--quizzes", type=int, default=100_000)
+    parser.add_argument("--skip-seed", action="store_true", help="Reuse rows from a previous run")
+    parser.add_argument("--output", help="Also write the plans to this file")
+    args = parser.parse_args()
+
+    if engine.dialect.name != "postgresql":
+        raise SystemExit("bench_indexes needs a Postgres DATABASE_URL")
+
+    if not args.skip_seed:
+        started = time.perf_counter()
+        with engine.begin() as connection:
+            for statement in SEED_SQL:
+                connection.execute(text(statement), {
+                    "users": args.users, "quizzes": args.quizzes, "rows": args.rows, "default_user": DEFAULT_USER_ID,
+                })
+        print(f"seeded {args.rows:,} attempts and sessions in {time.perf_counter() - started:.1f}s")
+
+    report = []
+    for label, (sql, indexes) in QUERIES.items():
+        with engine.connect() as connection:
+            with_indexes = explain(connection, sql)
+            for name in indexes:
+                connection.execute(text(f"DROP INDEX IF EXISTS {name}"))
+            without_indexes = explain(connection, sql)
+            connection.rollback()  # restores the dropped indexes
+        report.append(f"=== {label} (without indexes) ===\n{without_indexes}\n")
+        report.append(f"=== {label} (with indexes) ===\n{with_indexes}\n")
+
+    output = "\n".join(report)
+    print(output)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# benchmarks/bench_login_storm.py
+"""
+Login storm: fire many concurrent POST /api/auth/login requests and measure login
+throughput, how many were shed with 503, and the latency of an unrelated route
+(GET /) probed while the storm is running compared to an idle baseline.
+
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_login_storm --logins 500 --concurrency 100
+"""
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from app.database import SessionLocal
+from app.main import app
+from app.utils import auth
+from benchmarks.common import create_benchmark_user, print_table, summarize
+
+PASSWORD = "benchmark-password"
+
+
+async def probe(client: httpx.AsyncClient, samples: list, stop: asyncio.Event, interval: float) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await client.get("/")
+        samples.append(time.perf_counter() - started)
+        await asyncio.sleep(interval)
+
+
+async def storm(email: str, logins: int, concurrency: int, probe_interval: float):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        idle = []
+        idle_stop = asyncio.Event()
+        idle_task = asyncio.create_task(probe(client, idle, idle_stop, probe_interval))
+        await asyncio.sleep(1.0)
+        idle_stop.set()
+        await idle_task
+
+        semaphore = asyncio.Semaphore(concurrency)
+        statuses = {}
+        latencies = []
+
+        async def login_once():
+            async with semaphore:
+                started = time.perf_counter()
+                response = await client.post("/api/auth/login", json={"email": email, "password": PASSWORD})
+                latencies.append(time.perf_counter() - started)
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+        busy = []
+        busy_stop = asyncio.Event()
+        busy_task = asyncio.create_task(probe(client, busy, busy_stop, probe_interval))
+        started = time.perf_counter()
+        await asyncio.gather(*(login_once() for _ in range(logins)))
+        elapsed = time.perf_counter() - started
+        busy_stop.set()
+        await busy_task
+        return idle, busy, latencies, statuses, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=300)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--probe-interval", type=float, default=0.01)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    user, _ = create_benchmark_user(db, password=PASSWORD)
+    email = user.email
+    db.close()
+
+    idle, busy, latencies, statuses, elapsed = asyncio.run(
+        storm(email, args.logins, args.concurrency, args.probe_interval)
+    )
+    ok = statuses.get(200, 0)
+    print(f"logins: {args.logins}  ok: {ok}  shed (503): {statuses.get(503, 0)}  other: "
+          f"{sum(v for k, v in statuses.items() if k not in (200, 503))}")
+    print(f"login throughput: {ok / elapsed:.1f} logins/s over {elapsed:.2f}s")
+    print_table([
+        {"series": "login latency", **summarize(latencies)},
+        {"series": "GET / idle", **summarize(idle)},
+        {"series": "GET / during storm", **summarize(busy)},
+    ])
+    print("password pool:", auth.password_pool.stats())
+
+
+if __name__ == "__main__":
+    main()
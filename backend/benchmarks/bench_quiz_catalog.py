@@ -0,0 +1,55 @@
+# benchmarks/bench_quiz_catalog.py
+"""
+Latency and SQL statements per GET /api/quizzes/ and GET /api/quizzes/{id} with
+the quiz catalog cache cold (cleared before every request, so each one loads,
+validates and encodes the catalog as the uncached handler did) and warm (one
+overlay query per request). The user has attempted a fraction of the quizzes.
+
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_quiz_catalog --quizzes 20 200 --requests 200
+"""
+import argparse
+
+from fastapi.testclient import TestClient
+
+from app.database import SessionLocal
+from app.main import app
+from app.utils.quiz_catalog import quiz_catalog
+from benchmarks.bench_async_db import seed_catalog
+from benchmarks.bench_write_roundtrips import measure
+from benchmarks.common import create_benchmark_user, print_table
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--quizzes", type=int, nargs="+", default=[20, 200])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--attempted", type=float, default=0.25, help="fraction of quizzes the user has attempted")
+    args = parser.parse_args()
+
+    rows = []
+    with TestClient(app) as client:
+        for quiz_count in args.quizzes:
+            with SessionLocal() as db:
+                seed_catalog(db, quiz_count)
+                _, token = create_benchmark_user(db)
+            auth = {"Authorization": f"Bearer {token}"}
+            quizzes = client.get("/api/quizzes/", headers=auth).json()
+            for quiz in quizzes[:int(len(quizzes) * args.attempted)]:
+                client.post(f"/api/quizzes/{quiz['id']}/attempt", json={"status": "completed", "score": 70}, headers=auth)
+            endpoints = (("list", "/api/quizzes/"), ("detail", f"/api/quizzes/{quizzes[0]['id']}"))
+
+            for cache in ("cold", "warm"):
+                for endpoint, url in endpoints:
+                    def request(_):
+                        if cache == "cold":
+                            quiz_catalog.clear()
+                        return "GET", url, {"headers": auth}
+
+                    latency, statements = measure(client, request, args.requests)
+                    rows.append({"quizzes": len(quizzes), "endpoint": endpoint, "cache": cache,
+                                 "statements": statements, **latency})
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
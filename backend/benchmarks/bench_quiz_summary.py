@@ -0,0 +1,52 @@
+# benchmarks/bench_quiz_summary.py
+"""
+Payload size, latency and SQL statements of GET /api/quizzes/ (full quizzes with
+their questions) against GET /api/quizzes/?view=summary, with the catalog cache
+cold (reloaded on every request) and warm. The catalog is full-length mocks.
+
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_quiz_summary --quizzes 200 --questions 65
+"""
+import argparse
+
+from fastapi.testclient import TestClient
+
+from app.database import SessionLocal
+from app.main import app
+from app.utils.quiz_catalog import quiz_catalog, quiz_summaries
+from benchmarks.bench_async_db import seed_catalog
+from benchmarks.bench_write_roundtrips import measure
+from benchmarks.common import create_benchmark_user, print_table
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--quizzes", type=int, default=200)
+    parser.add_argument("--questions", type=int, default=65)
+    parser.add_argument("--requests", type=int, default=100)
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        seed_catalog(db, args.quizzes, args.questions)
+        _, token = create_benchmark_user(db)
+    auth = {"Authorization": f"Bearer {token}"}
+
+    rows = []
+    with TestClient(app) as client:
+        for view, url in (("full", "/api/quizzes/"), ("summary", "/api/quizzes/?view=summary")):
+            body = client.get(url, headers=auth)
+            body.raise_for_status()
+            for cache in ("cold", "warm"):
+                def request(_):
+                    if cache == "cold":
+                        quiz_catalog.clear()
+                        quiz_summaries.clear()
+                    return "GET", url, {"headers": auth}
+
+                latency, statements = measure(client, request, args.requests)
+                rows.append({"view": view, "cache": cache, "quizzes": len(body.json()), "bytes": len(body.content),
+                             "statements": statements, **latency})
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# benchmarks/bench_recompute_schedule.py
+"""
+Throughput of the bulk next_revision recompute (app/ml/recompute_schedule.py) on a
+seeded Postgres database: --topics topics on their first review, each with two
+rated sessions.
+Also times predict_next_revision in a loop against predict_next_revision_batch.
+
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_recompute_schedule --topics 1000000
+"""
+import argparse
+import time
+
+import numpy as np
+from sqlalchemy import text
+
+from app.database import SessionLocal, engine
+from app.ml.recompute_schedule import recompute_next_revisions
+from app.ml.revision_model import predict_next_revision, predict_next_revision_batch
+from benchmarks.common import print_table
+
+SEED_SQL = [
+    """
+    INSERT INTO users (id, name, email, password_hash)
+    SELECT md5('bench-user-' || g)::uuid, 'Bench ' || g, 'bench-' || g || '@example.com', '!'
+    FROM generate_series(0, :users - 1) g
+    ON CONFLICT DO NOTHING
+    """,
+    """
+    INSERT INTO study_topics (id, user_id, title, subject, estimated_hours, actual_hours, status, created_at, updated_at)
+    SELECT md5('bench-topic-' || g)::uuid, md5('bench-user-' || (g % :users))::uuid, 'Topic ' || g,
+           'Subject ' || (g % 8), 10, 0, 'in_progress', now(), now()
+    FROM generate_series(0, :topics - 1) g
+    ON CONFLICT DO NOTHING
+    """,
+    """
+    INSERT INTO study_sessions (id, user_id, topic_id, title, date, start_time, end_time, comprehension_level, created_at, updated_at)
+    SELECT gen_random_uuid(), md5('bench-user-' || (g % :users))::uuid, md5('bench-topic-' || (g % :topics))::uuid,
+           'Session ' || g, DATE '2025-01-01' + (g / :users) / 6, TIME '08:00' + (g / :users % 6) * INTERVAL '1 hour',
+           TIME '08:50' + (g / :users % 6) * INTERVAL '1 hour', 1 + g % 5, now(), now()
+    FROM generate_series(0, 2 * :topics - 1) g
+    """,
+    # Topics on their first review, so their interval comes from the model and the job rescores them
+    """
+    UPDATE study_topics t SET review_count = 1, last_studied = s.last_date
+    FROM (SELECT topic_id, max(date) AS last_date FROM study_sessions GROUP BY topic_id) s
+    WHERE t.id = s.topic_id AND t.id::text LIKE '%'
+      AND t.user_id IN (SELECT md5('bench-user-' || g)::uuid FROM generate_series(0, :users - 1) g)
+    """,
+    "ANALYZE study_topics, study_sessions",
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--topics", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=20_000)
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--skip-seed", action="store_true")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    levels = rng.integers(1, 6, 100_000)
+    minutes = rng.uniform(15, 240, 100_000)
+    started = time.perf_counter()
+    for level, duration in zip(levels[:10_000], minutes[:10_000]):
+        predict_next_revision(int(level), float(duration))
+    scalar_rate = 10_000 / (time.perf_counter() - started)
+    started = time.perf_counter()
+    predict_next_revision_batch(levels, minutes)
+    batch_rate = len(levels) / (time.perf_counter() - started)
+    print_table([
+        {"prediction": "predict_next_revision loop", "rows_per_sec": round(scalar_rate)},
+        {"prediction": "predict_next_revision_batch", "rows_per_sec": round(batch_rate)},
+    ])
+
+    if engine.dialect.name != "postgresql":
+        raise SystemExit("the recompute part of this benchmark needs a Postgres DATABASE_URL")
+    if not args.skip_seed:
+        with engine.begin() as connection:
+            for statement in SEED_SQL:
+                connection.execute(text(statement), {"users": args.users, "topics": args.topics})
+
+    with SessionLocal() as db:
+        print(recompute_next_revisions(db, chunk_size=args.chunk_size))
+
+
+if __name__ == "__main__":
+    main()
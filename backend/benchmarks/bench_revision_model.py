@@ -0,0 +1,48 @@
+# benchmarks/bench_revision_model.py
+"""
+Per-prediction cost of the revision model: the previous path (os.path.exists plus
+pickle.load on every call) against the in-memory ModelRegistry. No database needed.
+
+    python -m benchmarks.bench_revision_model --iterations 5000
+"""
+import argparse
+import os
+import pickle
+import tempfile
+
+import numpy as np
+
+from app.ml import revision_model
+from app.ml.revision_model import ModelRegistry, save_model, train_default_model
+from benchmarks.common import print_table, summarize, time_calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=5000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "revision_model.pkl")
+        save_model(train_default_model(), path)
+
+        def unpickle_per_call():
+            if not os.path.exists(path):
+                return 7
+            with open(path, "rb") as f:
+                model = pickle.load(f)
+            return max(1, int(round(model.predict(np.array([[3, 90.0]]))[0])))
+
+        revision_model.registry = ModelRegistry(path, check_interval=5.0)
+        registry_call = lambda: revision_model.predict_next_revision(3, 90.0)
+
+        rows = [
+            {"path": "exists + pickle.load per call", **summarize(time_calls(unpickle_per_call, args.iterations))},
+            {"path": "ModelRegistry (in memory)", **summarize(time_calls(registry_call, args.iterations))},
+        ]
+        print_table(rows)
+        print("active model version:", revision_model.registry.active_version)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+# benchmarks/bench_serialization.py
+"""
+Serialization cost of a --rows study-session listing, isolated from the database:
+the previous handler (a hand-built dict per row with strftime per field, validated
+against string-typed fields with custom json_encoders) against the current one
+(ORM objects straight into the typed StudySessionResponse, which FastAPI dumps to
+JSON bytes in Pydantic's core). Both apps serve the same in-memory rows.
+
+    python -m benchmarks.bench_serialization --rows 10000
+"""
+import argparse
+import uuid
+from datetime import date, datetime, time
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from app.models.study_session import StudySession
+from app.schemas.study_plan import StudySessionResponse
+from benchmarks.common import print_table, summarize, time_calls
+
+
+class LegacyStudySessionResponse(BaseModel):
+    id: UUID
+    user_id: UUID
+    topic_id: Optional[UUID]
+    title: str
+    date: Optional[str]
+    start_time: Optional[str]
+    end_time: Optional[str]
+    subject: Optional[str]
+    topic: Optional[str]
+    priority: Optional[str]
+    completed: bool
+    comprehension_level: Optional[int]
+    notes: Optional[str]
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+        json_encoders = {
+            date: lambda v: v.strftime('%Y-%m-%d') if v else None,
+            time: lambda v: v.strftime('%H:%M:%S') if v else None,
+            datetime: lambda v: v.isoformat() if v else None,
+            UUID: lambda v: str(v)
+        }
+
+
+def make_rows(count: int) -> List[StudySession]:
+    now = datetime.utcnow()
+    user_id = uuid.uuid4()
+    return [
+        StudySession(id=uuid.uuid4(), user_id=user_id, topic_id=uuid.uuid4(), title=f"Session {i}",
+                     date=date(2025, 1, 1 + i % 28), start_time=time(9, i % 60), end_time=time(10, 30),
+                     subject="GATE CS", topic="Graphs", priority="high", completed=i % 2 == 0,
+                     comprehension_level=1 + i % 5, notes="Revise BFS/DFS", created_at=now, updated_at=now)
+        for i in range(count)
+    ]
+
+
+def build_apps(rows):
+    legacy = FastAPI()
+
+    @legacy.get("/sessions", response_model=List[LegacyStudySessionResponse])
+    def legacy_sessions():
+        return [
+            {
+                "id": session.id,
+                "user_id": session.user_id,
+                "topic_id": session.topic_id,
+                "title": session.title,
+                "date": session.date.strftime('%Y-%m-%d') if session.date else None,
+                "start_time": session.start_time.strftime('%H:%M:%S') if session.start_time else None,
+                "end_time": session.end_time.strftime('%H:%M:%S') if session.end_time else None,
+                "subject": session.subject,
+                "topic": session.topic,
+                "priority": session.priority,
+                "completed": session.completed,
+                "comprehension_level": session.comprehension_level,
+                "notes": session.notes,
+                "created_at": session.created_at,
+                "updated_at": session.updated_at
+            }
+            for session in rows
+        ]
+
+    current = FastAPI()
+
+    @current.get("/sessions", response_model=List[StudySessionResponse])
+    def current_sessions():
+        return rows
+
+    return legacy, current
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--iterations", type=int, default=30)
+    args = parser.parse_args()
+
+    legacy, current = build_apps(make_rows(args.rows))
+    results = []
+    for name, app in (("hand-built dicts", legacy), ("typed response_model", current)):
+        client = TestClient(app)
+        body = client.get("/sessions").content
+        samples = time_calls(lambda: client.get("/sessions"), args.iterations, warmup=3)
+        results.append({"handler": name, "rows": args.rows, "bytes": len(body), **summarize(samples)})
+    print_table(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# benchmarks/bench_startup.py
+"""
+Cold-start time of a worker: a fresh interpreter imports app.main and serves its
+first request (GET /api/health). Each run is a separate process, so nothing is
+shared between runs. Exits non-zero when the median exceeds --budget-ms.
+
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_startup --runs 10 --budget-ms 1500
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from benchmarks.common import print_table
+
+CHILD = r"""
+import json, time
+started = time.perf_counter()
+from app.main import app
+imported = time.perf_counter()
+from fastapi.testclient import TestClient
+with TestClient(app) as client:
+    response = client.get("/api/health")
+served = time.perf_counter()
+assert response.status_code == 200, response.text
+print(json.dumps({"import_ms": (imported - started) * 1000, "first_request_ms": (served - started) * 1000}))
+"""
+
+
+def run_once() -> dict:
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD], cwd=backend_dir, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=None, help="Fail if the median first-request time exceeds this")
+    args = parser.parse_args()
+
+    samples = [run_once() for _ in range(args.runs)]
+    rows = []
+    for key in ("import_ms", "first_request_ms"):
+        values = [sample[key] for sample in samples]
+        rows.append({"phase": key, "median": round(statistics.median(values), 1),
+                     "min": round(min(values), 1), "max": round(max(values), 1)})
+    print_table(rows)
+
+    median_first_request = rows[1]["median"]
+    if args.budget_ms is not None and median_first_request > args.budget_ms:
+        print(f"over budget: {median_first_request}ms > {args.budget_ms}ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+# benchmarks/bench_stats.py
+"""
+Latency of GET /api/study-plan/stats for a user with --sessions sessions: cold
+(cache cleared before every call, so the SQL aggregates run) and warm (cached; one
+watermark query checks the entry).
+
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_stats --sessions 5000
+"""
+import argparse
+
+from fastapi.testclient import TestClient
+
+from app.database import SessionLocal
+from app.main import app
+from app.utils.study_stats import stats_cache
+from benchmarks.bench_export import seed_sessions
+from benchmarks.common import create_benchmark_user, print_table, summarize, time_calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=5000)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        user, token = create_benchmark_user(db)
+        seed_sessions(db, user.id, args.sessions)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    with TestClient(app) as client:
+        def cold():
+            stats_cache.clear()
+            client.get("/api/study-plan/stats", headers=headers)
+
+        rows = [
+            {"cache": "cold", **summarize(time_calls(cold, args.iterations))},
+            {"cache": "warm", **summarize(time_calls(lambda: client.get("/api/study-plan/stats", headers=headers), args.iterations))},
+        ]
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
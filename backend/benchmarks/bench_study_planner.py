@@ -0,0 +1,69 @@
+# benchmarks/bench_study_planner.py
+"""
+Runtime of the study-plan generator (app.ml.study_planner) against problem size:
+topics to schedule times days until the exam. Covers everything POST
+/api/study-plan/generate does between loading topics and the bulk INSERT: weekly
+windows, subtracting existing sessions, cutting blocks and the greedy fill.
+No database is needed.
+
+    python -m benchmarks.bench_study_planner --topics 50 500 2000 --days 30 120 365
+"""
+import argparse
+import math
+import random
+import uuid
+from datetime import date, datetime, time, timedelta
+
+from app.ml.study_planner import PRIORITY_WEIGHTS, PlanTask, plan_sessions, split_into_blocks, weekly_windows
+from app.utils.timeslots import free_slots
+from benchmarks.common import print_table, summarize, time_calls
+
+SESSION_MINUTES = 60
+# Three hours on weekday evenings, eight on weekends
+AVAILABILITY = [(d, time(17), time(20)) for d in range(5)] + [(d, time(9), time(17)) for d in (5, 6)]
+
+
+def make_problem(topics: int, days: int, seed: int = 0):
+    rng = random.Random(seed)
+    first_day = date(2025, 1, 6)
+    last_day = first_day + timedelta(days=days - 1)
+    tasks = [
+        PlanTask(
+            uuid.uuid4(),
+            math.ceil(rng.uniform(0, 20)),
+            PRIORITY_WEIGHTS[rng.choice(list(PRIORITY_WEIGHTS))],
+            first_day + timedelta(days=rng.randrange(-7, days)) if rng.random() < 0.3 else None,
+        )
+        for _ in range(topics)
+    ]
+    # One existing session every evening
+    busy = [(datetime.combine(first_day + timedelta(days=d), time(18)), datetime.combine(first_day + timedelta(days=d), time(18, 45)))
+            for d in range(-1, days)]
+    return first_day, last_day, tasks, busy
+
+
+def generate(first_day, last_day, tasks, busy):
+    slots = free_slots(busy, weekly_windows(first_day, last_day, AVAILABILITY), timedelta(minutes=30))
+    return plan_sessions(tasks, split_into_blocks(slots, SESSION_MINUTES, 30))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--topics", type=int, nargs="+", default=[50, 500, 2000])
+    parser.add_argument("--days", type=int, nargs="+", default=[30, 120, 365])
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    rows = []
+    for topics in args.topics:
+        for days in args.days:
+            problem = make_problem(topics, days)
+            planned, unscheduled = generate(*problem)
+            row = {"topics": topics, "days": days, "sessions": len(planned), "unscheduled_topics": len(unscheduled)}
+            row.update(summarize(time_calls(lambda: generate(*problem), args.iterations, warmup=2)))
+            rows.append(row)
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# benchmarks/bench_train_revision_model.py
+"""
+Throughput and peak Python memory of the streaming revision model trainer
+(app/ml/train_revision_model.py) at several chunk sizes. Peak memory should stay
+flat as --topics grows; only the chunk size moves it.
+
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_train_revision_model --topics 1000000
+"""
+import argparse
+import time
+import tracemalloc
+
+from sqlalchemy import text
+
+from app.database import SessionLocal, engine
+from app.ml.train_revision_model import train_from_sessions
+from benchmarks.bench_recompute_schedule import SEED_SQL
+from benchmarks.common import print_table
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--topics", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=20_000)
+    parser.add_argument("--chunk-sizes", type=int, nargs="+", default=[5000, 50000])
+    parser.add_argument("--skip-seed", action="store_true")
+    args = parser.parse_args()
+
+    if engine.dialect.name != "postgresql":
+        raise SystemExit("this benchmark needs a Postgres DATABASE_URL")
+    if not args.skip_seed:
+        with engine.begin() as connection:
+            for statement in SEED_SQL:
+                connection.execute(text(statement), {"users": args.users, "topics": args.topics})
+
+    rows = []
+    for chunk_size in args.chunk_sizes:
+        tracemalloc.start()
+        started = time.perf_counter()
+        with SessionLocal() as db:
+            result = train_from_sessions(db, chunk_size=chunk_size)
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        rows.append({
+            "chunk_size": chunk_size,
+            "sessions": result["sessions"],
+            "examples": result["examples"],
+            "seconds": round(elapsed, 2),
+            "sessions_per_sec": round(result["sessions"] / elapsed),
+            "peak_mb": round(peak / 2**20, 1),
+        })
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# benchmarks/bench_write_roundtrips.py
+"""
+SQL statements per request (from the Server-Timing header that QueryStatsMiddleware
+adds) and latency for each write endpoint. Run it before and after a change to the
+write paths to see the round trips it saves.
+
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_write_roundtrips --requests 200
+"""
+import argparse
+import itertools
+import re
+import statistics
+import time
+import uuid
+from datetime import date, timedelta
+
+from fastapi.testclient import TestClient
+
+from app.database import SessionLocal
+from app.main import app
+from benchmarks.bench_async_db import seed_catalog
+from benchmarks.common import create_benchmark_user, print_table, summarize
+
+QUERY_COUNT = re.compile(r'desc="(\d+) queries"')
+
+QUESTION = {"question_text": "Q", "options": ["a", "b", "c", "d"], "correct_answer": 0, "marks": 1, "negative_marks": -0.33}
+
+
+def measure(client, make_request, requests: int):
+    """Issue `requests` calls built by make_request(i); returns (latency summary, median statements)."""
+    samples, counts = [], []
+    for i in range(requests):
+        method, url, kwargs = make_request(i)
+        started = time.perf_counter()
+        response = client.request(method, url, **kwargs)
+        samples.append(time.perf_counter() - started)
+        response.raise_for_status()
+        match = QUERY_COUNT.search(response.headers.get("server-timing", ""))
+        counts.append(int(match.group(1)) if match else -1)
+    return summarize(samples), statistics.median(counts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        _, token = create_benchmark_user(db)
+        seed_catalog(db, 1)
+    auth = {"Authorization": f"Bearer {token}"}
+    run = uuid.uuid4().hex[:8]
+    counter = itertools.count()
+
+    with TestClient(app) as client:
+        topic_id = client.post("/api/study-plan/topics", json={"title": "Benchmark topic", "subject": "GATE CS",
+                                                                "estimated_hours": 1000}, headers=auth).json()["id"]
+        session_id = client.post("/api/study-plan/sessions", json={"title": "Benchmark session"}, headers=auth).json()["session"]["id"]
+        quiz_id = client.get("/api/quizzes/", headers=auth).json()[0]["id"]
+        session_body = {"title": "Session", "date": "2025-01-01", "start_time": "09:00:00", "end_time": "10:30:00",
+                        "comprehension_level": 4, "completed": True}
+
+        endpoints = {
+            "POST /api/auth/register": lambda i: ("POST", "/api/auth/register", {"json": {
+                "name": "Bench", "email": f"bench-{run}-{next(counter)}@example.com", "password": "benchmark-password"}}),
+            "POST /api/study-plan/topics": lambda i: ("POST", "/api/study-plan/topics", {"headers": auth, "json": {
+                "title": f"Topic {i}", "subject": "GATE CS", "estimated_hours": 10}}),
+            "POST /api/study-plan/sessions?topic_id": lambda i: ("POST", f"/api/study-plan/sessions?topic_id={topic_id}",
+                                                                 {"headers": auth, "json": dict(session_body, date=(
+                                                                     date(2025, 1, 1) + timedelta(days=i)).isoformat())}),
+            "PUT /api/study-plan/sessions/{id}": lambda i: ("PUT", f"/api/study-plan/sessions/{session_id}",
+                                                            {"headers": auth, "json": dict(session_body, date="2024-12-31", title=f"Edit {i}")}),
+            "POST /api/quizzes/": lambda i: ("POST", "/api/quizzes/", {"headers": auth, "json": {
+                "title": f"Quiz {run}-{next(counter)}", "subject": "GATE CS", "topic": "Mock", "difficulty": "Medium",
+                "time_limit": 60, "questions": [QUESTION]}}),
+            "POST /api/quizzes/{id}/attempt": lambda i: ("POST", f"/api/quizzes/{quiz_id}/attempt",
+                                                         {"headers": auth, "json": {"status": "in-progress", "score": i % 100}}),
+            "POST /api/ai-tutor/ask (greeting)": lambda i: ("POST", "/api/ai-tutor/ask", {"headers": auth, "json": {"query": "hello"}}),
+        }
+
+        rows = []
+        for name, make_request in endpoints.items():
+            latency, statements = measure(client, make_request, args.requests)
+            rows.append({"endpoint": name, "statements": statements, **latency})
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# benchmarks/common.py
+"""
+Shared helpers for the benchmark scripts in this directory.
+
+Benchmarks run in-process against the FastAPI app through TestClient and use the
+database configured by DATABASE_URL, so point that at a disposable database.
+Run them from the backend directory, e.g. `python -m benchmarks.bench_auth_cache`.
+"""
+import math
+import statistics
+import time
+import uuid
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of `samples` (pct in 0-100)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Summarize latencies given in seconds as milliseconds."""
+    return {
+        "count": len(samples),
+        "mean_ms": round(statistics.fmean(samples) * 1000, 3) if samples else 0.0,
+        "p50_ms": round(percentile(samples, 50) * 1000, 3),
+        "p99_ms": round(percentile(samples, 99) * 1000, 3),
+    }
+
+
+def time_calls(fn: Callable[[], object], iterations: int, warmup: int = 20) -> List[float]:
+    """Call `fn` repeatedly and return the wall time of each timed call in seconds."""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def print_table(rows: Iterable[Dict[str, object]]) -> None:
+    rows = list(rows)
+    if not rows:
+        return
+    columns = list(rows[0].keys())
+    widths = {c: max(len(str(c)), *(len(str(r.get(c, ""))) for r in rows)) for c in columns}
+    print("  ".join(str(c).ljust(widths[c]) for c in columns))
+    for row in rows:
+        print("  ".join(str(row.get(c, "")).ljust(widths[c]) for c in columns))
+
+
+def create_benchmark_user(db, password: str = "benchmark-password"):
+    """Insert a throwaway user and return it together with a bearer token."""
+    from app.models.user import User
+    from app.utils.auth import create_access_token, hash_password
+
+    user = User(
+        id=uuid.uuid4(),
+        name="Benchmark User",
+        email=f"bench-{uuid.uuid4().hex[:12]}@example.com",
+        password_hash=hash_password(password),
+        created_at=datetime.utcnow(),
+        updated_at=datetime.utcnow(),
+    )
+    db.add(user)
+    db.commit()
+    token = create_access_token(data={"sub": str(user.id)})
+    return user, token